@@ -1,10 +1,17 @@
+import os
 from flask import Flask, render_template, request, redirect, abort
 from jinja2 import TemplateNotFound
-import os
 from app.converter import SlideConverter
+from app.workspace import DeckWorkspace, save_upload
+from app.cache import ConversionCache, DEFAULT_MAX_BYTES
 
 app = Flask(__name__) # this file is a host for flask application
 app.config['UPLOAD_FOLDER'] = 'uploads' # This sets a configuration key: where uploaded files will be saved.
+app.config['CONVERT_WORKERS'] = 1 # Processes used to convert the slides of one upload (1 = convert in the request thread)
+app.config['CACHE_MAX_BYTES'] = DEFAULT_MAX_BYTES # Converted decks kept on disk before the least recently used are evicted
+# TrueType font used to fit text into its box at conversion time. None looks for an installed Calibri;
+# if there is none (common on Linux servers), text is fitted by the viewer in the browser instead
+app.config['FIT_FONT_FILE'] = os.environ.get("REVEALIFY_FONT_FILE")
 
 @app.route("/")
 def home():
@@ -19,28 +26,51 @@ def upload():
     theme = request.form.get('theme', 'dracula')  # 🟢 Get selected theme (defaults to dracula)
     
     if file.filename.endswith(".pptx"): # uploaded file is a PowerPoint file
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], file.filename)
-        file.save(file_path) # This builds the full path to save the file and then saves it locally.
-        try:
-            # Run the converter on the uploaded PPTX and convert it to .html Reveal.js format
-            converter = SlideConverter(file_path)
-            converter.convert()
-            converter.save("slides.html")
-        except Exception as e:
-            print("❌ Conversion failed:", e)
-            return "Conversion failed", 500
+        # Saved as uploads/<sha256>.pptx — the hash of the upload bytes
+        content_hash, file_path = save_upload(file, app.config['UPLOAD_FOLDER'])
+        # The deck id combines the upload hash with the converter fingerprint, so the same
+        # deck converted by the same converter version always lands in the same folder
+        cache = ConversionCache(max_bytes=app.config['CACHE_MAX_BYTES'])
+        deck_id = ConversionCache.key(content_hash, SlideConverter.fingerprint(font_file=app.config['FIT_FONT_FILE']))
+
+        if cache.get(deck_id) is None: # ⬅️ Cache hit skips parsing/conversion entirely
+            workspace = cache.workspace(deck_id)
+            try:
+                # Run the converter on the uploaded PPTX and convert it to .html Reveal.js format,
+                # writing into this deck's own static/decks/<deck_id>/ folder.
+                # Slides unchanged since an earlier upload are reused from static/slides/
+                converter = SlideConverter(
+                    file_path, output_dir=workspace.path, slide_cache=cache.slide_cache,
+                    workers=app.config['CONVERT_WORKERS'], font_file=app.config['FIT_FONT_FILE']
+                )
+                converter.write("slides.html") # ⬅️ slides are written as they are converted
+            except Exception:
+                app.logger.exception("Conversion failed for %s", file_path)
+                cache.discard(deck_id)  # a half-written deck would never be evicted as in progress
+                return "Conversion failed", 500
+            cache.evict(keep=deck_id)
         
-        # Once slides are ready, redirect the user to /view route to see them.
-        return redirect(f"/view?theme={theme}")  # ⬅️ Include selected theme in the URL
+        # Once slides are ready, redirect the user to /view/<deck_id> route to see them.
+        return redirect(f"/view/{deck_id}?theme={theme}")  # ⬅️ Include selected theme in the URL
     return "Invalid file type", 400 # If the file isn’t a .pptx, send back an error.
 
 
-# This serves Reveal.js viewer (index.html with the slides.html loaded inside).
-@app.route("/view")
-def view():
+# This serves Reveal.js viewer (index.html with the deck's slides.html loaded inside).
+@app.route("/view/<deck_id>")
+def view(deck_id):
+    if not DeckWorkspace.is_valid_id(deck_id):
+        abort(404)
+    workspace = DeckWorkspace(deck_id)
+    if not workspace.is_converted():
+        abort(404)
     try:
         theme = request.args.get("theme", "dracula")  # ⬅️ Read the theme from the URL
-        return render_template("index.html", theme=theme)  # ← Reveal presentation viewer
+        # ← Reveal presentation viewer
+        # Decks with a manifest are loaded slide by slide, others as a single slides.html
+        manifest_url = workspace.manifest_url if workspace.has_manifest() else None
+        return render_template(
+            "index.html", theme=theme, slides_url=workspace.slides_url, manifest_url=manifest_url
+        )
     except TemplateNotFound:
         return "<h1>404 — Reveal view not found.</h1>", 404
 
@@ -0,0 +1,303 @@
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import time
+from collections import Counter
+
+from .workspace import DECKS_DIR, MEDIA_DIR, SLIDES_DIR, DeckWorkspace, atomic_write, touch
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GiB of converted decks
+# A cached slide used this recently is never swept, even if no deck references it yet:
+# a conversion running in another worker may be about to list it in its slides.json
+SWEEP_GRACE_SECONDS = 60
+# A deck directory without slides.html untouched for this long is a conversion that died
+# (worker killed, crash before cleanup), not one in progress
+STALE_CONVERSION_SECONDS = 60 * 60
+# evict() walks the whole store, so it runs at most this often across all workers;
+# the store can overshoot max_bytes by what is converted in between
+EVICT_INTERVAL_SECONDS = 60
+
+
+class SlideCache:
+    """
+    Content-addressed store of rendered slides, shared by all decks.
+
+    static/slides/<fingerprint>/ holds slide.html (the slide's <section>) and media.json,
+    the names of the images it references. The images themselves are shared by all slides
+    in media_dir, one file per distinct image (see PptxParser). The fingerprint comes from
+    PptxParser.get_slide_fingerprint, so a re-uploaded deck with one edited slide only has
+    that one slide to convert.
+    """
+    def __init__(self, root=SLIDES_DIR, media_dir=MEDIA_DIR):
+        self.root = root
+        self.media_dir = media_dir
+
+    def path(self, fingerprint):
+        return posixpath.join(self.root, fingerprint)
+
+    def html_path(self, fingerprint):
+        return posixpath.join(self.path(fingerprint), "slide.html")
+
+    def media_path(self, fingerprint):
+        return posixpath.join(self.path(fingerprint), "media.json")
+
+    def contains(self, fingerprint):
+        """
+        Check whether a slide is cached, marking it as recently used if so.
+        """
+        return touch(self.html_path(fingerprint))
+
+    def get(self, fingerprint):
+        """
+        Return the cached HTML of a slide, or None if it has not been converted yet.
+        """
+        html_path = self.html_path(fingerprint)
+        try:
+            with open(html_path, "r", encoding="utf-8") as f:
+                html = f.read()
+            os.utime(html_path)  # mark as recently used
+        except OSError:
+            return None
+        return html
+
+    def put(self, fingerprint, html, image_paths=()):
+        # images are listed before the slide is written, so the cache never sweeps one it uses
+        media = sorted({posixpath.basename(path) for path in image_paths})
+        atomic_write(self.media_path(fingerprint), json.dumps(media), mode="w", encoding="utf-8")
+        # written last, once the slide's images are in place
+        atomic_write(self.html_path(fingerprint), html, mode="w", encoding="utf-8")
+
+    def media(self, fingerprint):
+        """
+        Names of the images in media_dir the cached slide references.
+        """
+        try:
+            with open(self.media_path(fingerprint), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+
+class ConversionCache:
+    """
+    On-disk cache of converted decks, one DeckWorkspace per entry.
+
+    An entry is keyed by the SHA-256 of the uploaded .pptx *and* the converter
+    fingerprint, so re-uploading the same deck is served straight from disk while
+    a new converter version (or different options) never serves stale HTML.
+
+    The store is bounded by max_bytes; when it grows past that, the least recently
+    used decks are removed. "Used" is tracked through the mtime of slides.html,
+    which is bumped on every hit. Cached slides are counted against the same budget
+    and removed once no remaining deck lists them in its slides.json; shared images
+    likewise once no remaining slide lists them in its media.json. A deck whose
+    conversion failed is discarded, or aged out after STALE_CONVERSION_SECONDS if
+    its worker died before it could be.
+    """
+    def __init__(self, root=DECKS_DIR, max_bytes=DEFAULT_MAX_BYTES, slide_cache=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.slide_cache = slide_cache or SlideCache()
+
+    @staticmethod
+    def key(content_hash, fingerprint):
+        """
+        The cache key doubles as the deck id, so it is itself a SHA-256 hex digest.
+        """
+        return hashlib.sha256(f"{content_hash}:{fingerprint}".encode()).hexdigest()
+
+    def workspace(self, key):
+        return DeckWorkspace(key, self.root)
+
+    def get(self, key):
+        """
+        Return the DeckWorkspace for key if it is already converted, else None.
+        """
+        workspace = self.workspace(key)
+        if not workspace.is_converted():
+            return None
+        try:
+            os.utime(workspace.slides_path)  # mark as most recently used
+        except OSError:
+            # evicted by another worker between the check and the touch
+            return None
+        return workspace
+
+    def discard(self, key):
+        """
+        Remove the deck for key, e.g. what a failed conversion left behind.
+        """
+        shutil.rmtree(self.workspace(key).path, ignore_errors=True)
+
+    def evict(self, keep=None):
+        """
+        Remove least recently used decks until the store fits in max_bytes.
+
+        Decks still being converted (no slides.html yet) are neither counted as
+        evictable nor removed, unless stale; keep protects the entry that was just
+        written. Does nothing if the store was checked less than
+        EVICT_INTERVAL_SECONDS ago.
+        """
+        if not self._claim_evict_run():
+            return
+        # Images are listed before slides and slides before decks: anything that exists
+        # now was listed by whatever references it before it was written, so its
+        # reference is seen below
+        media = dict(self._iter_media())  # file name -> (last_used, size)
+        slides = dict(self._iter_slides())  # fingerprint -> (last_used, size, media names)
+        decks = list(self._iter_decks())
+
+        refcount = Counter()
+        media_refcount = Counter()
+        total = sum(size for _, size in media.values())
+        for _, size, names in slides.values():
+            total += size
+            media_refcount.update(set(names))
+        for _, _, size, fingerprints, _ in decks:
+            total += size
+            refcount.update(set(fingerprints))
+
+        sweep_before = time.time() - SWEEP_GRACE_SECONDS
+
+        def sweep_media(name):
+            nonlocal total
+            last_used, size = media.pop(name)
+            if last_used < sweep_before:
+                try:
+                    os.remove(posixpath.join(self.slide_cache.media_dir, name))
+                except OSError:
+                    return
+                total -= size
+
+        def sweep(fingerprint):
+            nonlocal total
+            last_used, size, names = slides.pop(fingerprint)
+            if last_used < sweep_before:
+                shutil.rmtree(self.slide_cache.path(fingerprint), ignore_errors=True)
+                total -= size
+                for name in set(names):
+                    media_refcount[name] -= 1
+                    if media_refcount[name] == 0 and name in media:
+                        sweep_media(name)
+
+        for fingerprint in [fp for fp in slides if refcount[fp] == 0]:
+            sweep(fingerprint)
+        for name in [name for name in media if media_refcount[name] == 0]:
+            sweep_media(name)
+
+        def remove(key, size, fingerprints):
+            nonlocal total
+            self.discard(key)
+            total -= size
+            for fingerprint in set(fingerprints):
+                refcount[fingerprint] -= 1
+                if refcount[fingerprint] == 0 and fingerprint in slides:
+                    sweep(fingerprint)
+
+        stale_before = time.time() - STALE_CONVERSION_SECONDS
+        for last_used, key, size, fingerprints, converted in decks:
+            if not converted and last_used < stale_before and key != keep:
+                remove(key, size, fingerprints)
+
+        evictable = sorted(deck[:4] for deck in decks if deck[4] and deck[1] != keep)
+        for _, key, size, fingerprints in evictable:  # oldest first
+            if total <= self.max_bytes:
+                break
+            remove(key, size, fingerprints)
+
+    def _claim_evict_run(self):
+        """
+        Whether this call gets to walk the store: true at most once per
+        EVICT_INTERVAL_SECONDS, tracked through the mtime of a stamp file in root.
+        """
+        stamp_path = posixpath.join(self.root, ".evicted")
+        try:
+            if time.time() - os.path.getmtime(stamp_path) < EVICT_INTERVAL_SECONDS:
+                return False
+        except OSError:
+            pass
+        os.makedirs(self.root, exist_ok=True)
+        with open(stamp_path, "a"):
+            pass
+        os.utime(stamp_path)
+        return True
+
+    def _iter_decks(self):
+        """
+        Yield (last_used, key, size_in_bytes, slide fingerprints, converted) for every
+        deck in the store; while a deck is not converted (no slides.html), last_used is
+        the mtime of the newest file or directory in it, i.e. when its conversion last
+        made progress.
+        """
+        for name in self._listdir(self.root):
+            if not DeckWorkspace.is_valid_id(name):
+                continue
+            workspace = self.workspace(name)
+            size, newest = ConversionCache._dir_stat(workspace.path)
+            try:
+                last_used, converted = os.path.getmtime(workspace.slides_path), True
+            except OSError:
+                last_used, converted = newest, False
+            try:
+                with open(workspace.fingerprints_path, "r", encoding="utf-8") as f:
+                    fingerprints = json.load(f)
+            except (OSError, ValueError):
+                fingerprints = []
+            yield last_used, name, size, fingerprints, converted
+
+    def _iter_slides(self):
+        """
+        Yield (fingerprint, (last_used, size_in_bytes, image names)) for every fully
+        written slide.
+        """
+        for name in self._listdir(self.slide_cache.root):
+            try:
+                last_used = os.path.getmtime(self.slide_cache.html_path(name))
+            except OSError:
+                continue
+            size, _ = ConversionCache._dir_stat(self.slide_cache.path(name))
+            yield name, (last_used, size, self.slide_cache.media(name))
+
+    def _iter_media(self):
+        """
+        Yield (file name, (last_used, size_in_bytes)) for every shared image, leaving out
+        images still being written (*.part).
+        """
+        for name in self._listdir(self.slide_cache.media_dir):
+            if name.endswith(".part"):
+                continue
+            try:
+                stat = os.stat(posixpath.join(self.slide_cache.media_dir, name))
+            except OSError:
+                continue
+            yield name, (stat.st_mtime, stat.st_size)
+
+    @staticmethod
+    def _listdir(path):
+        try:
+            return os.listdir(path)
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _dir_stat(path):
+        """
+        Return (total size of the files under path, mtime of the newest file or
+        directory there, 0 if there is none).
+        """
+        size, newest = 0, 0
+        for dirpath, _, filenames in os.walk(path):
+            try:
+                newest = max(newest, os.path.getmtime(dirpath))
+            except OSError:
+                pass
+            for filename in filenames:
+                try:
+                    stat = os.stat(os.path.join(dirpath, filename))
+                except OSError:
+                    continue
+                size += stat.st_size
+                newest = max(newest, stat.st_mtime)
+        return size, newest
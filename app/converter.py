@@ -1,25 +1,128 @@
+import hashlib
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+import pptx
 from .slide import (
-    HTMLSlide, TitleShape,TextShape, 
+    HTMLSlide, HTMLFragment, TitleShape,TextShape, 
     ParagraphContent, BulletTreeContent, BulletNode, 
     TableContent, ImageContent 
 )
-from .pptx_parser import PptxParser
+from .images import MODERN_FORMATS, ImagePipeline
+from .text import find_font_file
+from .xml_parser import XmlParser
+from .workspace import atomic_open, atomic_write
+
+# Bump whenever a change to the parser/converter/slide classes changes the generated HTML,
+# so decks converted by an older version are not served from the conversion cache
+CONVERTER_VERSION = "8"
 
 
 class SlideConverter:
 
-    def __init__(self, pptx_path):
+    def __init__(self, pptx_path, output_dir="static", transition="fade", slide_cache=None,
+                 workers=1, font_file=None):
+        # output_dir receives slides.html and an images/ folder
         self.pptx_path = pptx_path
+        self.output_dir = output_dir
+        self.transition = transition
+        # Optional SlideCache: unchanged slides are reused instead of converted again
+        self.slide_cache = slide_cache
+        # workers > 1 converts slides in that many processes, output is identical to serial
+        self.workers = workers
+        # font used to fit text into its box, see find_font_file
+        self.font_file = font_file
+        # resized/re-encoded copies of the pictures, made next to the extracted images
+        self.image_pipeline = ImagePipeline()
         self.slides = []
+        self.fingerprints = []
+
+    @staticmethod
+    def fingerprint(transition="fade", font_file=None):
+        """
+        Identify everything besides the .pptx itself that affects the output:
+        converter version, python-pptx version and conversion options.
+        """
+        options = {
+            "transition": transition,
+            "font_file": find_font_file(font_file),
+            "image_formats": MODERN_FORMATS,  # depends on the codecs Pillow was built with
+        }
+        data = json.dumps([CONVERTER_VERSION, pptx.__version__, options], sort_keys=True)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
     def convert(self): 
-        parser = PptxParser(self.pptx_path)
-        for i in range(parser.get_slide_count()):
-            slide_shapes = parser.get_slide_shapes(i)
-            slide = self.convert_slide(slide_shapes)
-            self.slides.append(slide)
-       
+        # Keeps every slide in memory until save(); write() converts and saves slide by slide
+        self.slides = list(self.iter_slides())
+
+    def iter_slides(self):
+        """
+        Yield the deck's slides in order, each one converted only when it is reached.
+        """
+        parser = XmlParser(self.pptx_path, image_dir=f"{self.output_dir}/images", font_file=self.font_file)
+        try:
+            yield from self._iter_slides(parser)
+        finally:
+            parser.close()
+            self.image_pipeline.close()
+
+    def _iter_slides(self, parser):
+        if self.slide_cache is None:
+            yield from self._convert_slides(parser, [(i, None) for i in range(parser.get_slide_count())])
+            return
+
+        salt = SlideConverter.fingerprint(self.transition, self.font_file)
+        self.fingerprints = [
+            parser.get_slide_fingerprint(i, salt) for i in range(parser.get_slide_count())
+        ]
+        # Listed before any slide is written, so the cache never sweeps a slide this deck uses
+        atomic_write(
+            os.path.join(self.output_dir, "slides.json"),
+            json.dumps(self.fingerprints), mode="w", encoding="utf-8"
+        )
+        # Only new/edited slides get converted, images go to the store shared by all slides
+        media_dir = self.slide_cache.media_dir
+        jobs = [
+            (i, media_dir)
+            for i, fingerprint in enumerate(self.fingerprints)
+            if not self.slide_cache.contains(fingerprint)
+        ]
+        pending = {i for i, _ in jobs}
+        converted = self._convert_slides(parser, jobs)
+
+        for i, fingerprint in enumerate(self.fingerprints):
+            if i in pending:
+                slide = next(converted)
+            else:
+                html = self.slide_cache.get(fingerprint)
+                if html is not None:
+                    yield HTMLFragment(html)
+                    continue
+                # removed from the cache since it was checked, convert it after all
+                slide = self.convert_slide(parser.get_slide_shapes(i, image_dir=media_dir))
+            html = slide.to_html()
+            self.slide_cache.put(fingerprint, html, slide.image_paths())
+            yield HTMLFragment(html)
+
+    def _convert_slides(self, parser, jobs):
+        """
+        Convert each (slide_index, image_dir) job, yielding the slides in job order.
+
+        With workers > 1 the jobs are spread over a process pool; each worker opens the
+        .pptx once (see _init_worker) and sends back the rendered HTML of its slides.
+        """
+        if self.workers <= 1 or len(jobs) <= 1:
+            for i, image_dir in jobs:
+                yield self.convert_slide(parser.get_slide_shapes(i, image_dir=image_dir))
+            return
+
+        workers = min(self.workers, len(jobs))
+        initargs = (self.pptx_path, parser.image_dir, self.transition, parser.font_file)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as executor:
+            # a few chunks per worker keeps IPC low while still balancing heavy slides
+            chunksize = max(1, len(jobs) // (workers * 4))
+            for html, image_paths in executor.map(_convert_job, jobs, chunksize=chunksize):
+                yield HTMLFragment(html, image_paths)
 
     def convert_slide(self, shapes_data):
         """
@@ -29,6 +132,13 @@ class SlideConverter:
         title_shapes = []
         contents = []
 
+        # the variants of all the slide's pictures are encoded in parallel
+        images = [shape for shape in shapes_data if shape["type"] == "image"]
+        for shape in images:
+            shape.update(self.image_pipeline.plan(shape))
+        for shape in images:
+            self.image_pipeline.finish(shape)
+
         for shape in shapes_data:
             
             
@@ -98,7 +208,7 @@ class SlideConverter:
                 contents.append(TextShape(shape, textShape_content))
 
 
-        slide = HTMLSlide(title_shapes, transition="fade")
+        slide = HTMLSlide(title_shapes, transition=self.transition)
         for shape in contents:
             slide.add_shape(shape)
 
@@ -111,10 +221,56 @@ class SlideConverter:
         Write all converted slides into a Reveal.js-compatible HTML file.
         """
         try:
-            os.makedirs("static", exist_ok=True)
-            output_path = os.path.join("static", output_file)
-            with open(output_path, "w", encoding="utf-8") as f:
+            with atomic_open(os.path.join(self.output_dir, output_file), "w", encoding="utf-8") as out:
                 for slide in self.slides:
-                    f.write(slide.to_html())
+                    slide.write_html(out)
         except Exception as e:
-            raise RuntimeError(f"Failed to write HTML to slides.html: {e}")
+            raise RuntimeError(f"Failed to write HTML to {output_file}: {e}")
+
+    def write(self, output_file="slides.html"):
+        """
+        Convert the deck straight into a Reveal.js-compatible HTML file. Each slide is
+        written as soon as it is converted and then dropped, so memory use does not
+        grow with the number of slides (unlike convert() + save()).
+        """
+        output_path = os.path.join(self.output_dir, output_file)
+        with atomic_open(output_path, "w", encoding="utf-8") as out:
+            for slide in self.iter_slides():
+                slide.write_html(out)
+            if self.slide_cache is not None:
+                # every slide is now a cached fragment of its own; the manifest is in place
+                # before output_file, so a deck that looks converted always has one
+                self.save_manifest()
+
+    def save_manifest(self, manifest_file="manifest.json"):
+        """
+        Write a JSON manifest listing the URL of every slide's HTML fragment, in order,
+        so the viewer can fetch the first slides without downloading the whole deck.
+        Only available when converting with a slide cache.
+        """
+        manifest = {
+            "slides": ["/" + self.slide_cache.html_path(fingerprint) for fingerprint in self.fingerprints],
+        }
+        atomic_write(
+            os.path.join(self.output_dir, manifest_file),
+            json.dumps(manifest), mode="w", encoding="utf-8"
+        )
+
+
+# State of a process pool worker, set once by _init_worker: (SlideConverter, XmlParser)
+_worker = None
+
+
+def _init_worker(pptx_path, image_dir, transition, font_file):
+    global _worker
+    _worker = (
+        SlideConverter(pptx_path, transition=transition),
+        XmlParser(pptx_path, image_dir=image_dir, font_file=font_file),
+    )
+
+
+def _convert_job(job):
+    slide_index, image_dir = job
+    converter, parser = _worker
+    slide = converter.convert_slide(parser.get_slide_shapes(slide_index, image_dir=image_dir))
+    return slide.to_html(), slide.image_paths()
@@ -0,0 +1,91 @@
+import numpy as np
+from pptx.oxml.ns import qn
+
+# Slide size (EMU) when p:sldSz is missing, it is optional: PowerPoint's 4:3 default, 10" x 7.5"
+DEFAULT_SLIDE_SIZE = (9144000, 6858000)
+# Transform of a shape's coordinates into slide coordinates: (scale_x, scale_y, offset_x, offset_y).
+# Shapes directly on the slide are already in slide coordinates
+IDENTITY = (1.0, 1.0, 0.0, 0.0)
+GEOMETRY_FIELDS = ("x", "y", "cx", "cy", "x_percent", "y_percent", "width_percent", "height_percent")
+
+
+class SlideGeometry:
+    """
+    Places shapes on the slide: turns their EMU position and size into the percentages
+    of the slide width/height the HTML is laid out in.
+
+    Built once per deck from the real slide size (p:sldSz in ppt/presentation.xml, so
+    16:9 and custom sizes are placed right) with the EMU -> percent factors worked out
+    up front, and shared by the text, table and image shapes of every slide.
+
+    All the shapes of a slide are placed in one NumPy pass (see place_shapes), which
+    keeps slides made of thousands of shapes (Gantt charts, org charts) cheap.
+    """
+    def __init__(self, slide_width, slide_height):
+        self.slide_width = slide_width  # in EMUs
+        self.slide_height = slide_height  # in EMUs
+        self._x_factor = 100 / slide_width
+        self._y_factor = 100 / slide_height
+
+    @classmethod
+    def from_presentation(cls, presentation_xml):
+        """
+        Geometry of the deck whose ppt/presentation.xml root element is presentation_xml.
+        """
+        sldSz = presentation_xml.find(qn("p:sldSz"))
+        if sldSz is None:
+            return cls(*DEFAULT_SLIDE_SIZE)
+        return cls(int(sldSz.get("cx")), int(sldSz.get("cy")))
+
+    def place_shapes(self, boxes, transforms):
+        """
+        Geometry fields of each shape of a slide (GEOMETRY_FIELDS, in that order):
+        its position and size on the slide in EMU, and as percentages with the
+        position kept on the slide and the size no larger than it.
+
+        boxes holds the (x, y, cx, cy) of each shape as set in its XML, transforms
+        the transform of each one into slide coordinates (IDENTITY or group_transform()).
+        """
+        if not boxes:
+            return []
+        boxes = np.array(boxes, dtype=np.float64)
+        scale_x, scale_y, offset_x, offset_y = np.array(transforms, dtype=np.float64).T
+        emu = np.rint(np.column_stack((
+            boxes[:, 0] * scale_x + offset_x,
+            boxes[:, 1] * scale_y + offset_y,
+            boxes[:, 2] * scale_x,
+            boxes[:, 3] * scale_y,
+        ))).astype(np.int64)
+        percent = emu * np.array((self._x_factor, self._y_factor, self._x_factor, self._y_factor))
+        np.maximum(percent[:, :2], 0, out=percent[:, :2])
+        np.minimum(percent[:, 2:], 100, out=percent[:, 2:])
+        return [
+            dict(zip(GEOMETRY_FIELDS, shape_emu + shape_percent))
+            for shape_emu, shape_percent in zip(emu.tolist(), percent.tolist())
+        ]
+
+
+def group_transform(parent, xfrm):
+    """
+    Transform of the shapes inside a group. Their coordinates are relative to the
+    group's child extents (a:chOff/a:chExt of its a:xfrm), which are stretched onto the
+    group's own box (a:off/a:ext) and then placed by parent, the transform of the
+    group itself (IDENTITY for a group directly on the slide).
+    """
+    if xfrm is None:
+        return parent
+    off, ext, chOff, chExt = (xfrm.find(qn(tag)) for tag in ("a:off", "a:ext", "a:chOff", "a:chExt"))
+    if off is None or ext is None or chOff is None or chExt is None:
+        return parent
+    ch_cx, ch_cy = int(chExt.get("cx")), int(chExt.get("cy"))
+    scale_x = int(ext.get("cx")) / ch_cx if ch_cx else 1.0
+    scale_y = int(ext.get("cy")) / ch_cy if ch_cy else 1.0
+    offset_x = int(off.get("x")) - int(chOff.get("x")) * scale_x
+    offset_y = int(off.get("y")) - int(chOff.get("y")) * scale_y
+    parent_scale_x, parent_scale_y, parent_offset_x, parent_offset_y = parent
+    return (
+        parent_scale_x * scale_x,
+        parent_scale_y * scale_y,
+        parent_scale_x * offset_x + parent_offset_x,
+        parent_scale_y * offset_y + parent_offset_y,
+    )
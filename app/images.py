@@ -0,0 +1,196 @@
+import math
+import posixpath
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, features
+
+from .workspace import atomic_open, save_content_addressed, touch
+
+# Width (CSS px) of the viewport variants are sized for; pictures are described by their share
+# of the slide width, so a picture filling 30% of the slide needs about 30% of this
+VIEWPORT_WIDTH_PX = 1356
+# Variants are made for standard and high-DPI screens
+PIXEL_DENSITIES = (1, 2)
+# Formats browsers show as they are; others (TIFF, BMP, ...) are served as a converted PNG/JPEG
+WEB_EXTS = {"png", "jpg", "jpeg", "gif", "svg", "webp", "avif"}
+# Never resized or re-encoded: vector images and (possibly animated) GIFs
+PASSTHROUGH_EXTS = {"svg", "gif"}
+# Modern formats offered through <source>, best first, when Pillow can write them
+MODERN_FORMATS = [fmt for fmt in ("AVIF", "WEBP") if features.check(fmt.lower())]
+MIME_TYPES = {"AVIF": "image/avif", "WEBP": "image/webp", "JPEG": "image/jpeg", "PNG": "image/png"}
+FORMAT_EXTS = {"AVIF": "avif", "WEBP": "webp", "JPEG": "jpg", "PNG": "png"}
+SAVE_OPTIONS = {
+    "AVIF": {"quality": 55, "speed": 8},
+    "WEBP": {"quality": 80, "method": 4},
+    "JPEG": {"quality": 82, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+}
+IMAGE_WORKERS = 4  # threads encoding variants, Pillow releases the GIL while it works
+
+
+class ImageExtractor:
+    """
+    Copies the images of one .pptx into image directories, shared by both parsers.
+
+    Each distinct image is written once as <sha256>.<ext>, however many pictures (or
+    decks) show it, and its bytes are streamed straight out of the .pptx instead of
+    being read into memory.
+    """
+    def __init__(self, pptx_path):
+        self.pptx_path = pptx_path
+        self._zip = None  # the .pptx opened as a zip, on the first image written
+        self._images = {}  # (partname, image_dir) -> image fields of the shape dict
+
+    def extract(self, partname, image_dir, digest=None):
+        """
+        Write the image part partname to image_dir and return its fields of the shape
+        dict: image_path, image_ext, image_width_px, image_height_px. digest is the
+        SHA-256 of the part when the caller already has it (the slide fingerprint
+        hashes every image), which lets an image written before be found by name.
+        """
+        key = (partname, image_dir)
+        if key in self._images:
+            return self._images[key]
+
+        ext = partname.ext.lower()
+        image_path = digest and posixpath.join(image_dir, f"{digest.hex()}.{ext}")
+        if not (image_path and touch(image_path)):
+            if self._zip is None:
+                self._zip = zipfile.ZipFile(self.pptx_path)
+            with self._zip.open(partname.membername) as src:
+                _, image_path = save_content_addressed(src, image_dir, ext)
+
+        try:
+            with Image.open(image_path) as im:  # reads the header only
+                width_px, height_px = im.size
+        except (OSError, SyntaxError, ValueError):
+            width_px = height_px = None  # e.g. SVG
+
+        self._images[key] = {
+            "image_path": image_path,
+            "image_ext": ext,
+            "image_width_px": width_px,
+            "image_height_px": height_px,
+        }
+        return self._images[key]
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+
+class ImagePipeline:
+    """
+    Makes web-optimized variants of the images ImageExtractor writes.
+
+    Each picture gets resized copies matching its on-slide width (see PIXEL_DENSITIES)
+    in AVIF/WebP, offered through <picture> sources, plus JPEG/PNG copies for browsers
+    without them. Formats browsers cannot show are converted. Variants sit next to the
+    original, named <sha256>.<width>w.<ext> after it, so like the originals they are
+    made once and shared by every slide and deck showing the image.
+
+    Encoding runs in a thread pool: plan() starts the work for a picture and returns
+    the fields ImageContent renders, finish() waits for it.
+    """
+    def __init__(self, workers=IMAGE_WORKERS):
+        self._executor = None
+        self._workers = workers
+        self._jobs = {}  # variant path -> Future writing it
+
+    def plan(self, shape_dict):
+        """
+        Return the image_src/image_srcset/image_sources fields for a picture shape
+        dict, starting the jobs that write the files they reference.
+        """
+        image_path = shape_dict["image_path"]
+        ext = shape_dict["image_ext"]
+        fields = {"image_src": image_path, "image_srcset": [], "image_sources": []}
+        if ext in PASSTHROUGH_EXTS:
+            return fields
+        try:
+            with Image.open(image_path) as im:
+                native_width = im.size[0]
+                has_alpha = im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info
+                if ext not in WEB_EXTS:
+                    im.load()  # EMF/WMF only decode on Windows
+        except (OSError, SyntaxError, ValueError):
+            return fields  # served as it is
+
+        stem = posixpath.splitext(image_path)[0]
+        fallback_format = "PNG" if has_alpha else "JPEG"
+        if ext not in WEB_EXTS:
+            fields["image_src"] = self._variant(image_path, f"{stem}.{FORMAT_EXTS[fallback_format]}",
+                                                native_width, fallback_format)
+
+        widths = _variant_widths(shape_dict["width_percent"], native_width)
+        for fmt in MODERN_FORMATS:
+            srcset = [
+                (self._variant(image_path, f"{stem}.{width}w.{FORMAT_EXTS[fmt]}", width, fmt), width)
+                for width in widths
+            ]
+            fields["image_sources"].append({"type": MIME_TYPES[fmt], "srcset": srcset})
+        fields["image_srcset"] = [
+            (self._variant(image_path, f"{stem}.{width}w.{FORMAT_EXTS[fallback_format]}",
+                           width, fallback_format), width)
+            for width in widths if width < native_width
+        ]
+        if fields["image_srcset"]:
+            # the full-size image is the largest candidate
+            fields["image_srcset"].append((fields["image_src"], native_width))
+        return fields
+
+    def finish(self, shape_dict):
+        """
+        Wait for the variants of a planned picture shape dict, dropping from it any
+        that failed to encode (the original is always there to fall back on).
+        """
+        def written(path):
+            job = self._jobs.get(path)
+            return job is None or job.exception() is None
+
+        if not written(shape_dict["image_src"]):
+            shape_dict["image_src"] = shape_dict["image_path"]
+        shape_dict["image_srcset"] = [(path, w) for path, w in shape_dict["image_srcset"] if written(path)]
+        for source in shape_dict["image_sources"]:
+            source["srcset"] = [(path, w) for path, w in source["srcset"] if written(path)]
+        shape_dict["image_sources"] = [source for source in shape_dict["image_sources"] if source["srcset"]]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _variant(self, image_path, variant_path, width, fmt):
+        if variant_path not in self._jobs and not touch(variant_path):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._workers)
+            self._jobs[variant_path] = self._executor.submit(_encode, image_path, variant_path, width, fmt)
+        return variant_path
+
+
+def _variant_widths(width_percent, native_width):
+    """
+    Pixel widths to make variants at: the picture's displayed width at each density,
+    rounded up to a multiple of 16 so near-identical sizes share files, never wider
+    than the image itself.
+    """
+    display_width = max(width_percent, 1) / 100 * VIEWPORT_WIDTH_PX
+    widths = {min(native_width, 16 * math.ceil(display_width * density / 16)) for density in PIXEL_DENSITIES}
+    return sorted(widths)
+
+
+def _encode(image_path, variant_path, width, fmt):
+    with Image.open(image_path) as im:
+        height = max(1, round(im.size[1] * width / im.size[0]))
+        if im.format == "JPEG":
+            im.draft("RGB", (width, height))  # let libjpeg decode at a reduced scale
+        if fmt == "JPEG":
+            im = im.convert("RGB")
+        elif im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if "transparency" in im.info or "A" in im.mode else "RGB")
+        if im.size[0] != width:
+            im = im.resize((width, height), Image.LANCZOS)
+        with atomic_open(variant_path) as f:
+            im.save(f, fmt, **SAVE_OPTIONS[fmt])
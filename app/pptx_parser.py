@@ -1,19 +1,31 @@
-import os
+import hashlib
 from pptx import Presentation
 from pptx.oxml.ns import qn
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.enum.text import PP_ALIGN
-
-#EMU_PER_SLIDE_WIDTH = 9144000
-#EMU_PER_SLIDE_HEIGHT = 6858000
-
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from .geometry import DEFAULT_SLIDE_SIZE, IDENTITY, SlideGeometry, group_transform
+from .images import ImageExtractor
+from .text import MAX_FONT_PT, find_font_file, fit_text_px, pt_to_px
 
 class PptxParser:
-    def __init__(self, pptx_path):
-        self.prs = Presentation(pptx_path)
-        self.slide_width = self.prs.slide_width  # in EMUs
-        self.slide_height = self.prs.slide_height  # in EMUs
+    def __init__(self, pptx_path, image_dir="static/images", font_file=None):
+        # image_dir is relative to the app root and doubles as the image URL path
+        self.image_dir = image_dir
+        # TrueType font used to measure text when fitting it into its box (None: no fitting)
+        self.font_file = find_font_file(font_file)
+        self.pptx_path = pptx_path
+        # read-only: parts and their rels are read when a slide gets to them, nothing is kept for saving
+        self.prs = Presentation(pptx_path, read_only=True)
+        # python-pptx reads p:sldSz once, None when the deck leaves it out
+        self.geometry = SlideGeometry(
+            self.prs.slide_width or DEFAULT_SLIDE_SIZE[0], self.prs.slide_height or DEFAULT_SLIDE_SIZE[1]
+        )
+        self.slide_width = self.geometry.slide_width  # in EMUs
+        self.slide_height = self.geometry.slide_height  # in EMUs
+        self._part_digests = {}  # partname -> SHA-256 digest of the part blob
+        self.images = ImageExtractor(pptx_path)
 
     def get_slide_count(self):
         if self.prs is not None:
@@ -21,6 +33,12 @@ class PptxParser:
         else: 
             raise RuntimeError("PptxParser Class: No PowerPoint File Has Been Initialized Yet!")
 
+    def close(self):
+        """
+        Close the .pptx the images are extracted from; python-pptx does not keep it open.
+        """
+        self.images.close()
+
     def _get_bullet_type(self, paragraph):
         p_xml = paragraph._element
         pPr = p_xml.find(qn('a:pPr'))
@@ -35,16 +53,52 @@ class PptxParser:
 
         return "bullet"
 
-    def get_slide_shapes(self, slide_index):
-        slide = self.prs.slides[slide_index]
-        shapes = []
+    def get_slide_fingerprint(self, slide_index, salt=""):
+        """
+        SHA-256 over everything the HTML of one slide is derived from: the slide XML,
+        the blobs of its related parts (images, layout -> master) and the slide size.
+
+        The slide's position in the deck is deliberately left out, so an unchanged slide
+        keeps its fingerprint when slides before it are added or removed.
+        salt lets the caller mix in the converter version/options.
+        """
+        slide_part = self._slide_part(slide_index)
+        sha256 = hashlib.sha256(f"{salt}:{self.slide_width}x{self.slide_height}".encode())
+        sha256.update(self._part_digest(slide_part))
+        for rel in sorted(slide_part.rels.values(), key=lambda rel: rel.rId):
+            sha256.update(rel.reltype.encode("utf-8"))
+            if rel.is_external:
+                sha256.update(rel.target_ref.encode("utf-8"))
+                continue
+            sha256.update(self._part_digest(rel.target_part))
+            if rel.reltype == RT.SLIDE_LAYOUT:
+                # placeholder geometry is inherited from the layout and, through it, the master
+                sha256.update(self._part_digest(rel.target_part.part_related_by(RT.SLIDE_MASTER)))
+        return sha256.hexdigest()
+
+    def _slide_part(self, slide_index):
+        """
+        The part of one slide, found without building its Slide: XML that is not parsed
+        yet is hashed as stored in the .pptx, like XmlParser does.
+        """
+        sldId = self.prs._element.sldIdLst.sldId_lst[slide_index]
+        return self.prs.part.related_part(sldId.rId)
 
-        for shape in slide.shapes:
-            x = shape.left
-            y = shape.top
-            cx = shape.width
-            cy = shape.height
+    def _part_digest(self, part):
+        """
+        Memoized per part: layouts, masters and shared images are hashed once per deck.
+        """
+        if part.partname not in self._part_digests:
+            self._part_digests[part.partname] = hashlib.sha256(part.blob).digest()
+        return self._part_digests[part.partname]
 
+    def get_slide_shapes(self, slide_index, image_dir=None):
+        # image_dir overrides self.image_dir for this slide's pictures
+        image_dir = image_dir or self.image_dir
+        slide = self.prs.slides[slide_index]
+        shapes, boxes, transforms = [], [], []
+
+        for shape, transform in self._iter_shapes(slide.shapes, IDENTITY):
             # Detect placeholder type: title, ctrTitle, subTitle, or None
             placeholder_type = None
             if shape.is_placeholder:
@@ -56,19 +110,12 @@ class PptxParser:
                 elif ph_type == PP_PLACEHOLDER.SUBTITLE:
                     placeholder_type = "subTitle"
 
-            # Base shape object with geometry
+            # Base shape object, its geometry is added once all the shapes are read
             shape_obj = {
                 "type": None,  # Will be set dynamically
                 "title": placeholder_type,
-                "x": x,
-                "y": y,
-                "cx": cx,
-                "cy": cy,
-                "x_percent": max((x / self.slide_width) * 100, 0),
-                "y_percent": max((y / self.slide_height) * 100,0),
-                "width_percent": min((cx / self.slide_width) * 100, 100),
-                "height_percent": min((cy / self.slide_height) * 100, 100)
             }
+            text_frame = None
 
             # === Text shapes ===
             if shape.has_text_frame:
@@ -88,35 +135,26 @@ class PptxParser:
                             )
                         shape_obj["contents"].append(para_obj)
 
-                if shape_obj["contents"]:
-                    shapes.append(shape_obj)
+                if not shape_obj["contents"]:
+                    continue
+                text_frame = shape.text_frame
 
             # === Table shapes ===
             elif shape.shape_type == MSO_SHAPE_TYPE.TABLE:
                 shape_obj["type"] = "table"
-                table_data = self._parse_table(shape)
-                shape_obj["rows"] = table_data["rows"]
-                shape_obj["col_widths"] = table_data["col_widths"]
-                shapes.append(shape_obj)
+                shape_obj["rows"], shape_obj["col_widths"] = self._parse_table(shape)
 
             # === Pictures ===
             elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                os.makedirs("static/images", exist_ok=True)
-                img = shape.image
-                ext = img.ext or "png"
-                image_bytes = img.blob  # The raw bytes of the image file
-                image_name = f"slide{slide_index+1}_img{len(shapes)+1}.{ext}"
-                image_path = os.path.join("static/images/", image_name)
-                # Save image to static/images/
-                with open(image_path, "wb") as f:
-                    f.write(image_bytes)
+                rId = shape._element.blip_rId
+                if rId not in slide.part.rels or slide.part.rels[rId].is_external:
+                    continue  # linked picture (r:link only) or broken relationship: no image to extract
+                image_part = slide.part.related_part(rId)
                 shape_obj["type"] = "image"
-                shape_obj["image_path"] = image_path
-                shape_obj["image_ext"] = ext
-                shape_obj["image_width_px"] = img.size[0]
-                shape_obj["image_height_px"] = img.size[1]
-                
-                shapes.append(shape_obj)
+                # image_path, image_ext, image_width_px, image_height_px
+                shape_obj.update(self.images.extract(
+                    image_part.partname, image_dir, self._part_digests.get(image_part.partname)
+                ))
 
             # === Future: Add chart, image, etc. here ===
             # elif shape.shape_type == MSO_SHAPE_TYPE.CHART:
@@ -125,8 +163,44 @@ class PptxParser:
             #     shape_obj.update(chart_data)
             #     shapes.append(shape_obj)
 
-        return shapes
+            else:
+                continue
+
+            shapes.append((shape_obj, text_frame))
+            boxes.append(tuple(value or 0 for value in (shape.left, shape.top, shape.width, shape.height)))
+            transforms.append(transform)
 
+        # positions and sizes of all the shapes are worked out at once
+        for (shape_obj, text_frame), geometry in zip(shapes, self.geometry.place_shapes(boxes, transforms)):
+            shape_obj.update(geometry)
+            if text_frame is not None:
+                shape_obj["fit_font_size_px"] = self._fit_font_size_px(
+                    text_frame, geometry["cx"], geometry["cy"], MAX_FONT_PT[shape_obj["title"]]
+                )
+        return [shape_obj for shape_obj, _ in shapes]
+
+    def _iter_shapes(self, shapes, transform):
+        """
+        Yield (shape, transform into slide coordinates) for each shape, descending
+        into group shapes.
+        """
+        for shape in shapes:
+            if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+                xfrm = shape._element.grpSpPr.xfrm
+                yield from self._iter_shapes(shape.shapes, group_transform(transform, xfrm))
+            else:
+                yield shape, transform
+
+
+    def _fit_font_size_px(self, text_frame, cx, cy, max_size_pt):
+        """
+        Largest font size (px), up to max_size_pt, at which all the text of the text
+        frame wraps inside its cx x cy box (minus the text frame margins). None when it
+        cannot be computed, leaving the fitting to the browser.
+        """
+        width = cx - text_frame.margin_left - text_frame.margin_right
+        height = cy - text_frame.margin_top - text_frame.margin_bottom
+        return fit_text_px(text_frame.text, width, height, max_size_pt, self.font_file)
 
     def _parse_paragraph(self, para, is_title=False):
         runs = []
@@ -134,7 +208,7 @@ class PptxParser:
         for run in para.runs:
             run_font_size = run.font.size.pt if run.font.size else None
             font_size_pt = run_font_size if run_font_size else para_font_size
-            font_size_px = PptxParser.pt_to_px(font_size_pt) if font_size_pt else None
+            font_size_px = pt_to_px(font_size_pt) if font_size_pt else None
             run_obj = {
                 "text": run.text,
                 "bold": run.font.bold,
@@ -185,7 +259,7 @@ class PptxParser:
                         for run in para.runs:
                             run_font_size = run.font.size.pt if run.font.size else None
                             font_size_pt = run_font_size if run_font_size else para_font_size
-                            font_size_px = PptxParser.pt_to_px(font_size_pt) if font_size_pt else None
+                            font_size_px = pt_to_px(font_size_pt) if font_size_pt else None
                             run_obj = {
                                 "text": run.text,
                                 "bold": run.font.bold,
@@ -199,51 +273,7 @@ class PptxParser:
 
             rows_data.append(row_data)
 
-        x = shape.left
-        y = shape.top
-        cx = shape.width
-        cy = shape.height
-
-        return {
-            "type": "table",
-            "rows": rows_data,
-            "x": x,
-            "y": y,
-            "cx": cx,
-            "cy": cy,
-            "col_widths": col_widths_percent,
-            "x_percent": (x / self.slide_width) * 100,
-            "y_percent": (y / self.slide_height) * 100,
-            "width_percent": (cx / self.slide_width) * 100,
-            "height_percent": (cy / self.slide_height) * 100
-        }
-    
-    @staticmethod
-    def pt_to_px( pt):
-        """
-        Convert font size from points (pt) to pixels (px), as used in web browsers.
-
-        PowerPoint and most desktop publishing tools define font sizes in points (pt).
-        - 1 point (pt) = 1/72 of an inch.
-
-        Web browsers, by default, use a screen resolution of 96 DPI (dots per inch, or pixels per inch).
-        - 1 inch = 96 pixels (px) in CSS.
-
-        To convert points to pixels:
-            1. Convert pt to inches:           inches = pt / 72
-            2. Convert inches to pixels:       px = inches * 96
-            3. Combine into one formula:       px = pt * (96 / 72) = pt * 1.33333...
-
-        Example:
-            12 pt * (96 / 72) = 16 px
-
-        Args:
-            pt (float or int): The font size in points (pt), as extracted from PowerPoint.
-
-        Returns:
-            float: The equivalent font size in pixels (px) for use in web/CSS.
-        """
-        return pt * 96 / 72  # = pt * 1.33333...
+        return rows_data, col_widths_percent
 
 
 
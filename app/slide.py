@@ -1,16 +1,42 @@
+import io
 from abc import ABC, abstractmethod
 
 class SlideContent(ABC):
     """
     Abstract base class for all content blocks on a slide.
-    Each subclass must implement the to_html method.
+    Each subclass must implement the write_html method, which writes the block's
+    HTML chunk by chunk to a text stream (an open file, io.StringIO, ...).
     """
     @abstractmethod
-    def to_html(self):
+    def write_html(self, out):
         pass
 
+    def to_html(self):
+        out = io.StringIO()
+        self.write_html(out)
+        return out.getvalue()
+
+    def image_paths(self):
+        """
+        Paths of the image files the HTML of this block references.
+        """
+        return []
+
+    def box_style(self):
+        """
+        CSS placing a shape block on the slide, from the x/y/width/height percentages
+        the parser computed (already clamped to the slide, see SlideGeometry).
+        """
+        return (
+            f"position:absolute;"
+            f" top:{self.y_percent:.2f}%;"
+            f" left:{self.x_percent:.2f}%;"
+            f" width:{self.width_percent:.2f}%;"
+            f" height:{self.height_percent:.2f}%;"
+        )
+
 
-class HTMLSlide:
+class HTMLSlide(SlideContent):
     """
     Represents one full Reveal.js slide.
     Contains a title and ordered list of content blocks.
@@ -23,19 +49,42 @@ class HTMLSlide:
     def add_shape(self, shape):
         self.shapes.append(shape)
 
-    def to_html(self):
-        html = f'''<section style="position: relative;" data-transition="{self.transition}" 
-                    width:100%; height:100%;>\n'''
+    def image_paths(self):
+        return [path for shape in self.shapes for path in shape.image_paths()]
+
+    def write_html(self, out):
+        out.write(
+            '<section style="position: relative; width:100%; height:100%;" '
+            f'data-transition="{self.transition}">\n'
+        )
 
         if self.title_shapes:
             for title in self.title_shapes:
-                html += title.to_html()
+                title.write_html(out)
 
         for shape in self.shapes:
-            html += shape.to_html()
+            shape.write_html(out)
+
+        out.write("</section>\n")
+
+
+class HTMLFragment(SlideContent):
+    """
+    A slide whose HTML was already rendered, e.g. reused from the slide cache.
+    Stands in for HTMLSlide wherever only write_html()/to_html()/image_paths() is needed.
+    """
+    def __init__(self, html, image_paths=()):
+        self.html = html
+        self._image_paths = list(image_paths)
+
+    def image_paths(self):
+        return self._image_paths
 
-        html += "</section>\n"
-        return html
+    def write_html(self, out):
+        out.write(self.html)
+
+    def to_html(self):
+        return self.html
 
 
 class ParagraphContent(SlideContent):
@@ -46,8 +95,8 @@ class ParagraphContent(SlideContent):
         self.runs = runs
         self.alignment = alignment
 
-    def to_html(self):
-        html = f"  <p class='fragment' style='text-align:{self.alignment};'>\n"
+    def write_html(self, out):
+        out.write(f"  <p class='fragment' style='text-align:{self.alignment};'>\n")
         for run in self.runs:
             text = run["text"]
 
@@ -74,9 +123,8 @@ class ParagraphContent(SlideContent):
                 url = run["hyperlink"]
                 text = f"<a href='{url}' target='_blank'>{text}</a>"
 
-            html += text + "\n"
-        html += "  </p>\n"
-        return html
+            out.write(text + "\n")
+        out.write("  </p>\n")
 
 
 class BulletNode(SlideContent):
@@ -93,8 +141,8 @@ class BulletNode(SlideContent):
     def add_child(self, node):
         self.children.append(node)
 
-    def to_html(self):
-        html = f"<li class='fragment' style='text-align:{self.alignment};'>\n"
+    def write_html(self, out):
+        out.write(f"<li class='fragment' style='text-align:{self.alignment};'>\n")
         for run in self.runs:
             text = run["text"]
             # # Apply tag-based styling for bold/italic/underline
@@ -120,29 +168,27 @@ class BulletNode(SlideContent):
                 url = run["hyperlink"]
                 text = f"<a href='{url}' target='_blank'>{text}</a>"
 
-            html += text
+            out.write(text)
 
         if self.children:
             tag = "ol" if self.ordered else "ul"
-            html += f"<{tag}>\n"
+            out.write(f"<{tag}>\n")
             for child in self.children:
-                html += child.to_html() 
-            html += f"</{tag}>\n"
-        html += "\n</li>\n"
-        return html
+                child.write_html(out)
+            out.write(f"</{tag}>\n")
+        out.write("\n</li>\n")
 
 
 class BulletTreeContent(SlideContent):
     def __init__(self, root):
         self.root = root  # root: a BulletNode with ordered flag
 
-    def to_html(self):
+    def write_html(self, out):
         tag = "ol" if self.root.ordered else "ul"
-        html = f"<{tag}>\n"
+        out.write(f"<{tag}>\n")
         for node in self.root.children:
-            html += node.to_html() 
-        html += f"</{tag}>"
-        return html
+            node.write_html(out)
+        out.write(f"</{tag}>")
 
 class TableContent(SlideContent):
     """
@@ -159,22 +205,10 @@ class TableContent(SlideContent):
         self.col_widths = shape_dict["col_widths"] or []
 
         
-    def to_html(self):
+    def write_html(self, out):
 
-        top = self.y_percent
-        left = self.x_percent
-        width = self.width_percent
-        height = self.height_percent
         # Create absolute-positioned container using percentages
-        style = ""
-        if all(v is not None for v in [self.x_percent, self.y_percent, self.width_percent, self.height_percent]):
-            style = (
-                f"position:absolute;"
-                f" top:{top:.2f}%;"
-                f" left:{left:.2f}%;"
-                f" width:{width:.2f}%;"
-                f" height:{height:.2f}%;"
-            )
+        style = self.box_style()
         ##############
         #<div style="overflow-x: auto; overflow-y: auto; max-height: 100%;">
         """html = f'''
@@ -182,22 +216,22 @@ class TableContent(SlideContent):
 
         ''' """
         #############
-        html = f'<div style="{style}">\n'
+        out.write(f'<div style="{style}">\n')
 
-        html += '<table class="fragment auto-fit">\n'
+        out.write('<table class="fragment auto-fit">\n')
 
         # Insert colgroup if column widths are available
         if self.col_widths:
-            html += "  <colgroup>\n"
+            out.write("  <colgroup>\n")
             for col_width in self.col_widths:
-                html += f'    <col style="width:{col_width:.2f}%;">\n'
-            html += "  </colgroup>\n"
+                out.write(f'    <col style="width:{col_width:.2f}%;">\n')
+            out.write("  </colgroup>\n")
 
         for i, row in enumerate(self.rows):
             tag = "th" if i == 0 else "td"
-            html += "<tr>"
+            out.write("<tr>")
             for cell_runs in row:
-                html += f"<{tag}>"
+                out.write(f"<{tag}>")
                 for run in cell_runs:
                     text = run["text"]
                     # # Apply tag-based styling for bold/italic/underline
@@ -222,11 +256,10 @@ class TableContent(SlideContent):
                     if run.get("hyperlink"):
                         url = run["hyperlink"]
                         text = f"<a href='{url}' target='_blank'>{text}</a>"
-                    html += text
-                html += f"</{tag}>"
-            html += "</tr>\n"
-        html += "</table></div>\n"
-        return html
+                    out.write(text)
+                out.write(f"</{tag}>")
+            out.write("</tr>\n")
+        out.write("</table></div>\n")
 
 
 class TextShape(SlideContent):
@@ -236,30 +269,24 @@ class TextShape(SlideContent):
         self.y_percent = shape_dict["y_percent"]
         self.width_percent = shape_dict["width_percent"]
         self.height_percent = shape_dict["height_percent"]
+        # Font size the text fits its box at, precomputed by the parser (None: fitted in the browser)
+        self.fit_font_size_px = shape_dict.get("fit_font_size_px")
         self.contents = contents  # list of ParagraphContent / BulletTreeContent
 
-    def to_html(self):
+    def write_html(self, out):
 
-        top = max(self.y_percent, 0)
-        left = max(self.x_percent, 0)
-        width = min(self.width_percent, 100)
-        height = min(self.height_percent, 100)
-        style = (
-            f"position:absolute;"
-            f" top:{top:.2f}%;"
-            f" left:{left:.2f}%;"
-            f" width:{width:.2f}%;"
-            f" height:{height:.2f}%;"
-        )
+        style = self.box_style()
 
-        # Outer container layout
-        html = f'<div class="text-shape" style="{style} font-size:30px;">\n'
+        # Outer container layout, data-fitted marks text the converter sized to fit its box
+        if self.fit_font_size_px:
+            out.write(f'<div class="text-shape" data-fitted style="{style} font-size:{self.fit_font_size_px:.2f}px;">\n')
+        else:
+            out.write(f'<div class="text-shape" style="{style} font-size:30px;">\n')
 
         for content in self.contents:
-            html += content.to_html()
+            content.write_html(out)
 
-        html += '</div>\n'
-        return html
+        out.write('</div>\n')
 
 
 
@@ -271,28 +298,27 @@ class TitleShape(SlideContent):
         self.width_percent = shape_dict["width_percent"]
         self.height_percent = shape_dict["height_percent"]
         self.title_type = shape_dict.get("title", None)  # 'ctrTitle', 'title', 'subTitle'
+        self.fit_font_size_px = shape_dict.get("fit_font_size_px")
         self.content = title_runs 
         self.alignment = align
 
-    def to_html(self):
-        top = max(self.y_percent, 0)
-        left = max(self.x_percent, 0)
-        width = min(self.width_percent, 100)
-        height = min(self.height_percent, 100)
-        style = (
-            f"position:absolute;"
-            f" top:{top:.2f}%;"
-            f" left:{left:.2f}%;"
-            f" width:{width:.2f}%;"
-            f" height:{height:.2f}%;"
-        )
+    def write_html(self, out):
+        style = self.box_style()
 
         title = self.title_type
         tag = "h3" if title in ("ctrTitle", "title") else "h4"
         align = self.alignment
 
-        html = f'<div class="title-shape fit-content" style="{style}">\n'
-        html += f'<{tag} style="text-align:{align}; max-height:{height:.2f}%;" class="fit-text">'
+        if self.fit_font_size_px:
+            # fitted size is set on the heading itself, theme heading sizes are relative (em)
+            out.write(f'<div class="title-shape fit-content" data-fitted style="{style}">\n')
+            out.write(
+                f'<{tag} style="text-align:{align}; max-height:{self.height_percent:.2f}%; '
+                f'font-size:{self.fit_font_size_px:.2f}px;" class="fit-text">'
+            )
+        else:
+            out.write(f'<div class="title-shape fit-content" style="{style}">\n')
+            out.write(f'<{tag} style="text-align:{align}; max-height:{self.height_percent:.2f}%;" class="fit-text">')
 
         for run in self.content:
             text = run["text"]
@@ -319,10 +345,9 @@ class TitleShape(SlideContent):
                 url = run["hyperlink"]
                 text = f"<a href='{url}' target='_blank'>{text}</a>"
 
-            html += text
+            out.write(text)
 
-        html += f"</{tag}>\n</div>\n"
-        return html
+        out.write(f"</{tag}>\n</div>\n")
 
 
 
@@ -337,22 +362,43 @@ class ImageContent(SlideContent):
         self.height_percent = shape_dict["height_percent"]
         self.image_path = shape_dict["image_path"]
         self.alt = shape_dict.get("alt", "Slide Image")
-
-    def to_html(self):
+        # Web-optimized variants, see ImagePipeline.plan
+        self.src = shape_dict.get("image_src", self.image_path)
+        self.srcset = shape_dict.get("image_srcset", [])  # [(path, width_px)] in the src format
+        self.sources = shape_dict.get("image_sources", [])  # [{"type": mime, "srcset": [...]}]
+
+    def image_paths(self):
+        paths = {self.image_path, self.src}
+        paths.update(path for path, _ in self.srcset)
+        for source in self.sources:
+            paths.update(path for path, _ in source["srcset"])
+        return sorted(paths)
+
+    def write_html(self, out):
         # Compose the style for the div container
-        style = (
-            f"position:absolute;"
-            f" top:{self.y_percent:.2f}%;"
-            f" left:{self.x_percent:.2f}%;"
-            f" width:{self.width_percent:.2f}%;"
-            f" height:{self.height_percent:.2f}%;"
-        )
-        # Image path is already relative (e.g., "images/slide1_img1.png")
-        html = (
-            f'<div class="image-shape" style="{style}">\n'
-            f'  <img src="{self.image_path}" '
+        style = self.box_style()
+        # Image paths are relative to the app root (e.g., "static/media/<sha256>.png"),
+        # served from "/" so they resolve the same from any viewer route
+        out.write(f'<div class="image-shape" style="{style}">\n')
+        # the picture takes about its share of the slide, which spans the viewport width
+        sizes = f"{max(self.width_percent, 1):.2f}vw"
+        if self.sources:
+            out.write("  <picture>\n")
+            for source in self.sources:
+                out.write(
+                    f'    <source type="{source["type"]}" '
+                    f'srcset="{ImageContent._srcset(source["srcset"])}" sizes="{sizes}">\n'
+                )
+        srcset = f' srcset="{ImageContent._srcset(self.srcset)}" sizes="{sizes}"' if self.srcset else ""
+        out.write(
+            f'  <img src="/{self.src}"{srcset} decoding="async" '
             f'style="width:100%; height:100%; object-fit:contain;" alt="{self.alt}">\n'
-            f'</div>\n'
         )
-        return html
+        if self.sources:
+            out.write("  </picture>\n")
+        out.write('</div>\n')
+
+    @staticmethod
+    def _srcset(candidates):
+        return ", ".join(f"/{path} {width}w" for path, width in candidates)
 
@@ -0,0 +1,58 @@
+from pptx.text.fonts import FontFiles
+from pptx.text.layout import TextFitter
+
+# Largest font size (pt) text is fitted at: the 30px .text-shape default, and PowerPoint's default
+# title/subtitle sizes
+MAX_FONT_PT = {None: 22, "title": 44, "ctrTitle": 44, "subTitle": 32}
+
+
+def find_font_file(font_file=None):
+    """
+    Return the font file text is measured with: font_file when given, otherwise an
+    installed Calibri (the Office default font), otherwise None.
+    """
+    if font_file is not None:
+        return font_file
+    try:
+        return FontFiles.find("Calibri", False, False)
+    except (OSError, KeyError):
+        # unsupported platform or Calibri not installed, the browser fits the text instead
+        return None
+
+
+def fit_text_px(text, width, height, max_size_pt, font_file):
+    """
+    Largest font size (px), up to max_size_pt, at which text wraps inside a
+    width x height (EMU) box when measured with font_file, or None.
+    """
+    if font_file is None or not text.strip() or width <= 0 or height <= 0:
+        return None
+    font_size_pt = TextFitter.best_fit_font_size(text, (width, height), max_size_pt, font_file)
+    return pt_to_px(font_size_pt) if font_size_pt else None
+
+
+def pt_to_px(pt):
+    """
+    Convert font size from points (pt) to pixels (px), as used in web browsers.
+
+    PowerPoint and most desktop publishing tools define font sizes in points (pt).
+    - 1 point (pt) = 1/72 of an inch.
+
+    Web browsers, by default, use a screen resolution of 96 DPI (dots per inch, or pixels per inch).
+    - 1 inch = 96 pixels (px) in CSS.
+
+    To convert points to pixels:
+        1. Convert pt to inches:           inches = pt / 72
+        2. Convert inches to pixels:       px = inches * 96
+        3. Combine into one formula:       px = pt * (96 / 72) = pt * 1.33333...
+
+    Example:
+        12 pt * (96 / 72) = 16 px
+
+    Args:
+        pt (float or int): The font size in points (pt), as extracted from PowerPoint.
+
+    Returns:
+        float: The equivalent font size in pixels (px) for use in web/CSS.
+    """
+    return pt * 96 / 72  # = pt * 1.33333...
@@ -0,0 +1,154 @@
+import contextlib
+import hashlib
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+
+# Paths under static/ double as URLs, so they are always built with "/"
+DECKS_DIR = "static/decks"
+SLIDES_DIR = "static/slides"
+# Images shared by all cached slides, stored once under the hash of their bytes
+MEDIA_DIR = "static/media"
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class DeckWorkspace:
+    """
+    Content-addressed output directory for one converted deck.
+
+    Every conversion writes into static/decks/<deck_id>/ where deck_id is a
+    SHA-256 derived from the uploaded .pptx bytes (see ConversionCache.key), so
+    concurrent uploads (across workers or threads) never overwrite each other's
+    slides.html or images.
+    """
+    _DECK_ID_RE = re.compile(r"[0-9a-f]{64}")
+
+    def __init__(self, deck_id, root=DECKS_DIR):
+        if not DeckWorkspace.is_valid_id(deck_id):
+            raise ValueError(f"DeckWorkspace Class: Invalid deck id {deck_id!r}")
+        self.deck_id = deck_id
+        self.path = posixpath.join(root, deck_id)
+        self.images_dir = posixpath.join(self.path, "images")
+        self.slides_path = posixpath.join(self.path, "slides.html")
+        # fingerprints of the deck's slides, in order (see SlideCache)
+        self.fingerprints_path = posixpath.join(self.path, "slides.json")
+        # per-slide fragment URLs, lets the viewer load the deck slide by slide
+        self.manifest_path = posixpath.join(self.path, "manifest.json")
+
+    @staticmethod
+    def is_valid_id(deck_id):
+        """
+        A deck id is exactly a lowercase SHA-256 hex digest, which also keeps
+        route parameters like "../" from escaping the decks directory.
+        """
+        return bool(DeckWorkspace._DECK_ID_RE.fullmatch(deck_id or ""))
+
+    @property
+    def slides_url(self):
+        return "/" + self.slides_path
+
+    @property
+    def manifest_url(self):
+        return "/" + self.manifest_path
+
+    def has_manifest(self):
+        return os.path.isfile(self.manifest_path)
+
+    def is_converted(self):
+        return os.path.isfile(self.slides_path)
+
+
+def save_upload(file_storage, upload_dir):
+    """
+    Stream an uploaded file to upload_dir while hashing it.
+
+    The file is stored as <deck_id>.pptx, renamed into place only once fully
+    written, so a half-written upload is never picked up by another request.
+
+    Returns:
+        tuple: (deck_id, path of the saved .pptx)
+    """
+    return save_content_addressed(file_storage.stream, upload_dir, "pptx")
+
+
+def save_content_addressed(src, directory, ext):
+    """
+    Stream the binary file object src into directory as <sha256>.<ext>, copying it
+    in CHUNK_SIZE chunks and hashing it on the way. The file is renamed into place
+    once fully written; if that file already exists it is kept (same bytes, same
+    name) and only marked as recently used.
+
+    Returns:
+        tuple: (SHA-256 hex digest, path of the file)
+    """
+    os.makedirs(directory, exist_ok=True)
+    sha256 = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            shutil.copyfileobj(src, _HashingWriter(f, sha256), CHUNK_SIZE)
+        digest = sha256.hexdigest()
+        path = posixpath.join(directory, f"{digest}.{ext}")
+        if touch(path):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return digest, path
+
+
+def touch(path):
+    """
+    Mark path as recently used (the caches evict by mtime). Returns False if it does not exist.
+    """
+    try:
+        os.utime(path)
+    except OSError:
+        return False
+    return True
+
+
+class _HashingWriter:
+    """
+    Writable wrapper around a file that feeds everything written to it into a hash.
+    """
+    def __init__(self, f, hasher):
+        self.f = f
+        self.hasher = hasher
+
+    def write(self, data):
+        self.hasher.update(data)
+        return self.f.write(data)
+
+
+@contextlib.contextmanager
+def atomic_open(path, mode="wb", encoding=None):
+    """
+    Open a temporary file next to path for writing; it replaces path only once the
+    with-block completes, so readers only ever see the previous file or the
+    complete new one. On error the temporary file is discarded.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write(path, data, mode="wb", encoding=None):
+    """
+    Write data to path in one go, see atomic_open.
+    """
+    with atomic_open(path, mode, encoding) as f:
+        f.write(data)
@@ -1,292 +1,427 @@
+import functools
+import hashlib
 import zipfile
-import xml.etree.ElementTree as ET
+
+from lxml import etree
+from pptx.enum.text import MSO_UNDERLINE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.oxml.ns import qn as _qn
+from pptx.spec import GRAPHIC_DATA_URI_TABLE
+
+from .geometry import IDENTITY, SlideGeometry, group_transform
+from .images import ImageExtractor
+from .text import MAX_FONT_PT, find_font_file, fit_text_px, pt_to_px
+
+# Clark names of the tags looked up for every shape, worked out once
+qn = functools.lru_cache(maxsize=None)(_qn)
+
+# Shapes of a slide the converter renders, on the slide or inside a group
+# (connectors and content parts are skipped, as by PptxParser)
+SHAPE_TAGS = (qn("p:sp"), qn("p:pic"), qn("p:graphicFrame"))
+TITLE_TYPES = ("title", "ctrTitle", "subTitle")
+ALIGNMENTS = {"l": "left", "ctr": "center", "r": "right", "just": "justify"}
+# Master placeholder a layout placeholder inherits its geometry from, by ph type
+# (same mapping as python-pptx's LayoutPlaceholder)
+LAYOUT_TO_MASTER_PH_TYPE = {
+    "body": "body", "chart": "body", "clipArt": "body", "ctrTitle": "title",
+    "dgm": "body", "dt": "dt", "ftr": "ftr", "media": "body", "obj": "body",
+    "pic": "body", "sldNum": "sldNum", "subTitle": "body", "tbl": "body", "title": "title",
+}
+# bodyPr insets (EMU) when not set: 0.1" left/right, 0.05" top/bottom
+DEFAULT_INSETS = {"lIns": 91440, "rIns": 91440, "tIns": 45720, "bIns": 45720}
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+# same options as python-pptx's parser, so text comes out identical
+XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 
 
 class XmlParser:
     """
-    Handles parsing of .pptx slide XML into structured content: text paragraphs and tables.
-    Stores a mapping from slide index → parsed content.
+    Reads the shapes of a .pptx straight from its XML parts, without building the
+    python-pptx object model.
+
+    Each slide is parsed in one streaming pass (lxml iterparse): a shape is turned
+    into its shape dict as soon as its closing tag is read and is then dropped from
+    the tree, so memory stays flat however many shapes a slide has. Layouts and
+    masters, only needed for the geometry of placeholders, are parsed once per deck.
+
+    The interface and the shape dicts are the same as PptxParser's, which remains as
+    the reference implementation on top of python-pptx (see benchmarks/bench_parsers.py).
     """
-    def __init__(self, pptx_path):
+    def __init__(self, pptx_path, image_dir="static/images", font_file=None):
+        # image_dir is relative to the app root and doubles as the image URL path
+        self.image_dir = image_dir
+        # TrueType font used to measure text when fitting it into its box (None: no fitting)
+        self.font_file = find_font_file(font_file)
         self.pptx_path = pptx_path
-        self.namespace = {
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-            'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
-            'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
-        }
-        self.slide_data = {}  # Maps slide index (0, 1, ...) → list of parsed shape info
-        self.slide_links = {}
-        self._parse_pptx()
+        self.images = ImageExtractor(pptx_path)
+        self._zip = zipfile.ZipFile(pptx_path)
+        self._rels = {}  # partname -> {rId: (reltype, target partname or URL, is_external)}
+        self._placeholders = {}  # layout/master partname -> {idx or ph type: geometry}
+        self._part_digests = {}  # partname -> SHA-256 digest of the part bytes
+
+        presentation = self._related(PACKAGE_URI, RT.OFFICE_DOCUMENT)
+        presentation_xml = self._parse(presentation)
+        self.geometry = SlideGeometry.from_presentation(presentation_xml)
+        self.slide_width = self.geometry.slide_width  # in EMUs
+        self.slide_height = self.geometry.slide_height  # in EMUs
+        rels = self._rels_of(presentation)
+        sldIdLst = presentation_xml.find(qn("p:sldIdLst"))
+        self._slides = [
+            rels[sldId.get(qn("r:id"))][1] for sldId in ([] if sldIdLst is None else sldIdLst)
+        ]
 
-    def _parse_pptx(self):
+    def get_slide_count(self):
+        return len(self._slides)
+
+    def close(self):
         """
-        Parses the .pptx file and collects slides in the correct order by:
-        1. Reading slide order from ppt/presentation.xml
-        2. Mapping rIds to slide file names via ppt/_rels/presentation.xml.rels
-        3. Ensuring the parsed slides match python-pptx order
+        Close the .pptx, opened for as long as the parser lives.
         """
-        with zipfile.ZipFile(self.pptx_path, 'r') as zipf:
-            # Step 1: Read the presentation.xml to get rId order
-            with zipf.open('ppt/presentation.xml') as pres_file:
-                pres_root = ET.parse(pres_file).getroot()
-                ns = {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
-                sldIdLst = pres_root.find('p:sldIdLst', ns)
-                rId_order = [sld.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
-                             for sld in sldIdLst.findall('p:sldId', ns)]
-
-            # Step 2: Read presentation.xml.rels to map rId to slide filenames
-            with zipf.open('ppt/_rels/presentation.xml.rels') as rels_file:
-                rels_root = ET.parse(rels_file).getroot()
-                rId_to_target = {}
-                for rel in rels_root:
-                    rId = rel.attrib.get('Id')
-                    target = rel.attrib.get('Target')
-                    if rId and target and target.startswith("slides/slide"):
-                        rId_to_target[rId] = target  # e.g., rId3 → slides/slide2.xml
-
-            # Step 3: Map correct slide order
-            ordered_slide_files = [f"ppt/{rId_to_target[rid]}" for rid in rId_order if rid in rId_to_target]
-
-            # Step 4: Load hyperlinks from .rels files for each slide
-            for idx, fname in enumerate(ordered_slide_files):
-                rels_path = fname.replace("slides/", "slides/_rels/") + ".rels"
-                links = {}
-                try:
-                    with zipf.open(rels_path) as rels_file:
-                        rels_root = ET.parse(rels_file).getroot()
-                        for rel in rels_root:
-                            if rel.attrib.get("Type", "").endswith("/hyperlink"):
-                                rId = rel.attrib["Id"]
-                                target = rel.attrib["Target"]
-                                links[rId] = target
-                except KeyError:
-                    raise RuntimeError("Error in Hyperlinks mapping\n")  # no .rels file for this slide
-                self.slide_links[idx] = links
-                """
-                the above step builds a per-slide mapping like:
-                self.slide_links[12] = {"rId2": "mailto:someone@example.com", "rId3": "https://google.com"}
-
-                """
-
-            # Step 5: Parse slides in correct order and store data
-            for idx, fname in enumerate(ordered_slide_files):
-                with zipf.open(fname) as file:
-                    xml_content = file.read()
-                    self.slide_data[idx] = self._parse_slide(xml_content,idx)
-
-
-    def _parse_slide(self, xml_content, slide_index):
+        self._zip.close()
+        self.images.close()
+
+    def get_slide_fingerprint(self, slide_index, salt=""):
         """
-        Parses a single slide and returns a list of shapes (paragraphs or tables) in order.
+        SHA-256 over everything the HTML of one slide is derived from, see
+        PptxParser.get_slide_fingerprint. Parts are hashed as stored in the .pptx.
         """
-        root = ET.fromstring(xml_content)
-        ns = self.namespace
-        shapes = []
-
-        spTree = root.find('.//p:spTree', ns)
-        for shape in spTree:
-            tag = shape.tag.split("}")[-1]
-
-            if tag == "sp":
-                is_title = shape.find('.//p:nvPr/p:ph', ns) is not None and \
-                           shape.find('.//p:nvPr/p:ph', ns).attrib.get('type') in ["title", "ctrTitle"]
-                is_subtitle = shape.find('.//p:nvPr/p:ph', ns) is not None and \
-                              shape.find('.//p:nvPr/p:ph', ns).attrib.get('type') == "subTitle"
-
-                for paragraph in shape.findall('.//a:p', ns):
-                    runs = []
-                    for r in paragraph.findall('a:r', ns):
-                        rpr = r.find('a:rPr', ns)
-                        text_elem = r.find('a:t', ns)
-                        if text_elem is None:
-                            continue
-                        text = text_elem.text or ""
-                        bold = rpr is not None and rpr.attrib.get("b") == "1"
-                        italic = rpr is not None and rpr.attrib.get("i") == "1"
-                        underline = rpr is not None and rpr.attrib.get("u") in ["sng", "dbl"]
-                        strike = rpr is not None and rpr.attrib.get("strike") in ["sng", "dbl"]
-
-                        hlink = rpr.find('a:hlinkClick', ns)
-                        r_id = hlink.attrib.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id') if hlink is not None else None
-                        hyperlink = self.slide_links.get(slide_index, {}).get(r_id)
-
-                        if hyperlink:
-                            if hyperlink.startswith("mailto:"):
-                                hyperlink_type = "email"
-                            elif hyperlink.startswith("http://") or hyperlink.startswith("https://"):
-                                hyperlink_type = "web"
-                            else:
-                                hyperlink_type = "other"
-                        else:
-                            hyperlink_type = None
-
-
-                        runs.append({
-                            "text": text,
-                            "bold": bold,
-                            "italic": italic,
-                            "underline": underline,
-                            "strikethrough": strike,
-                            "hyperlink": hyperlink,
-                            "hyperlink_type": hyperlink_type
-                        })
-
-                    # Reconstruct the plain string for logic/grouping
-                    text = "".join(run["text"] for run in runs)
-                    if not text.strip():
-                        continue
-                    # Get text alignment
-                    alignment = 'left' # as PP default
-                    pPr = paragraph.find('a:pPr',ns)
-                    if pPr is not None and "algn" in pPr.attrib:
-                        algn = pPr.attrib["algn"]
-                        if algn == "ctr":
-                            alignment = "center"
-                        elif algn == "r":
-                            alignment = "right"
-
-                    bullet_type = None if is_title or is_subtitle else self._get_bullet_type(paragraph)
-                    level = self._get_level(paragraph, bullet_type)
-
-                    shapes.append({
-                        "text": text.strip(),
-                        "runs": runs,
-                        "level": level,
-                        "bullet_type": bullet_type,
-                        "title": is_title,
-                        "type": "text",
-                        "alignment": alignment
-                    })
-
-            # table data extract
-            elif tag == "graphicFrame":
-                tbl = shape.find('.//a:tbl', ns)
-                if tbl is not None:
-                    rows = []
-                    for tr in tbl.findall('.//a:tr', ns):
-                        row = []
-                        for tc in tr.findall('.//a:tc', ns):
-                            texts = [t.text for t in tc.findall('.//a:t', ns) if t.text]
-                            cell = " ".join(texts).strip()
-                            row.append(cell)
-                        rows.append(row)
-
-
-                    # Extract the shape transform (position and size) if available
-                    xfrm = shape.find('.//p:xfrm', ns)
-                    if xfrm is not None:
-                        off = xfrm.find('a:off', ns)
-                        ext = xfrm.find('a:ext', ns)
-                        try:
-                            x = int(off.attrib["x"]) if off is not None else 0
-                            y = int(off.attrib["y"]) if off is not None else 0
-                            cx = int(ext.attrib["cx"]) if ext is not None else 0
-                            cy = int(ext.attrib["cy"]) if ext is not None else 0
-                        except Exception as e:
-                            print("⚠️ Failed to extract table position:", e)
-                            x = y = cx = cy = 0
-                    else:
-                        print("⚠️ Missing <a:xfrm> for table shape")
-                        x = y = cx = cy = 0
-
-                    # Convert to percentages based on slide size (in EMUs)
-                    # PowerPoint default size = 9144000 x 6858000 EMUs = 960 x 720 pixels
-                    # PowerPoint uses EMUs (English Metric Units)
-                    # 1 inch = 914400 EMUs → slide width = 10" = 9144000 EMUs
-                    # 1 pixel ≈ 9525 EMUs, but we work in % relative to slide
-                    # This makes the Reveal layout scale properly on all screens
-
-                    SLIDE_WIDTH_EMU = 9144000
-                    SLIDE_HEIGHT_EMU = 6858000
-
-                    x_percent = (x / SLIDE_WIDTH_EMU) * 100
-                    y_percent = (y / SLIDE_HEIGHT_EMU) * 100
-                    width_percent = (cx / SLIDE_WIDTH_EMU) * 100
-                    height_percent = (cy / SLIDE_HEIGHT_EMU) * 100
-
-
-                    # Extract column widths from <a:tblGrid>
-                    col_widths = []
-                    tbl_grid = tbl.find('a:tblGrid', ns)
-                    if tbl_grid is not None:
-                        for grid_col in tbl_grid.findall('a:gridCol', ns):
-                            w_emu = int(grid_col.attrib.get("w", "0"))
-                            width_percent = (w_emu / SLIDE_WIDTH_EMU) * 100
-                            col_widths.append(width_percent)
-
-
-                    # Add all data to the table shape dict
-                    shapes.append({
-                        "type": "table",
-                        "rows": rows,
-                        "x_percent": x_percent,
-                        "y_percent": y_percent,
-                        "width_percent": width_percent,
-                        "height_percent": height_percent,
-                        "col_widths": col_widths
-                    })
-
-        return shapes
-
-
-    def _get_bullet_type(self, paragraph):
+        partname = self._slides[slide_index]
+        sha256 = hashlib.sha256(f"{salt}:{self.slide_width}x{self.slide_height}".encode())
+        sha256.update(self._part_digest(partname))
+        for rId, (reltype, target, is_external) in sorted(self._rels_of(partname).items()):
+            sha256.update(reltype.encode("utf-8"))
+            if is_external:
+                sha256.update(target.encode("utf-8"))
+                continue
+            sha256.update(self._part_digest(target))
+            if reltype == RT.SLIDE_LAYOUT:
+                # placeholder geometry is inherited from the layout and, through it, the master
+                sha256.update(self._part_digest(self._related(target, RT.SLIDE_MASTER)))
+        return sha256.hexdigest()
+
+    def get_slide_shapes(self, slide_index, image_dir=None):
+        # image_dir overrides self.image_dir for this slide's pictures
+        image_dir = image_dir or self.image_dir
+        partname = self._slides[slide_index]
+        shapes, boxes, transforms = [], [], []
+        group_transforms = {}  # p:grpSp element -> transform of the shapes inside it
+        with self._zip.open(partname.membername) as f:
+            for _, elm in etree.iterparse(
+                f, tag=SHAPE_TAGS + (qn("p:grpSp"),), remove_blank_text=True, resolve_entities=False
+            ):
+                parent = elm.getparent()
+                if elm.tag != qn("p:grpSp"):
+                    parsed = self._parse_shape(elm, partname, image_dir)
+                    if parsed is not None:
+                        shape_obj, box, fit = parsed
+                        shapes.append((shape_obj, fit))
+                        boxes.append(box)
+                        transforms.append(self._group_transform(parent, group_transforms))
+                elm.clear()
+                if parent.tag == qn("p:spTree"):
+                    # nothing before this shape is needed anymore
+                    while parent[0] is not elm:
+                        del parent[0]
+                    group_transforms.clear()
+
+        # positions and sizes of all the shapes are worked out at once
+        for (shape_obj, fit), geometry in zip(shapes, self.geometry.place_shapes(boxes, transforms)):
+            shape_obj.update(geometry)
+            if fit is not None:
+                text, inset_x, inset_y, max_size_pt = fit
+                shape_obj["fit_font_size_px"] = fit_text_px(
+                    text, geometry["cx"] - inset_x, geometry["cy"] - inset_y, max_size_pt, self.font_file
+                )
+        return [shape_obj for shape_obj, _ in shapes]
+
+    def _group_transform(self, group, group_transforms):
         """
-        Determines whether the <a:p> paragraph should be treated as:
-        - "bullet" (unordered list)
-        - "number" (ordered list)
-        - None (normal paragraph)
-
-        Logic:
-        - If <a:buNone> is present anywhere → this paragraph is NOT a bullet.
-        - If <a:buAutoNum> is present → this is a numbered list.
-        - If <a:buChar> is present → this is a bullet list.
-        - If none of the above, and no buNone, we assume it's a bullet (usually level 0).
+        Transform into slide coordinates of the shapes whose parent element is group,
+        composed through any groups it is nested in.
         """
-        ns = self.namespace
-
-        # ✅ Look for tags directly inside <a:p>, not just <a:pPr>
-        buNone = paragraph.find('.//a:buNone', ns)
-        buChar = paragraph.find('.//a:buChar', ns)
-        buAutoNum = paragraph.find('.//a:buAutoNum', ns)
-
-        # 🔍 Case 1: <a:buNone> — explicitly says it's a normal paragraph
-        if buNone is not None:
+        if group.tag != qn("p:grpSp"):
+            return IDENTITY
+        if group not in group_transforms:
+            group_transforms[group] = group_transform(
+                self._group_transform(group.getparent(), group_transforms),
+                group.find(f"{qn('p:grpSpPr')}/{qn('a:xfrm')}"),
+            )
+        return group_transforms[group]
+
+    def _parse_shape(self, elm, partname, image_dir):
+        """
+        Return (shape dict without its geometry, (x, y, cx, cy) as set for the shape,
+        text fitting to do once its size is known or None), or None for a shape that
+        is not rendered.
+        """
+        nvPr = elm.find(f"*/{qn('p:nvPr')}")
+        ph = nvPr.find(qn("p:ph")) if nvPr is not None else None
+        placeholder_type = None
+        if ph is not None and ph.get("type") in TITLE_TYPES:
+            placeholder_type = ph.get("type")
+
+        if elm.tag == qn("p:sp"):
+            txBody = elm.find(qn("p:txBody"))
+            if txBody is None:
+                return None
+        elif ph is not None:
+            return None  # picture/table/chart placeholders are not rendered
+        elif elm.tag == qn("p:pic"):
+            if nvPr is not None and nvPr.find(qn("a:videoFile")) is not None:
+                return None  # movie
+            blip = elm.find(f"{qn('p:blipFill')}/{qn('a:blip')}")
+            rId = blip.get(qn("r:embed")) if blip is not None else None
+            image_rel = self._rels_of(partname).get(rId)
+            if image_rel is None or image_rel[2]:
+                return None  # linked picture (r:link only) or broken relationship: no image to extract
+        else:
+            graphicData = elm.find(f"{qn('a:graphic')}/{qn('a:graphicData')}")
+            if graphicData is None or graphicData.get("uri") != GRAPHIC_DATA_URI_TABLE:
+                return None
+
+        x, y, cx, cy = geometry = _geometry(elm)
+        if ph is not None and None in geometry:
+            inherited = self._layout_placeholder(partname, ph.get("idx", "0"))
+            x, y, cx, cy = (
+                own if own is not None else base for own, base in zip(geometry, inherited)
+            )
+        box = tuple(value or 0 for value in (x, y, cx, cy))
+        fit = None
+
+        shape_obj = {"type": None, "title": placeholder_type}
+
+        # === Text shapes ===
+        if elm.tag == qn("p:sp"):
+            shape_obj["type"] = "text"
+            shape_obj["contents"] = []
+            is_title = placeholder_type in TITLE_TYPES
+            paragraphs = txBody.findall(qn("a:p"))
+            for p in paragraphs:
+                para_obj = self._parse_paragraph(p, partname, is_title)
+                if para_obj:
+                    if not para_obj.get("alignment"):
+                        para_obj["alignment"] = (
+                            "center" if placeholder_type in ("ctrTitle", "subTitle") else "left"
+                        )
+                    shape_obj["contents"].append(para_obj)
+            if not shape_obj["contents"]:
+                return None
+            shape_obj["fit_font_size_px"] = None
+            if self.font_file is not None:
+                fit = self._text_fit(txBody, paragraphs, MAX_FONT_PT[placeholder_type])
+
+        # === Pictures ===
+        elif elm.tag == qn("p:pic"):
+            image_partname = image_rel[1]
+            shape_obj["type"] = "image"
+            # image_path, image_ext, image_width_px, image_height_px
+            shape_obj.update(self.images.extract(
+                image_partname, image_dir, self._part_digests.get(image_partname)
+            ))
+
+        # === Table shapes ===
+        else:
+            shape_obj["type"] = "table"
+            rows, col_widths = self._parse_table(graphicData.find(qn("a:tbl")), partname)
+            shape_obj["rows"] = rows
+            shape_obj["col_widths"] = col_widths
+
+        return shape_obj, box, fit
+
+    def _parse_paragraph(self, p, partname, is_title=False):
+        runs = self._parse_runs(p, partname)
+        if not runs or not any(run["text"].strip() for run in runs):
             return None
 
-        # 🔢 Case 2: <a:buAutoNum> — indicates numbered list (1., 2., ...)
-        if buAutoNum is not None:
-            return "number"
-
-        # • Case 3: <a:buChar> — indicates bulleted list (•, →, etc.)
-        if buChar is not None:
-            return "bullet"
-
-        # 🟡 Case 4: No explicit tags, but also no <a:buNone>
-        #           Treat as default top-level bullet 
-        return "bullet"
+        pPr = p.find(qn("a:pPr"))
+        bullet_type = None if is_title else _bullet_type(pPr)
+        return {
+            "type": "paragraph" if bullet_type is None else "bullet",
+            "bullet_type": bullet_type,
+            "level": int(pPr.get("lvl", 0)) if pPr is not None else 0,
+            "alignment": ALIGNMENTS.get(pPr.get("algn")) if pPr is not None else None,
+            "runs": runs,
+        }
 
-    def _get_level(self, paragraph, bullet_type):
+    def _parse_runs(self, p, partname):
+        defRPr = p.find(f"{qn('a:pPr')}/{qn('a:defRPr')}")
+        para_sz = defRPr.get("sz") if defRPr is not None else None
+        runs = []
+        for r in p.iterfind(qn("a:r")):
+            rPr = r.find(qn("a:rPr"))
+            props = rPr.attrib if rPr is not None else {}
+            hlinkClick = rPr.find(qn("a:hlinkClick")) if rPr is not None else None
+            rId = hlinkClick.get(qn("r:id")) if hlinkClick is not None else None
+            sz = props.get("sz") or para_sz
+            t = r.find(qn("a:t"))
+            runs.append({
+                "text": (t.text or "") if t is not None else "",
+                "bold": _bool(props.get("b")),
+                "italic": _bool(props.get("i")),
+                "underline": _underline(props.get("u")),
+                "hyperlink": self._target_ref(partname, rId) if rId else None,
+                "font_size_px": pt_to_px(int(sz) / 100) if sz else None,
+            })
+        return runs
+
+    def _parse_table(self, tbl, partname):
+        col_widths = [int(gridCol.get("w")) for gridCol in tbl.iterfind(f"{qn('a:tblGrid')}/{qn('a:gridCol')}")]
+        total_width = sum(col_widths)
+        col_widths_percent = [(w / total_width) * 100 for w in col_widths] if total_width else []
+
+        rows_data = []
+        for tr in tbl.iterfind(qn("a:tr")):
+            row_data = []
+            for tc in tr.iterfind(qn("a:tc")):
+                cell_runs = []
+                for p in tc.iterfind(f"{qn('a:txBody')}/{qn('a:p')}"):
+                    cell_runs.extend(self._parse_runs(p, partname))
+                row_data.append(cell_runs)
+            rows_data.append(row_data)
+        return rows_data, col_widths_percent
+
+    def _text_fit(self, txBody, paragraphs, max_size_pt):
         """
-        Extracts bullet indentation level from <a:pPr>. Defaults to 0.
+        What fitting the text of a shape takes besides its size: (text, left + right
+        insets, top + bottom insets, max_size_pt), see fit_text_px.
         """
-        ns = self.namespace
-        pPr = paragraph.find('a:pPr', ns)
-        if pPr is not None and 'lvl' in pPr.attrib:
-            return int(pPr.attrib['lvl'])
-        if bullet_type in ("bullet", "number"):
-            return 0  # Default to level 0 if it's bullet but no lvl tag
-        return 0
-
+        bodyPr = txBody.find(qn("a:bodyPr"))
+        insets = {
+            name: int(bodyPr.get(name, default)) if bodyPr is not None else default
+            for name, default in DEFAULT_INSETS.items()
+        }
+        text = "\n".join(_paragraph_text(p) for p in paragraphs)
+        return text, insets["lIns"] + insets["rIns"], insets["tIns"] + insets["bIns"], max_size_pt
 
-    def get_slide_count(self):
-        return len(self.slide_data)
-    
+    def _layout_placeholder(self, slide_partname, idx):
+        """
+        (x, y, cx, cy) of the placeholder with idx on the slide's layout, with what the
+        layout leaves out taken from the master; None where neither has a value.
+        """
+        layout = self._related(slide_partname, RT.SLIDE_LAYOUT)
+        if layout not in self._placeholders:
+            master_placeholders = self._master_placeholders(self._related(layout, RT.SLIDE_MASTER))
+            placeholders = {}
+            for ph, geometry in self._iter_placeholders(layout):
+                if None in geometry:
+                    ph_type = ph.get("type", "obj")
+                    master = master_placeholders.get(LAYOUT_TO_MASTER_PH_TYPE.get(ph_type, ph_type))
+                    if master is not None:
+                        geometry = tuple(
+                            own if own is not None else base for own, base in zip(geometry, master)
+                        )
+                placeholders.setdefault(ph.get("idx", "0"), geometry)
+            self._placeholders[layout] = placeholders
+        return self._placeholders[layout].get(idx, (None, None, None, None))
+
+    def _master_placeholders(self, master):
+        if master not in self._placeholders:
+            placeholders = {}
+            for ph, geometry in self._iter_placeholders(master):
+                placeholders.setdefault(ph.get("type", "obj"), geometry)
+            self._placeholders[master] = placeholders
+        return self._placeholders[master]
+
+    def _iter_placeholders(self, partname):
+        spTree = self._parse(partname).find(f"{qn('p:cSld')}/{qn('p:spTree')}")
+        for elm in spTree:
+            ph = elm.find(f"*/{qn('p:nvPr')}/{qn('p:ph')}")
+            if ph is not None:
+                yield ph, _geometry(elm)
+
+    def _parse(self, partname):
+        return etree.fromstring(self._zip.read(partname.membername), XML_PARSER)
+
+    def _rels_of(self, partname):
+        if partname not in self._rels:
+            rels = {}
+            rels_member = partname.rels_uri.membername
+            if rels_member in self._zip.NameToInfo:
+                for rel in self._parse(partname.rels_uri):
+                    is_external = rel.get("TargetMode") == "External"
+                    target = rel.get("Target")
+                    if not is_external:
+                        target = PackURI.from_rel_ref(partname.baseURI, target)
+                    rels[rel.get("Id")] = (rel.get("Type"), target, is_external)
+            self._rels[partname] = rels
+        return self._rels[partname]
+
+    def _related(self, partname, reltype):
+        return next(
+            target for type_, target, is_external in self._rels_of(partname).values()
+            if type_ == reltype and not is_external
+        )
+
+    def _target_ref(self, partname, rId):
+        """
+        URL of a hyperlink: the address for external links, else the relative partname.
+        """
+        _, target, is_external = self._rels_of(partname)[rId]
+        return target if is_external else target.relative_ref(partname.baseURI)
 
-    def get_slide_shapes(self, slide_index):
+    def _part_digest(self, partname):
         """
-        Returns the list of parsed shapes for a given slide index.
-        Each shape is a dict of either:
-        - type="text", with keys: text, level, bullet_type, title
-        - type="table", with key: rows (list of lists)
+        Memoized per part: layouts, masters and shared images are hashed once per deck.
         """
-        return self.slide_data.get(slide_index, [])
\ No newline at end of file
+        if partname not in self._part_digests:
+            sha256 = hashlib.sha256()
+            with self._zip.open(partname.membername) as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+            self._part_digests[partname] = sha256.digest()
+        return self._part_digests[partname]
+
+
+def _geometry(elm):
+    """
+    (x, y, cx, cy) of a shape element as set on its own xfrm, None for each one it leaves out.
+    """
+    xfrm = elm.find(f"{qn('p:spPr')}/{qn('a:xfrm')}")
+    if xfrm is None:
+        xfrm = elm.find(qn("p:xfrm"))  # graphicFrame
+    off = ext = None
+    if xfrm is not None:
+        off = xfrm.find(qn("a:off"))
+        ext = xfrm.find(qn("a:ext"))
+    x, y = (int(off.get("x")), int(off.get("y"))) if off is not None else (None, None)
+    cx, cy = (int(ext.get("cx")), int(ext.get("cy"))) if ext is not None else (None, None)
+    return x, y, cx, cy
+
+
+def _bool(value):
+    return None if value is None else value in ("1", "true")
+
+
+def _underline(value):
+    # as python-pptx's Font.underline: True for single, the MSO_UNDERLINE member otherwise
+    if value is None:
+        return None
+    if value == "none":
+        return False
+    if value == "sng":
+        return True
+    return MSO_UNDERLINE.from_xml(value)
+
+
+def _bullet_type(pPr):
+    if pPr is not None:
+        if pPr.find(qn("a:buNone")) is not None:
+            return None
+        if pPr.find(qn("a:buAutoNum")) is not None:
+            return "number"
+        if pPr.find(qn("a:buChar")) is not None:
+            return "bullet"
+    return "bullet"
+
+
+def _paragraph_text(p):
+    # runs and fields as their text, line breaks as vertical tab, as python-pptx's TextFrame.text
+    parts = []
+    for child in p:
+        if child.tag in (qn("a:r"), qn("a:fld")):
+            t = child.find(qn("a:t"))
+            parts.append((t.text or "") if t is not None else "")
+        elif child.tag == qn("a:br"):
+            parts.append("\v")
+    return "".join(parts)
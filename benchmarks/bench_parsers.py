@@ -0,0 +1,104 @@
+"""
+Benchmark of the two slide parsers: XmlParser, the streaming lxml engine the converter
+uses, against PptxParser, its reference implementation on top of python-pptx.
+
+Each parser opens the deck and extracts the shapes of every slide; the best of a few
+runs is reported along with peak memory, and the shape dicts of both are checked to be
+identical. Without a deck a synthetic one is built, copying text/table/picture slides
+(the python-pptx default template is used when no --template is given).
+
+    $ python benchmarks/bench_parsers.py [deck.pptx ...] [--slides 500] [--template base.pptx]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+
+from app.pptx_parser import PptxParser
+from app.xml_parser import XmlParser
+
+PARSERS = (("PptxParser", PptxParser), ("XmlParser", XmlParser))
+REPEAT = 3
+
+
+def build_deck(path, slide_count, template=None):
+    prs = Presentation(template)
+    layout = prs.slide_layouts[1 if len(prs.slide_layouts) > 1 else 0]
+    for i in range(slide_count):
+        slide = prs.slides.add_slide(layout)
+        for placeholder in slide.placeholders:
+            text_frame = placeholder.text_frame
+            text_frame.text = f"Slide {i}, placeholder {placeholder.placeholder_format.idx}"
+            for level in range(1, 4):
+                paragraph = text_frame.add_paragraph()
+                paragraph.level = level
+                run = paragraph.add_run()
+                run.text = "Nested point with some more words to wrap " * level
+                run.font.size = Pt(14 + level)
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(6), Inches(4), Inches(1))
+        textbox.text_frame.text = f"Footnote {i}"
+        table = slide.shapes.add_table(4, 4, Inches(5), Inches(5), Inches(4), Inches(2)).table
+        for cell in table.iter_cells():
+            cell.text = "cell"
+    prs.save(path)
+
+
+def extract_all(parser_class, deck, image_dir):
+    parser = parser_class(deck, image_dir=image_dir)
+    try:
+        return [parser.get_slide_shapes(i) for i in range(parser.get_slide_count())]
+    finally:
+        parser.close()
+
+
+def bench(parser_class, deck, image_dir):
+    """
+    Return (best seconds, peak MiB, slides' shape dicts) for parsing every slide of deck.
+    """
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        extract_all(parser_class, deck, image_dir)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    slides = extract_all(parser_class, deck, image_dir)
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return min(times), peak, slides
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("decks", nargs="*", help=".pptx files to parse")
+    arg_parser.add_argument("--slides", type=int, default=500, help="size of the synthetic deck")
+    arg_parser.add_argument("--template", help=".pptx the synthetic deck is built on")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        decks = args.decks
+        if not decks:
+            decks = [os.path.join(tmp, f"synthetic-{args.slides}.pptx")]
+            build_deck(decks[0], args.slides, args.template)
+        image_dir = os.path.join(tmp, "images")
+
+        for deck in decks:
+            print(f"{os.path.basename(deck)}:")
+            results = {}
+            for name, parser_class in PARSERS:
+                seconds, peak, slides = bench(parser_class, deck, image_dir)
+                results[name] = slides
+                print(f"  {name:<12}{seconds * 1000:>10.1f} ms  {peak:>8.1f} MiB peak  ({len(slides)} slides)")
+            identical = results["PptxParser"] == results["XmlParser"]
+            print(f"  shape dicts {'identical' if identical else 'DIFFER'}")
+
+
+if __name__ == "__main__":
+    main()
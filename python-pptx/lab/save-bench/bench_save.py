@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""
+Save-time benchmark for the package writer's compression policy.
+
+Builds a media-heavy deck (slides with text and a large, incompressible picture each) and times
+`Presentation.save()` with every member deflated, as the writer used to, against the current
+policy: media stored as it is, XML deflated at a given level, optionally in several threads.
+
+Then saves the deck after reopening it and editing two slides: parts and rels items not changed
+since the deck was opened are copied from it as they are stored, only the edited ones are
+serialized and compressed again.
+
+    $ python lab/save-bench/bench_save.py [slide_count] [--template base.pptx]
+"""
+
+import argparse
+import io
+import os
+import time
+from unittest import mock
+
+from PIL import Image
+
+from pptx import Presentation
+from pptx.opc import serialized
+from pptx.util import Inches
+
+REPEAT = 3
+
+
+def new_deck(slide_count, template):
+    prs = Presentation(template)
+    layout = prs.slide_layouts[1 if len(prs.slide_layouts) > 1 else 0]
+    for n in range(slide_count):
+        slide = prs.slides.add_slide(layout)
+        for placeholder in slide.placeholders:
+            placeholder.text_frame.text = "Slide %d, a line of text to compress " % n * 20
+        # -- noise does not compress, like the JPEG/PNG/video media of a real deck --
+        image = Image.frombytes("RGB", (640, 480), os.urandom(640 * 480 * 3))
+        picture = io.BytesIO()
+        image.save(picture, "PNG", compress_level=0)
+        picture.seek(0)
+        slide.shapes.add_picture(picture, Inches(1), Inches(1))
+    return prs
+
+
+def save_seconds(prs, **kwargs):
+    best = None
+    for _ in range(REPEAT):
+        stream = io.BytesIO()
+        start = time.perf_counter()
+        prs.save(stream, **kwargs)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, len(stream.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("slide_count", nargs="?", type=int, default=200)
+    parser.add_argument("--template", help=".pptx the deck is built on (default template)")
+    args = parser.parse_args()
+
+    prs = new_deck(args.slide_count, args.template)
+    cases = [
+        ("deflate everything (before)", {}, frozenset()),
+        ("store media, deflate XML", {}, None),
+        ("store media, XML level 1", {"compresslevel": 1}, None),
+        ("store media, 4 threads", {"workers": 4}, None),
+        ("store media, level 1, 4 threads", {"compresslevel": 1, "workers": 4}, None),
+    ]
+    print("%d slides, %d CPUs" % (args.slide_count, os.cpu_count() or 1))
+    for label, kwargs, content_types in cases:
+        if content_types is None:
+            seconds, size = save_seconds(prs, **kwargs)
+        else:
+            with mock.patch.object(serialized, "compressed_content_types", content_types):
+                seconds, size = save_seconds(prs, **kwargs)
+        print("  %-34s %8.0f ms %10.1f MB" % (label, seconds * 1000, size / 1e6))
+
+    stream = io.BytesIO()
+    prs.save(stream)
+    reopened = Presentation(stream)
+    for n in (0, args.slide_count // 2):
+        reopened.slides[n].placeholders[0].text_frame.text = "Edited slide %d" % n
+    seconds, size = save_seconds(reopened)
+    print("  %-34s %8.0f ms %10.1f MB" % ("reopened, 2 slides edited", seconds * 1000, size / 1e6))
+
+
+if __name__ == "__main__":
+    main()
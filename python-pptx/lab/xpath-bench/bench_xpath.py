@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""
+Micro-benchmark for `pptx.oxml.xmlchemy.compiled_xpath()`.
+
+Times the XPath expressions evaluated most often when reading or adding shapes on a large
+slide, once the way `BaseOxmlElement.xpath()` used to evaluate them (a raw string handed to
+lxml, compiled on every call) and once through the cached compiled evaluator.
+
+    $ python lab/xpath-bench/bench_xpath.py [shape_count]
+"""
+
+import sys
+import timeit
+
+from lxml import etree
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import _nsmap, nsdecls
+from pptx.oxml.xmlchemy import compiled_xpath
+
+SP_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="Shape %d"/><p:cNvSpPr/>'
+    '<p:nvPr><p:ph idx="%d"/></p:nvPr></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="%d" y="0"/><a:ext cx="914400" cy="914400"/></a:xfrm></p:spPr>'
+    "</p:sp>"
+)
+
+
+def new_spTree(shape_count):
+    sps = "".join(SP_XML % (n + 2, n + 1, n, n * 12700) for n in range(shape_count))
+    return parse_xml(
+        '<p:spTree %s><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+        "</p:nvGrpSpPr><p:grpSpPr/>%s</p:spTree>" % (nsdecls("a", "p"), sps)
+    )
+
+
+def per_call_usec(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main(shape_count):
+    spTree = new_spTree(shape_count)
+    sp = spTree[-1]
+    cases = (
+        ("//@id", spTree, 200),  # CT_GroupShape.max_shape_id
+        ("//p:cNvPr/@name", spTree, 200),  # _BaseShapes._next_ph_name
+        ("./*[1]/p:nvPr/p:ph", sp, 20000),  # BaseShapeElement.ph
+        ("./a:xfrm/a:off/@x", sp.spPr, 20000),  # CT_ShapeProperties.x
+    )
+    print("%d shapes, usec per call" % shape_count)
+    print("%-24s %10s %10s %8s" % ("expression", "raw", "compiled", "speedup"))
+    for xpath_str, elm, number in cases:
+        raw = per_call_usec(
+            lambda: etree.ElementBase.xpath(elm, xpath_str, namespaces=_nsmap), number
+        )
+        evaluator = compiled_xpath(xpath_str)
+        compiled = per_call_usec(lambda: evaluator(elm), number)
+        print("%-24s %10.2f %10.2f %7.1fx" % (xpath_str, raw, compiled, raw / compiled))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
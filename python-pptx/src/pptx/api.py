@@ -18,17 +18,31 @@ if TYPE_CHECKING:
     from pptx.parts.presentation import PresentationPart
 
 
-def Presentation(pptx: str | IO[bytes] | None = None) -> presentation.Presentation:
+def Presentation(
+    pptx: str | IO[bytes] | None = None, lazy: bool = False, read_only: bool = False
+) -> presentation.Presentation:
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *lazy* is |True|, images, media and other binary parts are only read
+    from *pptx* when they are first accessed, so opening a large deck does not
+    load all its media into memory. The file must remain available and
+    unchanged while the presentation is in use.
+
+    *read_only* opens a presentation that is only read from, for extraction.
+    It implies *lazy* and skips the bookkeeping kept for saving changes, like
+    parsing the relationships of every part and keeping slide partnames in
+    order. A read-only presentation can still be saved, but every part is
+    then written afresh. See also
+    :meth:`.Presentation.iter_slide_elements`.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    presentation_part = Package.open(pptx, lazy, read_only).main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
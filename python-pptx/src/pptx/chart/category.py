@@ -196,5 +196,11 @@ class CategoryLevel(Sequence):
     def __getitem__(self, offset):
         return Category(self._lvl.pt_lst[offset])
 
+    def __iter__(self):
+        # ---the default Sequence iteration calls __getitem__() once per
+        # ---category, each of which rebuilds the `c:pt` list.
+        for pt in self._lvl.pt_lst:
+            yield Category(pt)
+
     def __len__(self):
         return len(self._lvl.pt_lst)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+from array import array
 from collections.abc import Sequence
 
 from pptx.chart.datalabel import DataLabels
@@ -73,14 +75,21 @@ class _BaseCategorySeries(_BaseSeries):
         the order they appear on the chart.
         """
 
-        def iter_values():
-            val = self._element.val
-            if val is None:
-                return
-            for idx in range(val.ptCount_val):
-                yield val.pt_v(idx)
+        val = self._element.val
+        if val is None:
+            return ()
+        return tuple(val.pt_vs)
 
-        return tuple(iter_values())
+    @property
+    def values_array(self):
+        """
+        Read-only. An `array.array` of typecode "d" containing the float
+        values for this series, in the order they appear on the chart, with
+        NaN in the position of a missing value. The array supports the buffer
+        protocol, so `numpy.frombuffer(series.values_array)` provides
+        a NumPy view of the values without copying them.
+        """
+        return _values_array(self._element.val)
 
 
 class _MarkerMixin(object):
@@ -181,8 +190,7 @@ class XySeries(_BaseSeries, _MarkerMixin):
         if yVal is None:
             return
 
-        for idx in range(yVal.ptCount_val):
-            yield yVal.pt_v(idx)
+        yield from yVal.pt_vs
 
     @lazyproperty
     def points(self):
@@ -200,6 +208,16 @@ class XySeries(_BaseSeries, _MarkerMixin):
         """
         return tuple(self.iter_values())
 
+    @property
+    def values_array(self):
+        """
+        Read-only. An `array.array` of typecode "d" containing the float Y
+        values for this series, in the order they appear on the chart, with
+        NaN in the position of a missing value. It can be wrapped with
+        `numpy.frombuffer()` without copying.
+        """
+        return _values_array(self._element.yVal)
+
 
 class BubbleSeries(XySeries):
     """
@@ -256,3 +274,14 @@ def _SeriesFactory(ser):
         raise NotImplementedError("series class for %s not yet implemented" % xChart_tag)
 
     return SeriesCls(ser)
+
+
+def _values_array(numDataSource):
+    """
+    Return an `array.array("d")` of the values in *numDataSource*, a `c:val`
+    or `c:yVal` element or None, using NaN to represent a missing value.
+    """
+    if numDataSource is None:
+        return array("d")
+    nan = math.nan
+    return array("d", (nan if v is None else v for v in numDataSource.pt_vs))
@@ -7,7 +7,8 @@ presentations to and from a .pptx file.
 from __future__ import annotations
 
 import collections
-from typing import IO, TYPE_CHECKING, DefaultDict, Iterator, Mapping, Set, cast
+import functools
+from typing import IO, TYPE_CHECKING, Callable, DefaultDict, Iterator, Mapping, Set, cast
 
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -15,13 +16,15 @@ from pptx.opc.oxml import CT_Relationships, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from pptx.opc.serialized import PackageReader, PackageWriter
 from pptx.opc.shared import CaseInsensitiveDict
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_plain_xml, parse_xml
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from lxml import etree
     from typing_extensions import Self
 
     from pptx.opc.oxml import CT_Relationship, CT_Types
+    from pptx.opc.serialized import _RawMember  # pyright: ignore[reportPrivateUsage]
     from pptx.oxml.xmlchemy import BaseOxmlElement
     from pptx.package import Package
     from pptx.parts.presentation import PresentationPart
@@ -73,18 +76,40 @@ class OpcPackage(_RelatableMixin):
     file or file-like object containing a package (.pptx file).
     """
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    def __init__(self, pkg_file: str | IO[bytes], lazy: bool = False, read_only: bool = False):
         self._pkg_file = pkg_file
+        self._lazy = lazy or read_only
+        self._read_only = read_only
 
     @classmethod
-    def open(cls, pkg_file: str | IO[bytes]) -> Self:
-        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        return cls(pkg_file)._load()
+    def open(cls, pkg_file: str | IO[bytes], lazy: bool = False, read_only: bool = False) -> Self:
+        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`.
+
+        When `lazy` is True, the package file is held open and the blob of each binary part (image,
+        media, embedded object, etc.) is only read from it when that part is first accessed. The
+        package file must remain available and unchanged while the package is in use, so in
+        particular a lazily-opened package should not be saved over the file it was opened from.
+
+        `read_only` is for callers that only extract from the package. It implies `lazy`, and the
+        package skips the bookkeeping done for a later save: the relationships of each part are
+        only parsed when first used and no part keeps its zip member to be copied. Such a package
+        can still be saved, but every part in it is then serialized and compressed afresh.
+        """
+        return cls(pkg_file, lazy, read_only)._load()
 
     def drop_rel(self, rId: str) -> None:
         """Remove relationship identified by `rId`."""
         self._rels.pop(rId)
 
+    def iter_bytes(self, compresslevel: int | None = None, workers: int = 1) -> Iterator[bytes]:
+        """Generate this package as a zip file, in chunks of bytes produced as it is written.
+
+        `compresslevel` and `workers` are as for :meth:`save`.
+        """
+        return PackageWriter.iter_write(
+            self._rels, tuple(self.iter_parts()), compresslevel, workers
+        )
+
     def iter_parts(self) -> Iterator[Part]:
         """Generate exactly one reference to each part in the package."""
         visited: Set[Part] = set()
@@ -130,6 +155,11 @@ class OpcPackage(_RelatableMixin):
         """
         return cast("PresentationPart", self.part_related_by(RT.OFFICE_DOCUMENT))
 
+    @property
+    def read_only(self) -> bool:
+        """True when this package was opened read-only, see :meth:`open`."""
+        return self._read_only
+
     def next_partname(self, tmpl: str) -> PackURI:
         """Return |PackURI| next available partname matching `tmpl`.
 
@@ -148,16 +178,22 @@ class OpcPackage(_RelatableMixin):
                 return PackURI(candidate_partname)
         raise Exception("ProgrammingError: ran out of candidate_partnames")  # pragma: no cover
 
-    def save(self, pkg_file: str | IO[bytes]) -> None:
+    def save(
+        self, pkg_file: str | IO[bytes], compresslevel: int | None = None, workers: int = 1
+    ) -> None:
         """Save this package to `pkg_file`.
 
-        `file` can be either a path to a file (a string) or a file-like object.
+        `file` can be either a path to a file (a string) or a file-like object, which need not be
+        seekable. `compresslevel` and `workers` control how the package members are compressed,
+        see |PackageWriter|.
         """
-        PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()))
+        PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()), compresslevel, workers)
 
     def _load(self) -> Self:
         """Return the package after loading all parts and relationships."""
-        pkg_xml_rels, parts = _PackageLoader.load(self._pkg_file, cast("Package", self))
+        pkg_xml_rels, parts = _PackageLoader.load(
+            self._pkg_file, cast("Package", self), self._lazy, self._read_only
+        )
         self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
         return self
 
@@ -170,13 +206,25 @@ class OpcPackage(_RelatableMixin):
 class _PackageLoader:
     """Function-object that loads a package from disk (or other store)."""
 
-    def __init__(self, pkg_file: str | IO[bytes], package: Package):
+    def __init__(
+        self,
+        pkg_file: str | IO[bytes],
+        package: Package,
+        lazy: bool = False,
+        read_only: bool = False,
+    ):
         self._pkg_file = pkg_file
         self._package = package
+        self._lazy = lazy or read_only
+        self._read_only = read_only
 
     @classmethod
     def load(
-        cls, pkg_file: str | IO[bytes], package: Package
+        cls,
+        pkg_file: str | IO[bytes],
+        package: Package,
+        lazy: bool = False,
+        read_only: bool = False,
     ) -> tuple[CT_Relationships, dict[PackURI, Part]]:
         """Return (pkg_xml_rels, parts) pair resulting from loading `pkg_file`.
 
@@ -186,18 +234,39 @@ class _PackageLoader:
         The returned `pkg_xml_rels` value is a `CT_Relationships` object containing the parsed
         package relationships. It is the caller's responsibility (the package object) to load
         those relationships into its |_Relationships| object.
+
+        When `lazy` is True, the blob of each part is read from `pkg_file` on first use rather than
+        during loading. When `read_only` is True, the relationships of each part are also only
+        parsed on first use and the parts are not set up to be copied on save.
         """
-        return cls(pkg_file, package)._load()
+        return cls(pkg_file, package, lazy, read_only)._load()
 
     def _load(self) -> tuple[CT_Relationships, dict[PackURI, Part]]:
         """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file."""
-        parts, xml_rels = self._parts, self._xml_rels
+        if self._read_only:
+            return self._load_read_only()
+
+        parts, xml_rels, package_reader = self._parts, self._xml_rels, self._package_reader
 
         for partname, part in parts.items():
-            part.load_rels_from_xml(xml_rels[partname], parts)
+            part.load_rels_from_xml(
+                xml_rels[partname], parts, package_reader.raw_member_for(partname.rels_uri)
+            )
 
         return xml_rels[PACKAGE_URI], parts
 
+    def _load_read_only(self) -> tuple[CT_Relationships, dict[PackURI, Part]]:
+        """Return (pkg_xml_rels, parts) pair where no rels item but the package's is parsed yet.
+
+        Finding the parts by following relationships would mean parsing every rels item up front,
+        so here every member with a content type is a part instead and the relationships of each
+        are parsed when that part's are first used.
+        """
+        parts = self._parts
+        for partname, part in parts.items():
+            part.load_rels_lazily(functools.partial(self._xml_rels_for, partname), parts)
+        return self._xml_rels_for(PACKAGE_URI), parts
+
     @lazyproperty
     def _content_types(self) -> _ContentTypeMap:
         """|_ContentTypeMap| object providing content-types for items of this package.
@@ -209,7 +278,7 @@ class _PackageLoader:
     @lazyproperty
     def _package_reader(self) -> PackageReader:
         """|PackageReader| object providing access to package-items in pkg_file."""
-        return PackageReader(self._pkg_file)
+        return PackageReader(self._pkg_file, self._lazy)
 
     @lazyproperty
     def _parts(self) -> dict[PackURI, Part]:
@@ -222,19 +291,62 @@ class _PackageLoader:
         content_types = self._content_types
         package = self._package
         package_reader = self._package_reader
-
-        return {
-            partname: PartFactory(
-                partname,
-                content_types[partname],
-                package,
-                blob=package_reader[partname],
-            )
-            for partname in (p for p in self._xml_rels if p != "/")
+        partnames = (
+            self._member_partnames
+            if self._read_only
             # -- invalid partnames can arise in some packages; ignore those rather than raise an
             # -- exception.
-            if partname in package_reader
-        }
+            else [p for p in self._xml_rels if p != "/" and p in package_reader]
+        )
+
+        if self._lazy:
+            parts = {
+                partname: PartFactory.load_lazily(
+                    partname,
+                    content_types[partname],
+                    package,
+                    blob_loader=functools.partial(package_reader.__getitem__, partname),
+                )
+                for partname in partnames
+            }
+        else:
+            parts = {
+                partname: PartFactory(
+                    partname,
+                    content_types[partname],
+                    package,
+                    blob=package_reader[partname],
+                )
+                for partname in partnames
+            }
+
+        if self._read_only:
+            return parts
+
+        # -- until it is changed, a part is saved as a copy of the zip member it was loaded from --
+        for partname, part in parts.items():
+            part._raw_member = package_reader.raw_member_for(partname)
+
+        return parts
+
+    @property
+    def _member_partnames(self) -> list[PackURI]:
+        """Partname of each member of the package that is a part, in the order they are stored.
+
+        Rels items and the content-types item are not parts, nor is a member that has no content
+        type, like the directory entry some zip tools add.
+        """
+        content_types = self._content_types
+        partnames: list[PackURI] = []
+        for pack_uri in self._package_reader:
+            if pack_uri == CONTENT_TYPES_URI or pack_uri.baseURI.endswith("/_rels"):
+                continue
+            try:
+                content_types[pack_uri]
+            except KeyError:
+                continue
+            partnames.append(pack_uri)
+        return partnames
 
     @lazyproperty
     def _xml_rels(self) -> dict[PackURI, CT_Relationships]:
@@ -304,6 +416,23 @@ class Part(_RelatableMixin):
         """
         return cls(partname, content_type, package, blob)
 
+    @classmethod
+    def load_lazily(
+        cls,
+        partname: PackURI,
+        content_type: str,
+        package: Package,
+        blob_loader: Callable[[], bytes],
+    ) -> Self:
+        """Return `cls` instance whose blob is produced by calling `blob_loader` on first access.
+
+        The blob is never read when the part's contents are never used. For an XmlPart that blob is
+        its XML, read and parsed when its element is first accessed.
+        """
+        part = cls.load(partname, content_type, package, None)  # pyright: ignore[reportArgumentType]
+        part._blob_loader = blob_loader
+        return part
+
     @property
     def blob(self) -> bytes:
         """Contents of this package part as a sequence of bytes.
@@ -322,19 +451,60 @@ class Part(_RelatableMixin):
         """
         self._blob = blob
 
+    @property
+    def _blob(self) -> bytes | None:
+        """Binary contents of this part, read from the package on first access when loaded lazily.
+
+        Subclasses that manage their own binary read and assign `self._blob` as a plain attribute;
+        this property makes deferred loading transparent to them.
+        """
+        if self._blob_loader is not None:
+            self._blob_value = self._blob_loader()
+            self._blob_loader = None
+        return self._blob_value
+
+    @_blob.setter
+    def _blob(self, blob: bytes | None):
+        self._blob_value = blob
+        self._blob_loader = None
+        self._raw_member = None
+
+    # -- class-level defaults so `._blob` is safe to read before `__init__()` assigns it --
+    _blob_value: bytes | None = None
+    _blob_loader: Callable[[], bytes] | None = None
+    # -- zip member this part was loaded from, as stored there. It is set on load and dropped as
+    # -- soon as the part may have changed; while it is set, a save copies it rather than
+    # -- serializing and compressing the part again.
+    _raw_member: _RawMember | None = None
+
     @lazyproperty
     def content_type(self) -> str:
         """Content-type (MIME-type) of this part."""
         return self._content_type
 
-    def load_rels_from_xml(self, xml_rels: CT_Relationships, parts: dict[PackURI, Part]) -> None:
+    def load_rels_from_xml(
+        self,
+        xml_rels: CT_Relationships,
+        parts: dict[PackURI, Part],
+        raw_member: _RawMember | None = None,
+    ) -> None:
         """load _Relationships for this part from `xml_rels`.
 
         Part references are resolved using the `parts` dict that maps each partname to the loaded
         part with that partname. These relationships are loaded from a serialized package and so
-        already have assigned rIds. This method is only used during package loading.
+        already have assigned rIds. `raw_member` is the rels item `xml_rels` was parsed from, when
+        there is one. This method is only used during package loading.
+        """
+        self._rels.load_from_xml(self._partname.baseURI, xml_rels, parts, raw_member)
+
+    def load_rels_lazily(
+        self, xml_rels_loader: Callable[[], CT_Relationships], parts: dict[PackURI, Part]
+    ) -> None:
+        """Load _Relationships for this part from what `xml_rels_loader()` returns, on first use.
+
+        Like :meth:`load_rels_from_xml`, only used during package loading.
         """
-        self._rels.load_from_xml(self._partname.baseURI, xml_rels, parts)
+        self._rels.load_lazily(self._partname.baseURI, xml_rels_loader, parts)
 
     @lazyproperty
     def package(self) -> Package:
@@ -384,6 +554,10 @@ class XmlPart(Part):
 
     Provides additional methods to the |Part| base class that take care of parsing and
     reserializing the XML payload and managing relationships to other parts.
+
+    A part loaded from a package holds on to its XML as bytes and only parses it when its element
+    is first accessed, so the parts a caller never looks at (notes slides, layouts, masters,
+    themes, charts, ...) cost no parsing.
     """
 
     def __init__(
@@ -394,16 +568,64 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname: PackURI, content_type: str, package: Package, blob: bytes):
-        """Return instance of `cls` loaded with parsed XML from `blob`."""
-        return cls(
-            partname, content_type, package, element=cast("BaseOxmlElement", parse_xml(blob))
-        )
+        """Return instance of `cls` holding the XML in `blob`, parsed on first access."""
+        part = cls(partname, content_type, package, element=None)  # pyright: ignore
+        part._blob = blob
+        return part
 
     @property
     def blob(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
-        """bytes XML serialization of this part."""
+        """bytes XML serialization of this part.
+
+        This is the XML the part was loaded with, as it is, while that has not been parsed.
+        """
+        if self._element_value is None:
+            xml = self._blob
+            if xml is not None:
+                return xml
         return serialize_part_xml(self._element)
 
+    @property
+    def _element(self) -> BaseOxmlElement:
+        """Root element of the XML of this part, parsed from the XML it was loaded with on first
+        access.
+
+        There is no telling whether the caller changes the XML it is given, so a part whose XML
+        has been accessed is no longer saved as a copy of the zip member it was loaded from.
+        """
+        self._raw_member = None
+        element = self._element_value
+        if element is None:
+            xml = self._blob
+            if xml is not None:
+                element = self._element_value = cast("BaseOxmlElement", parse_xml(xml))
+                self._blob = None
+        return cast("BaseOxmlElement", element)
+
+    @_element.setter
+    def _element(self, element: BaseOxmlElement):
+        self._element_value = element
+        self._raw_member = None
+
+    # -- class-level default, an XmlPart loaded from a package has its XML in `._blob` until it
+    # -- is parsed
+    _element_value: BaseOxmlElement | None = None
+
+    def scan_element(self) -> etree._Element:
+        """Root element of the XML of this part, for reading only.
+
+        While the XML of this part has not been parsed into its element, it is parsed here into
+        plain lxml elements, quicker to build than the custom element classes, and not kept: each
+        call parses it again and a change made to what it returns is never saved. Once the part's
+        element exists, that element is returned, and it must not be changed either.
+        """
+        element = self._element_value
+        if element is None:
+            xml = self._blob
+            if xml is not None:
+                return parse_plain_xml(xml)
+        return self._element
+
     # -- XmlPart cannot set its blob, which is why pyright complains --
 
     def drop_rel(self, rId: str) -> None:
@@ -443,6 +665,18 @@ class PartFactory:
         PartClass = cls._part_cls_for(content_type)
         return PartClass.load(partname, content_type, package, blob)
 
+    @classmethod
+    def load_lazily(
+        cls,
+        partname: PackURI,
+        content_type: str,
+        package: Package,
+        blob_loader: Callable[[], bytes],
+    ) -> Part:
+        """Return registered |Part| subtype instance that reads its blob using `blob_loader`."""
+        PartClass = cls._part_cls_for(content_type)
+        return PartClass.load_lazily(partname, content_type, package, blob_loader)
+
     @classmethod
     def _part_cls_for(cls, content_type: str) -> type[Part]:
         """Return the custom part class registered for `content_type`.
@@ -548,25 +782,46 @@ class _Relationships(Mapping[str, "_Relationship"]):
         )
 
     def load_from_xml(
-        self, base_uri: str, xml_rels: CT_Relationships, parts: dict[PackURI, Part]
+        self,
+        base_uri: str,
+        xml_rels: CT_Relationships,
+        parts: dict[PackURI, Part],
+        raw_member: _RawMember | None = None,
     ) -> None:
-        """Replace any relationships in this collection with those from `xml_rels`."""
-
-        def iter_valid_rels():
-            """Filter out broken relationships such as those pointing to NULL."""
-            for rel_elm in xml_rels.relationship_lst:
-                # --- Occasionally a PowerPoint plugin or other client will "remove"
-                # --- a relationship simply by "voiding" its Target value, like making
-                # --- it "/ppt/slides/NULL". Skip any relationships linking to a
-                # --- partname that is not present in the package.
-                if rel_elm.targetMode == RTM.INTERNAL:
-                    partname = PackURI.from_rel_ref(base_uri, rel_elm.target_ref)
-                    if partname not in parts:
-                        continue
-                yield _Relationship.from_xml(base_uri, rel_elm, parts)
+        """Replace any relationships in this collection with those from `xml_rels`.
 
+        `raw_member` is the rels item `xml_rels` was parsed from, see :attr:`raw_member`.
+        """
+        self._rels_loader = None
         self._rels.clear()
-        self._rels.update((rel.rId, rel) for rel in iter_valid_rels())
+        self._rels.update(
+            (rel.rId, rel) for rel in self._iter_valid_rels(base_uri, xml_rels, parts)
+        )
+
+        # -- a broken relationship dropped above must not be saved back with a copy --
+        if raw_member is None or len(self._rels) != len(xml_rels.relationship_lst):
+            self._raw_member = None
+            return
+        self._raw_member = raw_member
+        self._raw_member_targets = tuple(
+            (rel.target_part, rel.target_part.partname)
+            for rel in self._rels.values()
+            if not rel.is_external
+        )
+
+    def load_lazily(
+        self,
+        base_uri: str,
+        xml_rels_loader: Callable[[], CT_Relationships],
+        parts: dict[PackURI, Part],
+    ) -> None:
+        """Load this collection from what `xml_rels_loader()` returns when it is first used.
+
+        `xml_rels_loader` is only called, and its result only resolved against `parts`, on that
+        first use. No rels item is kept to be copied on save. Only used during package loading.
+        """
+        self._raw_member = None
+        self._rels_loader = lambda: self._iter_valid_rels(base_uri, xml_rels_loader(), parts)
 
     def part_with_reltype(self, reltype: str) -> Part:
         """Return target part of relationship with matching `reltype`.
@@ -589,8 +844,25 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
         The caller is responsible for ensuring it is no longer required.
         """
+        self._raw_member = None
         return self._rels.pop(rId)
 
+    @property
+    def raw_member(self) -> _RawMember | None:
+        """Zip member these relationships were loaded from, as long as it still describes them.
+
+        |None| when they were not loaded from a zip package, or once a relationship has been added
+        or removed or a target part renamed since. While it is available, saving copies it rather
+        than serializing :attr:`xml`.
+        """
+        raw_member = self._raw_member
+        if raw_member is None:
+            return None
+        for part, partname in self._raw_member_targets:
+            if part.partname != partname:
+                return None
+        return raw_member
+
     @property
     def xml(self):
         """bytes XML serialization of this relationship collection.
@@ -619,6 +891,7 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
     def _add_relationship(self, reltype: str, target: Part | str, is_external: bool = False) -> str:
         """Return str rId of |_Relationship| newly added to spec."""
+        self._raw_member = None
         rId = self._next_rId
         self._rels[rId] = _Relationship(
             self._base_uri,
@@ -663,10 +936,42 @@ class _Relationships(Mapping[str, "_Relationship"]):
             "ProgrammingError: Impossible to have more distinct rIds than relationships"
         )
 
+    @staticmethod
+    def _iter_valid_rels(
+        base_uri: str, xml_rels: CT_Relationships, parts: dict[PackURI, Part]
+    ) -> Iterator[_Relationship]:
+        """Generate a |_Relationship| for each relationship in `xml_rels` that is not broken.
+
+        Broken relationships are those pointing to a part that is not in `parts`, like NULL.
+        """
+        for rel_elm in xml_rels.relationship_lst:
+            # --- Occasionally a PowerPoint plugin or other client will "remove"
+            # --- a relationship simply by "voiding" its Target value, like making
+            # --- it "/ppt/slides/NULL". Skip any relationships linking to a
+            # --- partname that is not present in the package.
+            if rel_elm.targetMode == RTM.INTERNAL:
+                partname = PackURI.from_rel_ref(base_uri, rel_elm.target_ref)
+                if partname not in parts:
+                    continue
+            yield _Relationship.from_xml(base_uri, rel_elm, parts)
+
     @lazyproperty
     def _rels(self) -> dict[str, _Relationship]:
-        """dict {rId: _Relationship} containing relationships of this collection."""
-        return {}
+        """dict {rId: _Relationship} containing relationships of this collection.
+
+        Loaded on first access when the collection was loaded lazily, see :meth:`load_lazily`.
+        """
+        rels_loader, self._rels_loader = self._rels_loader, None
+        if rels_loader is None:
+            return {}
+        return {rel.rId: rel for rel in rels_loader()}
+
+    # -- rels item loaded from and the (part, partname) of each internal target as loaded, see
+    # -- `.raw_member`
+    _raw_member: _RawMember | None = None
+    _raw_member_targets: tuple[tuple[Part, PackURI], ...] = ()
+    # -- produces the relationships of a collection loaded lazily until they are first used --
+    _rels_loader: Callable[[], Iterator[_Relationship]] | None = None
 
     @property
     def _rels_by_reltype(self) -> dict[str, list[_Relationship]]:
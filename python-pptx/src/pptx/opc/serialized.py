@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import collections
+import functools
+import io
 import os
 import posixpath
+import struct
+import time
 import zipfile
-from typing import IO, TYPE_CHECKING, Any, Container, Sequence
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Callable, Container, Iterator, Sequence
 
 from pptx.exc import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.oxml import CT_Types, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from pptx.opc.shared import CaseInsensitiveDict
-from pptx.opc.spec import default_content_types
+from pptx.opc.spec import compressed_content_types, default_content_types
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
@@ -26,8 +33,9 @@ class PackageReader(Container[bytes]):
     perhaps by unzipping a .pptx file.
     """
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    def __init__(self, pkg_file: str | IO[bytes], lazy: bool = False):
         self._pkg_file = pkg_file
+        self._lazy = lazy
 
     def __contains__(self, pack_uri: object) -> bool:
         """Return True when part identified by `pack_uri` is present in package."""
@@ -37,6 +45,10 @@ class PackageReader(Container[bytes]):
         """Return bytes for part corresponding to `pack_uri`."""
         return self._blob_reader[pack_uri]
 
+    def __iter__(self) -> Iterator[PackURI]:
+        """Generate the pack-URI of each item in the package, rels and content-types items too."""
+        return iter(self._blob_reader)
+
     def rels_xml_for(self, partname: PackURI) -> bytes | None:
         """Return optional rels item XML for `partname`.
 
@@ -46,45 +58,99 @@ class PackageReader(Container[bytes]):
         blob_reader, uri = self._blob_reader, partname.rels_uri
         return blob_reader[uri] if uri in blob_reader else None
 
+    def raw_member_for(self, partname: PackURI) -> _RawMember | None:
+        """Return the zip member `partname` is stored in, as it is stored, when there is one.
+
+        Returns `None` when the package is not a zip file (an expanded directory).
+        """
+        return self._blob_reader.raw_member(partname)
+
     @lazyproperty
     def _blob_reader(self) -> _PhysPkgReader:
         """|_PhysPkgReader| subtype providing read access to the package file."""
-        return _PhysPkgReader.factory(self._pkg_file)
+        return _PhysPkgReader.factory(self._pkg_file, self._lazy)
 
 
 class PackageWriter:
     """Writes a zip-format OPC package to `pkg_file`.
 
-    `pkg_file` can be either a path to a zip file (a string) or a file-like object. `pkg_rels` is
-    the |_Relationships| object containing relationships for the package. `parts` is a sequence of
-    |Part| subtype instance to be written to the package.
+    `pkg_file` can be either a path to a zip file (a string) or a file-like object, seekable or
+    not. `pkg_rels` is the |_Relationships| object containing relationships for the package.
+    `parts` is a sequence of |Part| subtype instance to be written to the package.
+
+    `compresslevel` and `workers` control how members are compressed, see |_ZipPkgWriter|.
 
-    Its single API classmethod is :meth:`write`. This class is not intended to be instantiated.
+    Its API classmethods are :meth:`write` and :meth:`iter_write`. This class is not intended to be
+    instantiated.
     """
 
-    def __init__(self, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]):
+    def __init__(
+        self,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        compresslevel: int | None = None,
+        workers: int = 1,
+    ):
         self._pkg_file = pkg_file
         self._pkg_rels = pkg_rels
         self._parts = parts
+        self._compresslevel = compresslevel
+        self._workers = workers
 
     @classmethod
     def write(
-        cls, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]
+        cls,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        compresslevel: int | None = None,
+        workers: int = 1,
     ) -> None:
         """Write a physical package (.pptx file) to `pkg_file`.
 
         The serialized package contains `pkg_rels` and `parts`, a content-types stream based on
         the content type of each part, and a .rels file for each part that has relationships.
         """
-        cls(pkg_file, pkg_rels, parts)._write()
+        cls(pkg_file, pkg_rels, parts, compresslevel, workers)._write()
+
+    @classmethod
+    def iter_write(
+        cls,
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        compresslevel: int | None = None,
+        workers: int = 1,
+    ) -> Iterator[bytes]:
+        """Generate the bytes of a physical package (.pptx file) as it is written.
+
+        The package is the same one :meth:`write` writes, but rather than going to a file it is
+        produced as a sequence of chunks, those written for each member in turn and then the zip
+        central directory. Nothing is written before the caller asks for the next chunk.
+        """
+        sink = _ChunkSink()
+        return cls(sink, pkg_rels, parts, compresslevel, workers)._iter_write(sink)
 
     def _write(self) -> None:
         """Write physical package (.pptx file)."""
-        with _PhysPkgWriter.factory(self._pkg_file) as phys_writer:
+        with _PhysPkgWriter.factory(
+            self._pkg_file, self._compresslevel, self._workers
+        ) as phys_writer:
             self._write_content_types_stream(phys_writer)
             self._write_pkg_rels(phys_writer)
             self._write_parts(phys_writer)
 
+    def _iter_write(self, sink: _ChunkSink) -> Iterator[bytes]:
+        """Generate what is written to `sink`, the package file, after writing each member."""
+        with _PhysPkgWriter.factory(sink, self._compresslevel, self._workers) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            yield from sink.drain()
+            for part in self._parts:
+                self._write_part(phys_writer, part)
+                yield from sink.drain()
+        yield from sink.drain()
+
     def _write_content_types_stream(self, phys_writer: _PhysPkgWriter) -> None:
         """Write `[Content_Types].xml` part to the physical package.
 
@@ -99,12 +165,27 @@ class PackageWriter:
     def _write_parts(self, phys_writer: _PhysPkgWriter) -> None:
         """Write blob of each part in `parts` to the package.
 
-        A rels item for each part is also written when the part has relationships.
+        A rels item for each part is also written when the part has relationships. A part, or rels
+        item, not changed since it was loaded is copied from the zip member it was loaded from,
+        still compressed, rather than serialized and compressed again.
         """
         for part in self._parts:
-            phys_writer.write(part.partname, part.blob)
-            if part._rels:  # pyright: ignore[reportPrivateUsage]
-                phys_writer.write(part.partname.rels_uri, part.rels.xml)
+            self._write_part(phys_writer, part)
+
+    def _write_part(self, phys_writer: _PhysPkgWriter, part: Part) -> None:
+        """Write blob of `part`, and its rels item when it has relationships, to the package."""
+        raw_member = part._raw_member  # pyright: ignore[reportPrivateUsage]
+        if raw_member is not None:
+            phys_writer.copy(part.partname, raw_member)
+        else:
+            phys_writer.write(part.partname, part.blob, part.content_type)
+        if part._rels:  # pyright: ignore[reportPrivateUsage]
+            rels, rels_uri = part.rels, part.partname.rels_uri
+            raw_rels_member = rels.raw_member
+            if raw_rels_member is not None:
+                phys_writer.copy(rels_uri, raw_rels_member)
+            else:
+                phys_writer.write(rels_uri, rels.xml)
 
     def _write_pkg_rels(self, phys_writer: _PhysPkgWriter) -> None:
         """Write the XML rels item for `pkg_rels` ('/_rels/.rels') to the package."""
@@ -126,20 +207,36 @@ class _PhysPkgReader(Container[PackURI]):
             f"`{type(self).__name__}` must implement `.__contains__()`"
         )
 
+    def __iter__(self) -> Iterator[PackURI]:
+        """Generate the pack-URI of each member of the package."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.__iter__()`"
+        )
+
+    def raw_member(self, pack_uri: PackURI) -> _RawMember | None:
+        """Zip member for `pack_uri` as it is stored, |None| unless the package is a zip file."""
+        return None
+
     @classmethod
-    def factory(cls, pkg_file: str | IO[bytes]) -> _PhysPkgReader:
-        """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`."""
+    def factory(cls, pkg_file: str | IO[bytes], lazy: bool = False) -> _PhysPkgReader:
+        """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`.
+
+        When `lazy` is True, a zip package is read member-by-member from an open archive as each
+        member is requested rather than being read into memory all at once.
+        """
+        ZipPkgReaderCls = _LazyZipPkgReader if lazy else _ZipPkgReader
+
         # --- for pkg_file other than str, assume it's a stream and pass it to Zip
         # --- reader to sort out
         if not isinstance(pkg_file, str):
-            return _ZipPkgReader(pkg_file)
+            return ZipPkgReaderCls(pkg_file)
 
         # --- otherwise we treat `pkg_file` as a path ---
         if os.path.isdir(pkg_file):
             return _DirPkgReader(pkg_file)
 
         if zipfile.is_zipfile(pkg_file):
-            return _ZipPkgReader(pkg_file)
+            return ZipPkgReaderCls(pkg_file)
 
         raise PackageNotFoundError("Package not found at '%s'" % pkg_file)
 
@@ -168,6 +265,13 @@ class _DirPkgReader(_PhysPkgReader):
         except IOError:
             raise KeyError("no member '%s' in package" % pack_uri)
 
+    def __iter__(self) -> Iterator[PackURI]:
+        """Generate the pack-URI of each file under the package directory."""
+        for dirpath, _, filenames in os.walk(self._path):
+            for filename in filenames:
+                path = os.path.relpath(os.path.join(dirpath, filename), self._path)
+                yield PackURI("/%s" % path.replace(os.sep, "/"))
+
 
 class _ZipPkgReader(_PhysPkgReader):
     """Implements |PhysPkgReader| interface for a zip-file OPC package."""
@@ -188,37 +292,156 @@ class _ZipPkgReader(_PhysPkgReader):
             raise KeyError("no member '%s' in package" % pack_uri)
         return self._blobs[pack_uri]
 
+    def __iter__(self) -> Iterator[PackURI]:
+        """Generate the pack-URI of each member in the zip archive, in archive order."""
+        return iter(self._blobs)
+
+    def raw_member(self, pack_uri: PackURI) -> _RawMember | None:
+        """Zip member for `pack_uri` as it is stored, |None| if there is no such member."""
+        return self._raw_members.get(pack_uri)
+
     @lazyproperty
     def _blobs(self) -> dict[PackURI, bytes]:
         """dict mapping partname to package part binaries."""
+        return {pack_uri: blob for pack_uri, (blob, _) in self._members.items()}
+
+    @lazyproperty
+    def _raw_members(self) -> dict[PackURI, _RawMember]:
+        """dict mapping partname to package member as it is stored in the archive."""
+        return {
+            pack_uri: raw_member
+            for pack_uri, (_, raw_member) in self._members.items()
+            if raw_member is not None
+        }
+
+    @lazyproperty
+    def _members(self) -> dict[PackURI, tuple[bytes, _RawMember | None]]:
+        """dict mapping partname to (blob, raw member) pair, the archive is read in one pass.
+
+        Each member is read as it is stored and inflated here, so its compressed bytes can be kept
+        for a save that copies it unchanged. That costs memory: until a part is parsed or changed,
+        which drops its raw member, it holds both the compressed and the inflated bytes of a
+        deflated member (XML mostly). A stored member (media mostly) shares the same bytes. The
+        content-types item, always written afresh, keeps no raw member, nor does any member when
+        copying is not supported (see `_raw_members_supported()`).
+        """
+        members: dict[PackURI, tuple[bytes, _RawMember | None]] = {}
         with zipfile.ZipFile(self._pkg_file, "r") as z:
-            return {PackURI("/%s" % name): z.read(name) for name in z.namelist()}
+            if not _raw_members_supported():
+                for zinfo in z.infolist():
+                    members[PackURI("/%s" % zinfo.filename)] = (z.read(zinfo), None)
+                return members
+            for zinfo in z.infolist():
+                pack_uri = PackURI("/%s" % zinfo.filename)
+                data = _read_raw_member(z, zinfo)
+                members[pack_uri] = (
+                    _inflate(z, zinfo, data),
+                    None if pack_uri == CONTENT_TYPES_URI else _RawMember(zinfo, data),
+                )
+        return members
+
+
+class _LazyZipPkgReader(_ZipPkgReader):
+    """|_ZipPkgReader| subtype that reads each zip member only when it is requested.
+
+    The archive is held open for the life of the reader so a part that is never accessed is never
+    read, keeping peak memory in proportion to the parts actually used. The package file must
+    remain available and unchanged for as long as the reader is in use.
+    """
+
+    def __contains__(self, pack_uri: object) -> bool:
+        """Return True when part identified by `pack_uri` is present in zip archive."""
+        return pack_uri in self._membernames
+
+    def __getitem__(self, pack_uri: PackURI) -> bytes:
+        """Return bytes for part corresponding to `pack_uri`, read from the archive on each call.
+
+        Raises |KeyError| if no matching member is present in zip archive.
+        """
+        if pack_uri not in self._membernames:
+            raise KeyError("no member '%s' in package" % pack_uri)
+        return self._zipf.read(pack_uri.membername)
+
+    def __iter__(self) -> Iterator[PackURI]:
+        """Generate the pack-URI of each member in the zip archive, in archive order."""
+        return (PackURI("/%s" % name) for name in self._zipf.namelist())
+
+    def raw_member(self, pack_uri: PackURI) -> _RawMember | None:
+        """Zip member for `pack_uri`, its compressed bytes are only read when they are written."""
+        if pack_uri not in self._membernames or not _raw_members_supported():
+            return None
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        return _RawMember(zinfo, functools.partial(_read_raw_member, self._zipf, zinfo))
+
+    @lazyproperty
+    def _membernames(self) -> frozenset[PackURI]:
+        """Partname of each member in the archive, used to detect missing members without I/O."""
+        return frozenset(PackURI("/%s" % name) for name in self._zipf.namelist())
+
+    @lazyproperty
+    def _zipf(self) -> zipfile.ZipFile:
+        """`ZipFile` instance open for reading, closed when this reader is garbage-collected."""
+        return zipfile.ZipFile(self._pkg_file, "r")
 
 
 class _PhysPkgWriter:
     """Base class for physical package writer objects."""
 
     @classmethod
-    def factory(cls, pkg_file: str | IO[bytes]) -> _ZipPkgWriter:
+    def factory(
+        cls, pkg_file: str | IO[bytes], compresslevel: int | None = None, workers: int = 1
+    ) -> _ZipPkgWriter:
         """Return |_PhysPkgWriter| subtype instance appropriage for `pkg_file`.
 
         Currently the only subtype is `_ZipPkgWriter`, but a `_DirPkgWriter` could be implemented
         or even a `_StreamPkgWriter`.
         """
-        return _ZipPkgWriter(pkg_file)
+        return _ZipPkgWriter(pkg_file, compresslevel, workers)
 
-    def write(self, pack_uri: PackURI, blob: bytes) -> None:
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str | None = None) -> None:
         """Write `blob` to package with membername corresponding to `pack_uri`."""
         raise NotImplementedError(  # pragma: no cover
             f"`{type(self).__name__}` must implement `.write()`"
         )
 
+    def copy(self, pack_uri: PackURI, raw_member: _RawMember) -> None:
+        """Write `raw_member`, from the package parts were loaded from, as `pack_uri`."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.copy()`"
+        )
+
 
 class _ZipPkgWriter(_PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package.
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    A member whose content type is already compressed in its own format (JPEG, PNG, video, ...,
+    see `compressed_content_types`) is stored as it is. Everything else, XML mostly, is deflated at
+    `compresslevel`, 0 (fastest) to 9 (smallest), the zlib default when |None|.
+
+    When `workers` is more than 1, blobs are deflated in a pool of that many threads ahead of the
+    zip write, which stays sequential and in the order members are written. zlib releases the GIL
+    while it compresses, so this uses more than one core on a large package. At most a few blobs
+    per worker are held waiting to be written. Like copying a member, this needs
+    `_raw_members_supported()`, members are deflated one at a time as they are written otherwise.
+
+    A member copied from the package that was loaded is written as its compressed bytes, neither
+    inflated nor deflated.
+    """
+
+    def __init__(
+        self, pkg_file: str | IO[bytes], compresslevel: int | None = None, workers: int = 1
+    ):
         self._pkg_file = pkg_file
+        self._compresslevel = compresslevel
+        # -- a member deflated by a worker is written raw, like a copied one --
+        parallel = workers > 1 and _raw_members_supported()
+        self._executor = ThreadPoolExecutor(workers) if parallel else None
+        self._max_pending = 2 * workers
+        # -- (pack_uri, blob, deflated) in write order, `deflated` is None for a stored member
+        # -- and `blob` a |_RawMember| for a copied one
+        self._pending: collections.deque[
+            tuple[PackURI, bytes | _RawMember, Future[tuple[int, bytes]] | None]
+        ] = collections.deque()
 
     def __enter__(self) -> _ZipPkgWriter:
         """Enable use as a context-manager. Opening zip for writing happens here."""
@@ -229,20 +452,215 @@ class _ZipPkgWriter(_PhysPkgWriter):
 
         Closing flushes any pending physical writes and releasing any resources it's using.
         """
-        self._zipf.close()
+        try:
+            self._write_pending(0)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self._zipf.close()
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str | None = None) -> None:
+        """Write `blob` to zip package with membername corresponding to `pack_uri`.
 
-    def write(self, pack_uri: PackURI, blob: bytes) -> None:
-        """Write `blob` to zip package with membername corresponding to `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+        `content_type` is that of the part, when it is already compressed `blob` is stored rather
+        than deflated again.
+        """
+        compress = content_type not in compressed_content_types
+        if self._executor is None:
+            compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=compress_type)
+            return
+
+        deflated = self._executor.submit(_deflate, blob, self._compresslevel) if compress else None
+        self._pending.append((pack_uri, blob, deflated))
+        self._write_pending(self._max_pending)
+
+    def copy(self, pack_uri: PackURI, raw_member: _RawMember) -> None:
+        """Write `raw_member` as the member for `pack_uri`, compressed as it already is."""
+        if self._executor is None:
+            self._write_raw_copy(pack_uri, raw_member)
+            return
+
+        self._pending.append((pack_uri, raw_member, None))
+        self._write_pending(self._max_pending)
+
+    def _write_pending(self, keep: int) -> None:
+        """Write pending members, oldest first, until no more than `keep` remain."""
+        while len(self._pending) > keep:
+            pack_uri, blob, deflated = self._pending.popleft()
+            if isinstance(blob, _RawMember):
+                self._write_raw_copy(pack_uri, blob)
+                continue
+            if deflated is None:
+                self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+                continue
+            crc, data = deflated.result()
+            zinfo = zipfile.ZipInfo(pack_uri.membername, time.localtime(time.time())[:6])
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            zinfo.CRC, zinfo.file_size, zinfo.compress_size = crc, len(blob), len(data)
+            _write_raw_member(self._zipf, zinfo, data)
+
+    def _write_raw_copy(self, pack_uri: PackURI, raw_member: _RawMember) -> None:
+        """Write `raw_member` as the member for `pack_uri`, keeping its compression and time."""
+        source = raw_member.zinfo
+        zinfo = zipfile.ZipInfo(pack_uri.membername, source.date_time)
+        zinfo.compress_type = source.compress_type
+        zinfo.CRC, zinfo.file_size, zinfo.compress_size = (
+            source.CRC,
+            source.file_size,
+            source.compress_size,
+        )
+        _write_raw_member(self._zipf, zinfo, raw_member.data)
 
     @lazyproperty
     def _zipf(self) -> zipfile.ZipFile:
         """`ZipFile` instance open for writing."""
         return zipfile.ZipFile(
-            self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
+            self._pkg_file,
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=self._compresslevel,
+            strict_timestamps=False,
         )
 
 
+class _RawMember:
+    """A member of a zip package as it is stored there, compressed bytes and all.
+
+    `data` is those bytes or a callable that reads them. A part loaded from the member and not
+    changed since is saved by copying it, see |PackageWriter|.
+    """
+
+    def __init__(self, zinfo: zipfile.ZipInfo, data: bytes | Callable[[], bytes]):
+        self.zinfo = zinfo
+        self._data = data
+
+    @property
+    def data(self) -> bytes:
+        """Bytes of this member as they are stored in the archive, compressed unless stored."""
+        return self._data() if callable(self._data) else self._data
+
+
+def _deflate(blob: bytes, compresslevel: int | None) -> tuple[int, bytes]:
+    """Return (CRC-32, raw deflate stream) of `blob`, the way a zip member stores it."""
+    level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return zlib.crc32(blob), compressor.compress(blob) + compressor.flush()
+
+
+def _inflate(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes) -> bytes:
+    """Return the contents of member `zinfo` of `zipf`, given `data`, its bytes as stored."""
+    if zinfo.compress_type == zipfile.ZIP_STORED:
+        blob = data
+    elif zinfo.compress_type == zipfile.ZIP_DEFLATED:
+        blob = zlib.decompress(data, -zlib.MAX_WBITS)
+    else:
+        return zipf.read(zinfo)
+    if zlib.crc32(blob) != zinfo.CRC:
+        raise zipfile.BadZipFile("Bad CRC-32 for file %r" % zinfo.filename)
+    return blob
+
+
+def _read_raw_member(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo) -> bytes:
+    """Return the bytes of member `zinfo` of `zipf`, open for reading, as they are stored.
+
+    Like `_write_raw_member()`, this does what `ZipFile.open()` does without the decompression,
+    which `zipfile` offers no public API to skip.
+    """
+    with zipf._lock:  # pyright: ignore[reportAttributeAccessIssue]
+        fp = zipf.fp
+        assert fp is not None
+        fp.seek(zinfo.header_offset)
+        fheader = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+        if fheader[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:  # pyright: ignore
+            raise zipfile.BadZipFile("Bad magic number for file header")
+        fp.seek(
+            fheader[zipfile._FH_FILENAME_LENGTH]  # pyright: ignore
+            + fheader[zipfile._FH_EXTRA_FIELD_LENGTH],  # pyright: ignore
+            os.SEEK_CUR,
+        )
+        return fp.read(zinfo.compress_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _raw_members_supported() -> bool:
+    """True when zip members can be copied as they are stored with the `zipfile` of this Python.
+
+    `_read_raw_member()` and `_write_raw_member()` rely on `zipfile` internals a Python release is
+    free to change. So the first time it is needed, a member is copied through both, to a seekable
+    and to a non-seekable archive, and read back with the public API. When that fails, no raw
+    member is ever kept and every part is serialized and compressed on save instead.
+    """
+    blob = b"<p:sld/>" * 64
+    try:
+        source = io.BytesIO()
+        with zipfile.ZipFile(source, "w") as z:
+            z.writestr("ppt/slides/slide1.xml", blob, zipfile.ZIP_DEFLATED)
+        with zipfile.ZipFile(source) as z:
+            zinfo = z.getinfo("ppt/slides/slide1.xml")
+            raw_member = _RawMember(zinfo, _read_raw_member(z, zinfo))
+        sink = _ChunkSink()
+        for pkg_file in (io.BytesIO(), sink):
+            with _ZipPkgWriter(pkg_file) as phys_writer:
+                phys_writer._write_raw_copy(PackURI("/ppt/slides/slide2.xml"), raw_member)
+            if pkg_file is sink:
+                pkg_file = io.BytesIO(b"".join(sink.drain()))
+            with zipfile.ZipFile(pkg_file) as z:
+                if z.testzip() is not None or z.read("ppt/slides/slide2.xml") != blob:
+                    return False
+    except Exception:
+        return False
+    return True
+
+
+def _write_raw_member(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes) -> None:
+    """Append a member to `zipf`, open for writing, whose `data` is already compressed.
+
+    `zinfo` carries the compression method, CRC and both sizes of the member. `zipfile` has no
+    public API for this, so this does what `ZipFile.open(..., "w")` does when writing a member
+    without compressing `data` again.
+    """
+    if not zinfo.external_attr:
+        zinfo.external_attr = 0o600 << 16  # permissions: ?rw-------
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+    with zipf._lock:  # pyright: ignore[reportAttributeAccessIssue]
+        if zipf._seekable:  # pyright: ignore[reportAttributeAccessIssue]
+            zipf.fp.seek(zipf.start_dir)  # pyright: ignore
+        zinfo.header_offset = zipf.fp.tell()  # pyright: ignore
+        zipf._writecheck(zinfo)  # pyright: ignore[reportAttributeAccessIssue]
+        zipf._didModify = True  # pyright: ignore[reportAttributeAccessIssue]
+        zipf.fp.write(zinfo.FileHeader(zip64))  # pyright: ignore
+        zipf.fp.write(data)  # pyright: ignore
+        zipf.start_dir = zipf.fp.tell()  # pyright: ignore
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+class _ChunkSink:
+    """Write-only file-like object holding the bytes written to it until they are drained.
+
+    It is not seekable, so `zipfile` writes a zip file to it strictly front to back: a member whose
+    sizes are only known once its data is written gets a data descriptor after that data rather
+    than its sizes patched into its local header.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def drain(self) -> Iterator[bytes]:
+        """Generate each chunk written since the last drain, letting go of it."""
+        chunks, self._chunks = self._chunks, []
+        return iter(chunks)
+
+    def flush(self) -> None:
+        """Nothing is buffered beyond what is waiting to be drained."""
+
+    def write(self, data: bytes) -> int:
+        """Hold `data` until it is drained, `zipfile` writes whole headers and buffers."""
+        self._chunks.append(bytes(data))
+        return len(data)
+
+
 class _ContentTypesItem:
     """Composes content-types "part" ([Content_Types].xml) for a collection of parts."""
 
@@ -29,6 +29,30 @@ default_content_types = (
 )
 
 
+# -- content types whose bytes are already compressed in their own format. A zip package stores
+# -- these as they are, deflating them again costs time and gains next to nothing.
+compressed_content_types = frozenset(
+    (
+        CT.ASF,
+        CT.AVI,
+        CT.GIF,
+        CT.JPEG,
+        CT.MOV,
+        CT.MP4,
+        CT.MPG,
+        CT.MS_PHOTO,
+        CT.MS_VIDEO,
+        CT.PML_PRESENTATION,
+        CT.PNG,
+        CT.SML_SHEET,
+        CT.VIDEO,
+        CT.WML_DOCUMENT,
+        CT.WMV,
+        CT.X_MS_VIDEO,
+    )
+)
+
+
 image_content_types = {
     "bmp": CT.BMP,
     "emf": CT.X_EMF,
@@ -21,6 +21,9 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# -- same settings without the custom element classes, for XML that is only read --
+plain_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
 
 def parse_from_template(template_file_name: str):
     """Return an element loaded from the XML in the template file identified by `template_name`."""
@@ -36,6 +39,15 @@ def parse_xml(xml: str | bytes):
     return etree.fromstring(xml, oxml_parser)
 
 
+def parse_plain_xml(xml: str | bytes) -> etree._Element:
+    """Return root lxml element of `xml` parsed into plain lxml elements.
+
+    Building plain elements skips the custom element-class lookup, which is cheaper when the
+    caller only reads the XML and needs none of the `CT_*` element behaviors.
+    """
+    return etree.fromstring(xml, plain_parser)
+
+
 def register_element_cls(nsptagname: str, cls: Type[BaseOxmlElement]):
     """Register `cls` to be constructed when oxml parser encounters element having `nsptag_name`.
 
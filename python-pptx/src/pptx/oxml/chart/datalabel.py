@@ -173,7 +173,7 @@ class CT_DLbls(BaseOxmlElement):
         Return the `c:dLbl` child representing the label for the data point
         at index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dLbl[c:idx[@val=$idx]]", idx=str(idx))
         if matches:
             return matches[0]
         return None
@@ -183,7 +183,7 @@ class CT_DLbls(BaseOxmlElement):
         Return the `c:dLbl` element representing the label of the point at
         index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dLbl[c:idx[@val=$idx]]", idx=str(idx))
         if matches:
             return matches[0]
         return self._insert_dLbl_in_sequence(idx)
@@ -16,8 +16,11 @@ from pptx.oxml.xmlchemy import (
     OptionalAttribute,
     ZeroOrMore,
     ZeroOrOne,
+    compiled_xpath,
 )
 
+_sers = compiled_xpath("./c:ser")
+
 
 class BaseChartElement(BaseOxmlElement):
     """
@@ -89,7 +92,7 @@ class BaseChartElement(BaseOxmlElement):
         def ser_order(ser):
             return ser.order.val
 
-        return (ser for ser in sorted(self.xpath("./c:ser"), key=ser_order))
+        return (ser for ser in sorted(_sers(self), key=ser_order))
 
     @property
     def sers(self):
@@ -99,9 +99,27 @@ class CT_NumDataSource(BaseOxmlElement):
         Return the Y value for data point *idx* in this cache, or None if no
         value is present for that data point.
         """
-        results = self.xpath(".//c:pt[@idx=%d]" % idx)
+        results = self.xpath(".//c:pt[@idx=$idx]", idx=idx)
         return results[0].value if results else None
 
+    @property
+    def pt_vs(self):
+        """
+        Return a list containing the Y value of each data point in this
+        cache, in idx order, with None in the position of a data point having
+        no value. The list is built in a single pass over the `c:pt`
+        elements, so reading all values is linear in the number of points
+        rather than requiring a search per point as :meth:`pt_v` does.
+        """
+        pt_count = self.ptCount_val
+        values = [None] * pt_count
+        # ---reversed so the first `c:pt` for an idx wins, as it does in pt_v()---
+        for pt in reversed(self.xpath(".//c:pt")):
+            idx = pt.idx
+            if idx < pt_count:
+                values[idx] = pt.value
+        return values
+
 
 class CT_SeriesComposite(BaseOxmlElement):
     """
@@ -196,7 +214,7 @@ class CT_SeriesComposite(BaseOxmlElement):
         Return the `c:dPt` child representing the visual properties of the
         data point at index *idx*.
         """
-        matches = self.xpath('c:dPt[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dPt[c:idx[@val=$idx]]", idx=str(idx))
         if matches:
             return matches[0]
         dPt = self._add_dPt()
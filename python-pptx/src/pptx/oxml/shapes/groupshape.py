@@ -12,7 +12,7 @@ from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement
-from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
+from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne, compiled_xpath
 from pptx.util import Emu
 
 if TYPE_CHECKING:
@@ -20,6 +20,9 @@ if TYPE_CHECKING:
     from pptx.oxml.shapes import ShapeElement
     from pptx.oxml.shapes.shared import CT_Transform2D
 
+# -- every @id in the document, XML id-values have document scope --
+_id_values = compiled_xpath("//@id")
+
 
 class CT_GroupShape(BaseShapeElement):
     """Used for shape tree (`p:spTree`) as well as the group shape (`p:grpSp`) elements."""
@@ -66,23 +69,19 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(cxnSp, "p:extLst")
         return cxnSp
 
-    def add_freeform_sp(self, x: int, y: int, cx: int, cy: int) -> CT_Shape:
-        """Append a new freeform `p:sp` with specified position and size."""
-        shape_id = self._next_shape_id
-        name = "Freeform %d" % (shape_id - 1,)
-        sp = CT_Shape.new_freeform_sp(shape_id, name, x, y, cx, cy)
+    def add_freeform_sp(self, id_: int, name: str, x: int, y: int, cx: int, cy: int) -> CT_Shape:
+        """Append a new freeform `p:sp` with specified id, name, position and size."""
+        sp = CT_Shape.new_freeform_sp(id_, name, x, y, cx, cy)
         self.insert_element_before(sp, "p:extLst")
         return sp
 
-    def add_grpSp(self) -> CT_GroupShape:
+    def add_grpSp(self, id_: int, name: str) -> CT_GroupShape:
         """Return `p:grpSp` element newly appended to this shape tree.
 
         The element contains no sub-shapes, is positioned at (0, 0), and has
         width and height of zero.
         """
-        shape_id = self._next_shape_id
-        name = "Group %d" % (shape_id - 1,)
-        grpSp = CT_GroupShape.new_grpSp(shape_id, name)
+        grpSp = CT_GroupShape.new_grpSp(id_, name)
         self.insert_element_before(grpSp, "p:extLst")
         return grpSp
 
@@ -158,7 +157,7 @@ class CT_GroupShape(BaseShapeElement):
         In practice, its minimum value is 1 because the spTree element itself
         is always assigned id="1".
         """
-        id_str_lst = self.xpath("//@id")
+        id_str_lst = _id_values(self)
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
         return max(used_ids) if used_ids else 0
 
@@ -233,21 +232,6 @@ class CT_GroupShape(BaseShapeElement):
 
         return x, y, cx, cy
 
-    @property
-    def _next_shape_id(self) -> int:
-        """Return unique shape id suitable for use with a new shape element.
-
-        The returned id is the next available positive integer drawing object
-        id in shape tree, starting from 1 and making use of any gaps in
-        numbering. In practice, the minimum id is 2 because the spTree
-        element itself is always assigned id="1".
-        """
-        id_str_lst = self.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids) + 2):
-            if n not in used_ids:
-                return n
-
 
 class CT_GroupShapeNonVisual(BaseShapeElement):
     """`p:nvGrpSpPr` element."""
@@ -27,6 +27,7 @@ from pptx.oxml.xmlchemy import (
     RequiredAttribute,
     ZeroOrOne,
     ZeroOrOneChoice,
+    compiled_xpath,
 )
 from pptx.util import Emu
 
@@ -35,6 +36,14 @@ if TYPE_CHECKING:
     from pptx.oxml.shapes.autoshape import CT_CustomGeometry2D, CT_PresetGeometry2D
     from pptx.util import Length
 
+# -- precompiled, these are evaluated for every shape a slide is read or laid out from --
+_nvXxPr = compiled_xpath("./*[1]")
+_ph = compiled_xpath("./*[1]/p:nvPr/p:ph")
+_xfrm_cx = compiled_xpath("./a:xfrm/a:ext/@cx")
+_xfrm_cy = compiled_xpath("./a:xfrm/a:ext/@cy")
+_xfrm_x = compiled_xpath("./a:xfrm/a:off/@x")
+_xfrm_y = compiled_xpath("./a:xfrm/a:off/@y")
+
 
 class BaseShapeElement(BaseOxmlElement):
     """Provides common behavior for shape element classes like CT_Shape, CT_Picture, etc."""
@@ -92,7 +101,7 @@ class BaseShapeElement(BaseOxmlElement):
     @property
     def ph(self) -> CT_Placeholder | None:
         """The `p:ph` descendant element if there is one, None otherwise."""
-        ph_elms = self.xpath("./*[1]/p:nvPr/p:ph")
+        ph_elms = _ph(self)
         if len(ph_elms) == 0:
             return None
         return ph_elms[0]
@@ -204,7 +213,7 @@ class BaseShapeElement(BaseOxmlElement):
         name depends on the shape type, e.g. `p:nvPicPr` for picture
         shape.
         """
-        return self.xpath("./*[1]")[0]
+        return _nvXxPr(self)[0]
 
     def _get_xfrm_attr(self, name: str) -> Length | None:
         xfrm = self.xfrm
@@ -400,7 +409,7 @@ class CT_ShapeProperties(BaseOxmlElement):
         """
         Shape width as an instance of Emu, or None if not present.
         """
-        cx_str_lst = self.xpath("./a:xfrm/a:ext/@cx")
+        cx_str_lst = _xfrm_cx(self)
         if not cx_str_lst:
             return None
         return Emu(cx_str_lst[0])
@@ -410,7 +419,7 @@ class CT_ShapeProperties(BaseOxmlElement):
         """
         Shape height as an instance of Emu, or None if not present.
         """
-        cy_str_lst = self.xpath("./a:xfrm/a:ext/@cy")
+        cy_str_lst = _xfrm_cy(self)
         if not cy_str_lst:
             return None
         return Emu(cy_str_lst[0])
@@ -421,7 +430,7 @@ class CT_ShapeProperties(BaseOxmlElement):
 
         0 if not present.
         """
-        x_str_lst = self.xpath("./a:xfrm/a:off/@x")
+        x_str_lst = _xfrm_x(self)
         if not x_str_lst:
             return None
         return Emu(x_str_lst[0])
@@ -432,7 +441,7 @@ class CT_ShapeProperties(BaseOxmlElement):
         The offset of the top of the shape from the top of the slide, as an
         instance of Emu. None if not present.
         """
-        y_str_lst = self.xpath("./a:xfrm/a:off/@y")
+        y_str_lst = _xfrm_y(self)
         if not y_str_lst:
             return None
         return Emu(y_str_lst[0])
@@ -19,6 +19,7 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    compiled_xpath,
 )
 from pptx.util import Emu, lazyproperty
 
@@ -173,6 +174,9 @@ class CT_Table(BaseOxmlElement):
         )
 
 
+_ancestor_tbl = compiled_xpath("ancestor::a:tbl")
+
+
 class CT_TableCell(BaseOxmlElement):
     """`a:tc` custom element class"""
 
@@ -328,7 +332,7 @@ class CT_TableCell(BaseOxmlElement):
     @property
     def tbl(self) -> CT_Table:
         """Table element this cell belongs to."""
-        return cast(CT_Table, self.xpath("ancestor::a:tbl")[0])
+        return cast(CT_Table, _ancestor_tbl(self)[0])
 
     @property
     def text(self) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any, Callable, Iterable, Protocol, Sequence, Type, cast
 
@@ -32,6 +33,18 @@ class AttributeType(Protocol):
         ...
 
 
+@functools.lru_cache(maxsize=1024)
+def compiled_xpath(xpath_str: str) -> etree.XPath:
+    """Return a compiled |etree.XPath| evaluator for `xpath_str`, bound to the Open XML namespaces.
+
+    Evaluators are cached by expression, so each one is compiled once per process rather than on
+    every call. Call the result with the context element, e.g. `evaluator(spTree)`, passing values
+    that vary between calls as XPath variables (`$name`) rather than formatting them into the
+    expression, which would compile, and cache, a new evaluator for every value.
+    """
+    return etree.XPath(xpath_str, namespaces=_nsmap)
+
+
 def OxmlElement(nsptag_str: str, nsmap: dict[str, str] | None = None) -> BaseOxmlElement:
     """Return a "loose" lxml element having the tag specified by `nsptag_str`.
 
@@ -705,12 +718,16 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str: str) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+    def xpath(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, xpath_str: str, **variables: Any
+    ) -> Any:
         """Override of `lxml` _Element.xpath() method.
 
-        Provides standard Open XML namespace mapping (`nsmap`) in centralized location.
+        Provides standard Open XML namespace mapping (`nsmap`) in centralized location and
+        evaluates `xpath_str` with its cached compiled evaluator (see :func:`compiled_xpath`).
+        `variables` are bound to the `$name` references in the expression.
         """
-        return super().xpath(xpath_str, namespaces=_nsmap)
+        return compiled_xpath(xpath_str)(self, **variables)
 
     @property
     def _nsptag(self) -> str:
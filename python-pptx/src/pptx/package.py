@@ -49,27 +49,9 @@ class Package(OpcPackage):
         """Return a |PackURI| instance representing the next available image partname.
 
         Partname uses the next available sequence number. *ext* is used as the extention on the
-        returned partname.
-        """
-
-        def first_available_image_idx():
-            image_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if (
-                        part.partname.startswith("/ppt/media/image")
-                        and part.partname.idx is not None
-                    )
-                ]
-            )
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs) + 1
-
-        idx = first_available_image_idx()
+        returned partname. The sequence number is reserved, so each call returns a new partname.
+        """
+        idx = self._image_partname_idxs.next_available()
         return PackURI("/ppt/media/image%d.%s" % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -77,24 +59,10 @@ class Package(OpcPackage):
 
         Partname is first available, starting at sequence number 1. Empty
         sequence numbers are reused. *ext* is used as the extension on the
-        returned partname.
-        """
-
-        def first_available_media_idx():
-            media_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/media")
-                ]
-            )
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs) + 1
-
-        idx = first_available_media_idx()
+        returned partname. The sequence number is reserved, so each call
+        returns a new partname.
+        """
+        idx = self._media_partname_idxs.next_available()
         return PackURI("/ppt/media/media%d.%s" % (idx, ext))
 
     @property
@@ -112,6 +80,11 @@ class Package(OpcPackage):
         """
         return _ImageParts(self)
 
+    @lazyproperty
+    def _image_partname_idxs(self) -> _PartnameIdxs:
+        """|_PartnameIdxs| object allocating the sequence numbers of image partnames."""
+        return _PartnameIdxs(self, "/ppt/media/image")
+
     @lazyproperty
     def _media_parts(self):
         """Return |_MediaParts| object for this package.
@@ -121,6 +94,11 @@ class Package(OpcPackage):
         """
         return _MediaParts(self)
 
+    @lazyproperty
+    def _media_partname_idxs(self) -> _PartnameIdxs:
+        """|_PartnameIdxs| object allocating the sequence numbers of media partnames."""
+        return _PartnameIdxs(self, "/ppt/media/media")
+
 
 class _ImageParts(object):
     """Provides access to the image parts in a package."""
@@ -128,6 +106,7 @@ class _ImageParts(object):
     def __init__(self, package):
         super(_ImageParts, self).__init__()
         self._package = package
+        self._size_index: dict[int, list[ImagePart]] | None = None
 
     def __iter__(self) -> Iterator[ImagePart]:
         """Generate a reference to each |ImagePart| object in the package."""
@@ -151,19 +130,34 @@ class _ImageParts(object):
         that instance is returned, otherwise a new image part is created.
         """
         image = Image.from_file(image_file)
-        image_part = self._find_by_sha1(image.sha1)
-        return image_part if image_part else ImagePart.new(self._package, image)
-
-    def _find_by_sha1(self, sha1: str) -> ImagePart | None:
+        blob_size = len(image.blob)
+        image_part = self._find_by_sha1(image.sha1, blob_size)
+        if image_part is None:
+            image_part = ImagePart.new(self._package, image)
+            if self._size_index is not None:
+                self._size_index.setdefault(blob_size, []).append(image_part)
+        return image_part
+
+    def _find_by_sha1(self, sha1: str, blob_size: int) -> ImagePart | None:
         """
         Return an |ImagePart| object belonging to this package or |None| if
         no matching image part is found. The image part is identified by the
-        SHA1 hash digest of the image binary it contains.
+        SHA1 hash digest of the image binary it contains, `blob_size` bytes long.
+
+        The image parts are indexed by binary size on the first call, so looking up each of many
+        images walks the package only once, and only an image part of the same size is hashed.
+        In a package opened lazily, the other images are not even read. Parts added by this
+        object are added to the index.
         """
-        for image_part in self:
-            # ---skip unknown/unsupported image types, like SVG---
-            if not hasattr(image_part, "sha1"):
-                continue
+        if self._size_index is None:
+            index: dict[int, list[ImagePart]] = {}
+            for image_part in self:
+                # ---skip unknown/unsupported image types, like SVG---
+                if not isinstance(image_part, ImagePart):
+                    continue
+                index.setdefault(image_part.blob_size, []).append(image_part)
+            self._size_index = index
+        for image_part in self._size_index.get(blob_size, ()):
             if image_part.sha1 == sha1:
                 return image_part
         return None
@@ -179,6 +173,7 @@ class _MediaParts(object):
     def __init__(self, package):
         super(_MediaParts, self).__init__()
         self._package = package
+        self._sha1_index = None
 
     def __iter__(self):
         """Generate a reference to each |MediaPart| object in the package."""
@@ -207,6 +202,8 @@ class _MediaParts(object):
         media_part = self._find_by_sha1(media.sha1)
         if media_part is None:
             media_part = MediaPart.new(self._package, media)
+            if self._sha1_index is not None:
+                self._sha1_index[media.sha1] = media_part
         return media_part
 
     def _find_by_sha1(self, sha1):
@@ -214,9 +211,46 @@ class _MediaParts(object):
 
         All media parts belonging to this package are considered. A media
         part is identified by the SHA1 hash digest of its bytestream
-        ("file").
+        ("file"). The media parts are indexed by SHA1 on the first call and
+        parts added by this object are added to the index.
         """
-        for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
-        return None
+        if self._sha1_index is None:
+            index = {}
+            for media_part in self:
+                index.setdefault(media_part.sha1, media_part)
+            self._sha1_index = index
+        return self._sha1_index.get(sha1)
+
+
+class _PartnameIdxs(object):
+    """Sequence numbers in use by the partnames starting with `prefix`, like "/ppt/media/image".
+
+    The numbers are collected from the package parts on the first call to :meth:`next_available`
+    and updated as numbers are handed out, so allocating a partname for each of many new parts
+    walks the package only once.
+    """
+
+    def __init__(self, package: Package, prefix: str):
+        super(_PartnameIdxs, self).__init__()
+        self._package = package
+        self._prefix = prefix
+        self._idxs: set[int] | None = None
+        self._lowest_free = 1
+
+    def next_available(self) -> int:
+        """Reserve and return the lowest sequence number not in use, starting at 1.
+
+        Gaps in the numbering of the parts present at the first call are filled first.
+        """
+        if self._idxs is None:
+            self._idxs = {
+                part.partname.idx
+                for part in self._package.iter_parts()
+                if part.partname.startswith(self._prefix) and part.partname.idx is not None
+            }
+        idx = self._lowest_free
+        while idx in self._idxs:
+            idx += 1
+        self._idxs.add(idx)
+        self._lowest_free = idx + 1
+        return idx
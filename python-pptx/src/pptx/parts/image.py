@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import io
 import os
+import struct
 from typing import IO, TYPE_CHECKING, Any, cast
 
 from PIL import Image as PIL_Image
@@ -69,11 +70,12 @@ class ImagePart(Part):
         """File-name extension for this image e.g. `'png'`."""
         return self.partname.ext
 
-    @property
+    @lazyproperty
     def image(self) -> Image:
         """An |Image| object containing the image in this image part.
 
-        Note this is a `pptx.image.Image` object, not a PIL Image.
+        Note this is a `pptx.image.Image` object, not a PIL Image. The same object is returned on
+        each access, so the image header is only parsed once per part.
         """
         return Image(self._blob, self.desc)
 
@@ -111,11 +113,23 @@ class ImagePart(Part):
         """
         return hashlib.sha1(self._blob).hexdigest()
 
+    @property
+    def blob_size(self) -> int:
+        """Length in bytes of the image binary of this image part.
+
+        While the binary of a lazily loaded part is not read yet, this is the size recorded for
+        the zip member it will be read from, so sizing up the images in a package reads none of
+        them.
+        """
+        raw_member = self._raw_member
+        if self._blob_loader is not None and raw_member is not None:
+            return raw_member.zinfo.file_size
+        return len(self.blob)
+
     @property
     def _dpi(self) -> tuple[int, int]:
         """(horz_dpi, vert_dpi) pair representing the dots-per-inch resolution of this image."""
-        image = Image.from_blob(self._blob)
-        return image.dpi
+        return self.image.dpi
 
     @property
     def _native_size(self) -> tuple[Length, Length]:
@@ -135,8 +149,7 @@ class ImagePart(Part):
     @property
     def _px_size(self) -> tuple[int, int]:
         """A (width, height) 2-tuple representing the dimensions of this image in pixels."""
-        image = Image.from_blob(self._blob)
-        return image.size
+        return self.image.size
 
 
 class Image(object):
@@ -262,7 +275,14 @@ class Image(object):
 
     @lazyproperty
     def _pil_props(self) -> tuple[str | None, tuple[int, int], tuple[int, int] | None]:
-        """tuple of image properties extracted from this image using Pillow."""
+        """tuple of image properties (format, px-size, dpi) as Pillow reports them.
+
+        PNG and JPEG properties are read straight from the header bytes, other formats (and
+        headers the parser doesn't handle, like JPEG with EXIF) are opened with Pillow.
+        """
+        props = _header_props(self._blob)
+        if props is not None:
+            return props
         stream = io.BytesIO(self._blob)
         pil_image = PIL_Image.open(stream)  # pyright: ignore[reportUnknownMemberType]
         format = pil_image.format
@@ -273,3 +293,93 @@ class Image(object):
         )
         stream.close()
         return (format, (width_px, height_px), dpi)
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# -- JPEG markers that carry no length field --
+_JPEG_STANDALONE_MARKERS = frozenset([0x01] + list(range(0xD0, 0xD8)))
+
+# -- start-of-frame markers, those holding the image size --
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _header_props(blob: bytes) -> tuple[str, tuple[int, int], tuple[float, float] | None] | None:
+    """Return (format, px-size, dpi) parsed from the header of the image in `blob`.
+
+    Matches what Pillow reports for the same image, without constructing a Pillow image. |None|
+    is returned when `blob` is not a PNG or JPEG image or holds something this parser leaves to
+    Pillow.
+    """
+    try:
+        if blob.startswith(_PNG_SIGNATURE):
+            return _png_header_props(blob)
+        if blob.startswith(b"\xff\xd8\xff"):
+            return _jpeg_header_props(blob)
+    except (struct.error, IndexError):
+        pass
+    return None
+
+
+def _png_header_props(blob: bytes) -> tuple[str, tuple[int, int], tuple[float, float] | None]:
+    """Return (format, px-size, dpi) of PNG image in `blob`, read from its IHDR and pHYs chunks."""
+    width, height = struct.unpack_from(">II", blob, 16)
+    dpi = None
+    offset = 8
+    while True:
+        length, chunk_type = struct.unpack_from(">I4s", blob, offset)
+        # -- pHYs, if present, comes before the first IDAT chunk --
+        if chunk_type in (b"IDAT", b"IEND"):
+            break
+        if chunk_type == b"pHYs":
+            horz_ppm, vert_ppm, unit = struct.unpack_from(">IIB", blob, offset + 8)
+            # -- unit 1 is pixels-per-meter, 0 means aspect ratio only --
+            if unit == 1:
+                dpi = horz_ppm * 0.0254, vert_ppm * 0.0254
+        offset += 12 + length
+    return "PNG", (width, height), dpi
+
+
+def _jpeg_header_props(
+    blob: bytes,
+) -> tuple[str, tuple[int, int], tuple[float, float] | None] | None:
+    """Return (format, px-size, dpi) of JPEG image in `blob`, read from its JFIF and SOF markers.
+
+    |None| is returned for a JPEG carrying an EXIF or MPF segment; Pillow takes the dpi from EXIF
+    when JFIF has none and reports an MPF image as "MPO".
+    """
+    size = None
+    dpi = None
+    offset = 2
+    while True:
+        if blob[offset] != 0xFF:
+            return None
+        marker = blob[offset + 1]
+        if marker == 0xFF:  # -- fill byte --
+            offset += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        if marker == 0xDA:  # -- start of scan, header is complete --
+            break
+        (length,) = struct.unpack_from(">H", blob, offset + 2)
+        segment = blob[offset + 4 : offset + 2 + length]
+        if marker == 0xE0 and segment.startswith(b"JFIF"):
+            unit = segment[7]
+            density = struct.unpack_from(">HH", segment, 8)
+            if unit == 1:
+                dpi = density
+            elif unit == 2:  # -- dots per cm --
+                dpi = tuple(d * 2.54 for d in density)
+        elif (marker == 0xE1 and segment.startswith(b"Exif")) or (
+            marker == 0xE2 and segment.startswith(b"MP\x00")
+        ):
+            return None
+        elif marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from(">HH", segment, 1)
+            size = (width, height)
+        offset += 2 + length
+    if size is None:
+        return None
+    return "JPEG", size, dpi
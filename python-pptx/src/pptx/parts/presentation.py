@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterable
+from typing import IO, TYPE_CHECKING, Iterable, Iterator
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import XmlPart
@@ -51,6 +51,13 @@ class PresentationPart(XmlPart):
                 return self.related_part(sldId.rId).slide
         return None
 
+    def iter_bytes(self, compresslevel: int | None = None, workers: int = 1) -> Iterator[bytes]:
+        """Generate this presentation package as a .pptx file, a chunk of bytes at a time.
+
+        `compresslevel` and `workers` are as for |Presentation.save|.
+        """
+        return self.package.iter_bytes(compresslevel, workers)
+
     @lazyproperty
     def notes_master(self) -> NotesMaster:
         """
@@ -103,13 +110,15 @@ class PresentationPart(XmlPart):
             slide_part = self.related_part(rId)
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def save(
+        self, path_or_stream: str | IO[bytes], compresslevel: int | None = None, workers: int = 1
+    ):
         """Save this presentation package to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. `compresslevel` and `workers` are as for |Presentation.save|.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, compresslevel, workers)
 
     def slide_id(self, slide_part):
         """Return the slide-id associated with `slide_part`."""
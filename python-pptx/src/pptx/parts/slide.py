@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Iterable, cast
 
 from pptx.enum.shapes import PROG_ID
 from pptx.opc.constants import CONTENT_TYPE as CT
@@ -20,7 +20,9 @@ if TYPE_CHECKING:
     from pptx.chart.data import ChartData
     from pptx.enum.chart import XL_CHART_TYPE
     from pptx.media import Video
+    from pptx.oxml.shapes.groupshape import CT_GroupShape
     from pptx.parts.image import Image, ImagePart
+    from pptx.shapes.base import BaseShape
 
 
 class BaseSlidePart(XmlPart):
@@ -56,6 +58,24 @@ class BaseSlidePart(XmlPart):
         """Internal name of this slide."""
         return self._element.cSld.name
 
+    @lazyproperty
+    def shape_allocator(self) -> _ShapeAllocator:
+        """|_ShapeAllocator| handing out ids and placeholder names for shapes added to this part.
+
+        Shared by every shape collection on this slide, however many |Slide| or shapes objects are
+        used to add shapes to it.
+        """
+        return _ShapeAllocator(self._element.cSld.spTree)
+
+    @lazyproperty
+    def placeholder_index(self) -> _PlaceholderIndex:
+        """|_PlaceholderIndex| of the placeholders in this part, by `idx` or type.
+
+        Shared by every placeholder collection on this part, so the placeholders a slide inherits
+        position and size from are looked up in constant time.
+        """
+        return _PlaceholderIndex()
+
 
 class NotesMasterPart(BaseSlidePart):
     """Notes master part.
@@ -295,3 +315,93 @@ class SlideMasterPart(BaseSlidePart):
         The |SlideMaster| object representing this part.
         """
         return SlideMaster(self._element, self)
+
+
+class _ShapeAllocator:
+    """Allocates unique shape ids and placeholder names for the shapes added to a slide part.
+
+    Finding an unused id or name means collecting every `@id` or `p:cNvPr/@name` in the part into
+    Python objects, which made adding each shape slower than the last. The allocator does that once
+    and then keeps track of the largest id and the names in use as it hands them out, so each id or
+    name takes the same time however many shapes the part has.
+
+    It does not look at the part again by itself. Code that changes ids or names without it tells
+    it so: :meth:`reserve` for an id, :meth:`note_name` for a shape renamed, and :meth:`reset`
+    when XML that can hold either is inserted, like shapes moved over from another part or the
+    `p:cTn` ids of a movie.
+    """
+
+    def __init__(self, spTree: CT_GroupShape):
+        self._spTree = spTree
+        self._max_id: int | None = None
+        self._names: set[str] = set()
+
+    def next_id(self) -> int:
+        """Return a shape id one greater than any id used so far in the part."""
+        self._max_id = self._sync() + 1
+        return self._max_id
+
+    def next_name(self, basename: str, numpart: int) -> str:
+        """Return the first name of the form "`basename` `n`" not in use, starting at `numpart`."""
+        self._sync()
+        name = "%s %d" % (basename, numpart)
+        while name in self._names:
+            numpart += 1
+            name = "%s %d" % (basename, numpart)
+        self._names.add(name)
+        return name
+
+    def note_name(self, name: str) -> None:
+        """Record that a shape in the part was given `name` without using `next_name()`."""
+        self._names.add(name)
+
+    def reserve(self, shape_id: int) -> None:
+        """Record that `shape_id` was assigned to a new shape without using `next_id()`."""
+        self._max_id = max(self._sync(), shape_id)
+
+    def reset(self) -> None:
+        """Discard what is known about the part, it is scanned again on the next call."""
+        self._max_id = None
+
+    def _sync(self) -> int:
+        """Return the largest id in use, scanning the part first when that is not known."""
+        if self._max_id is None:
+            self._max_id = self._spTree.max_shape_id
+            self._names = set(self._spTree.xpath("//p:cNvPr/@name"))
+        return self._max_id
+
+
+class _PlaceholderIndex:
+    """Placeholders of a slide part by the key they are looked up by, `idx` on a layout and type
+    on a master.
+
+    Built from the placeholder collection on first lookup, then every lookup, including one for a
+    key no placeholder has, is answered from it. Code that adds, removes or moves placeholders in
+    the part calls :meth:`reset` so it is built again on the next lookup. A placeholder found to
+    have left the part does the same, which covers one replaced or deleted through lxml.
+    """
+
+    def __init__(self):
+        self._placeholders: dict[object, BaseShape] | None = None
+
+    def lookup(
+        self,
+        key: object,
+        default: BaseShape | None,
+        placeholders: Iterable[tuple[object, BaseShape]],
+    ) -> BaseShape | None:
+        """The first placeholder indexed under `key`, or `default` if there is none.
+
+        `placeholders` generates a (key, placeholder) pair for each placeholder in the part, in
+        document order. It is only iterated when the index needs to be built.
+        """
+        if self._placeholders is None:
+            index: dict[object, BaseShape] = {}
+            for placeholder_key, placeholder in placeholders:
+                index.setdefault(placeholder_key, placeholder)
+            self._placeholders = index
+        return self._placeholders.get(key, default)
+
+    def reset(self) -> None:
+        """Discard the index, it is built again on the next lookup."""
+        self._placeholders = None
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Iterator, cast
 
 from pptx.shared import PartElementProxy
 from pptx.slide import SlideMasters, Slides
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from lxml import etree
+
+    from pptx.opc.package import XmlPart, _Relationships  # pyright: ignore[reportPrivateUsage]
     from pptx.oxml.presentation import CT_Presentation, CT_SlideId
     from pptx.parts.presentation import PresentationPart
     from pptx.slide import NotesMaster, SlideLayouts
@@ -33,6 +36,31 @@ class Presentation(PartElementProxy):
         """
         return self.part.core_properties
 
+    def iter_bytes(self, compresslevel: int | None = None, workers: int = 1) -> Iterator[bytes]:
+        """Generate this presentation as a .pptx file, a chunk of bytes at a time.
+
+        Each chunk is produced as soon as the part it belongs to is written, so the file can be
+        sent (as an HTTP response body, to a pipe, ...) while it is being written and is never
+        all in memory at once. `compresslevel` and `workers` are as for :meth:`save`.
+        """
+        return self.part.iter_bytes(compresslevel, workers)
+
+    def iter_slide_elements(self) -> Iterator[tuple[int, etree._Element, _Relationships]]:
+        """Generate (idx, element, rels) for each slide in this presentation, in slide order.
+
+        `element` is the root `p:sld` element of the slide XML and `rels` its relationships,
+        mapping each rId in that XML to the part or URL it refers to. This is for extraction code
+        that walks the slide XML itself: no |Slide| object is built and `element` is made of
+        plain lxml elements, quicker to parse, that must not be changed. See
+        :meth:`.XmlPart.scan_element`.
+        """
+        sldIdLst = self._element.sldIdLst
+        if sldIdLst is None:
+            return
+        for idx, sldId in enumerate(sldIdLst.sldId_lst):
+            slide_part = cast("XmlPart", self.part.related_part(sldId.rId))
+            yield idx, slide_part.scan_element(), slide_part.rels
+
     @property
     def notes_master(self) -> NotesMaster:
         """Instance of |NotesMaster| for this presentation.
@@ -42,12 +70,19 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file: str | IO[bytes]):
+    def save(self, file: str | IO[bytes], compresslevel: int | None = None, workers: int = 1):
         """Writes this presentation to `file`.
 
-        `file` can be either a file-path or a file-like object open for writing bytes.
+        `file` can be either a file-path or a file-like object open for writing bytes. The
+        file-like object need not be seekable (a pipe or socket will do), see also
+        :meth:`iter_bytes`.
+
+        Images, video and other parts already compressed in their own format are stored as they
+        are, the XML parts are deflated at `compresslevel`: 0 (fastest) to 9 (smallest), the zlib
+        default (6) when |None|. With `workers` greater than 1, the XML parts are compressed in
+        that many threads while the file is written.
         """
-        self.part.save(file)
+        self.part.save(file, compresslevel, workers)
 
     @property
     def slide_height(self) -> Length | None:
@@ -109,5 +144,7 @@ class Presentation(PartElementProxy):
     def slides(self):
         """|Slides| object containing the slides in this presentation."""
         sldIdLst = self._element.get_or_add_sldIdLst()
-        self.part.rename_slide_parts([cast("CT_SlideId", sldId).rId for sldId in sldIdLst])
+        # -- slide partnames only need to follow slide order in a package that gets saved --
+        if not self.part.package.read_only:
+            self.part.rename_slide_parts([cast("CT_SlideId", sldId).rId for sldId in sldIdLst])
         return Slides(sldIdLst, self)
@@ -130,6 +130,7 @@ class BaseShape(object):
     @name.setter
     def name(self, value: str):
         self._element._nvXxPr.cNvPr.name = value  # pyright: ignore[reportPrivateUsage]
+        self.part.shape_allocator.note_name(value)
 
     @property
     def part(self) -> BaseSlidePart:
@@ -155,8 +155,10 @@ class FreeformBuilder(Sequence[DrawingOperation]):
         of the local coordinates origin on the slide.
         """
         spTree = self._shapes._spTree  # pyright: ignore[reportPrivateUsage]
+        id_ = self._shapes._next_shape_id  # pyright: ignore[reportPrivateUsage]
+        name = "Freeform %d" % (id_ - 1,)
         return spTree.add_freeform_sp(
-            origin_x + self._left, origin_y + self._top, self._width, self._height
+            id_, name, origin_x + self._left, origin_y + self._top, self._width, self._height
         )
 
     def _add_line_segment(self, x: float, y: float) -> None:
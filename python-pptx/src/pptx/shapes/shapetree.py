@@ -44,7 +44,7 @@ if TYPE_CHECKING:
     from pptx.oxml.shapes.connector import CT_Connector
     from pptx.oxml.shapes.groupshape import CT_GroupShape
     from pptx.parts.image import ImagePart
-    from pptx.parts.slide import SlidePart
+    from pptx.parts.slide import BaseSlidePart, SlidePart
     from pptx.slide import Slide, SlideLayout
     from pptx.types import ProvidesPart
     from pptx.util import Length
@@ -83,7 +83,7 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree: CT_GroupShape, parent: ProvidesPart):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
+        self._turbo_add_enabled = False
 
     def __getitem__(self, idx: int) -> BaseShape:
         """Return shape at `idx` in sequence, e.g. `shapes[2]`."""
@@ -115,6 +115,7 @@ class _BaseShapes(ParentedElementProxy):
         id_ = self._next_shape_id
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
+        self._placeholder_index.reset()
 
     def ph_basename(self, ph_type: PP_PLACEHOLDER) -> str:
         """Return the base name for a placeholder of `ph_type` in this shape collection.
@@ -144,26 +145,16 @@ class _BaseShapes(ParentedElementProxy):
     def turbo_add_enabled(self) -> bool:
         """True if "turbo-add" mode is enabled. Read/Write.
 
-        EXPERIMENTAL: This feature can radically improve performance when adding large numbers
-        (hundreds of shapes) to a slide. It works by caching the last shape ID used and
-        incrementing that value to assign the next shape id. This avoids repeatedly searching all
-        shape ids in the slide each time a new ID is required.
-
-        Performance is not noticeably improved for a slide with a relatively small number of
-        shapes, but because the search time rises with the square of the shape count, this option
-        can be useful for optimizing generation of a slide composed of many shapes.
-
-        Shape-id collisions can occur (causing a repair error on load) if more than one |Slide|
-        object is used to interact with the same slide in the presentation. Note that the |Slides|
-        collection creates a new |Slide| object each time a slide is accessed (e.g. `slide =
-        prs.slides[0]`, so you must be careful to limit use to a single |Slide| object.
+        DEPRECATED: Assigning this property no longer has any effect and it will be removed in a
+        future release. Shape ids are now always assigned by the slide part, which keeps track of
+        the ids in use, so adding a shape takes the same time however many shapes the slide
+        already has, and ids stay unique no matter how many |Slide| objects are used to add them.
         """
-        return self._cached_max_shape_id is not None
+        return self._turbo_add_enabled
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value: bool):
-        enable = bool(value)
-        self._cached_max_shape_id = self._spTree.max_shape_id if enable else None
+        self._turbo_add_enabled = bool(value)
 
     @staticmethod
     def _is_member_elm(shape_elm: ShapeElement) -> bool:
@@ -194,15 +185,7 @@ class _BaseShapes(ParentedElementProxy):
             basename = "Vertical %s" % basename
 
         # increment numpart as necessary to make name unique
-        numpart = id - 1
-        names = self._spTree.xpath("//p:cNvPr/@name")
-        while True:
-            name = "%s %d" % (basename, numpart)
-            if name not in names:
-                break
-            numpart += 1
-
-        return name
+        return self._shape_allocator.next_name(basename, id - 1)
 
     @property
     def _next_shape_id(self) -> int:
@@ -211,12 +194,17 @@ class _BaseShapes(ParentedElementProxy):
         The returned id is 1 greater than the maximum shape id used so far. In practice, the
         minimum id is 2 because the spTree element is always assigned id="1".
         """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
+        return self._shape_allocator.next_id()
+
+    @property
+    def _placeholder_index(self):
+        """Placeholder index of the part this shape tree belongs to, shared by its collections."""
+        return cast("BaseSlidePart", self.part).placeholder_index
 
-        return self._spTree.max_shape_id + 1
+    @property
+    def _shape_allocator(self):
+        """Allocator of the part this shape tree belongs to, shared by all its shape trees."""
+        return cast("BaseSlidePart", self.part).shape_allocator
 
     def _shape_factory(self, shape_elm: ShapeElement) -> BaseShape:
         """Return an instance of the appropriate shape proxy class for `shape_elm`."""
@@ -284,13 +272,20 @@ class _BaseGroupShapes(_BaseShapes):
         a shape is added to it.
         """
         shapes = tuple(shapes)
-        grpSp = self._element.add_grpSp()
+        id_ = self._next_shape_id
+        grpSp = self._element.add_grpSp(id_, "Group %d" % (id_ - 1,))
         for shape in shapes:
             grpSp.insert_element_before(
                 shape._element, "p:extLst"  # pyright: ignore[reportPrivateUsage]
             )
         if shapes:
             grpSp.recalculate_extents()
+        # -- shapes moved over from another part bring ids and names the allocator has not seen --
+        if any(shape.part is not self.part for shape in shapes):
+            self._shape_allocator.reset()
+        # -- a placeholder moved into the group is no longer one of its tree's placeholders --
+        for part in {shape.part for shape in shapes}:
+            part.placeholder_index.reset()
         return cast(GroupShape, self._shape_factory(grpSp))
 
     def add_ole_object(
@@ -584,6 +579,8 @@ class SlideShapes(_BaseGroupShapes):
         )
         self._spTree.append(movie_pic)
         self._add_video_timing(movie_pic)
+        # -- new p:cTn/@id values count as used ids too, the part needs to be looked at again --
+        self._shape_allocator.reset()
         return cast(GraphicFrame, self._shape_factory(movie_pic))
 
     def add_table(
@@ -707,11 +704,36 @@ class BasePlaceholders(_BaseShapes):
     :method:`_shape_factory` to use custom placeholder classes.
     """
 
+    @staticmethod
+    def _index_key(placeholder: BaseShape) -> object:
+        """Value `placeholder` is looked up by, its `idx` on a layout and its type on a master."""
+        raise NotImplementedError("`_index_key()` must be implemented by all subclasses.")
+
     @staticmethod
     def _is_member_elm(shape_elm: ShapeElement) -> bool:
         """True if `shape_elm` is a placeholder shape, False otherwise."""
         return shape_elm.has_ph_elm
 
+    def _lookup(self, key: object, default: BaseShape | None) -> BaseShape | None:
+        """The first placeholder indexed under `key`, or `default` if there is none.
+
+        Inherited position and size are resolved through these lookups, once for every access to
+        `left`, `top`, `width` or `height` on a placeholder that doesn't override them, so they are
+        answered from the index the part keeps rather than by scanning this tree each time. A
+        placeholder found there that is no longer in this tree resets the index.
+        """
+        index = self._placeholder_index
+        placeholder = index.lookup(key, default, self._iter_keyed_placeholders())
+        if placeholder is not default and placeholder.element.getparent() is not self._spTree:
+            index.reset()
+            placeholder = index.lookup(key, default, self._iter_keyed_placeholders())
+        return placeholder
+
+    def _iter_keyed_placeholders(self) -> Iterator[tuple[object, BaseShape]]:
+        """Generate a (key, placeholder) pair for each placeholder in this tree, in order."""
+        for placeholder in self:
+            yield self._index_key(placeholder), placeholder
+
 
 class LayoutPlaceholders(BasePlaceholders):
     """Sequence of |LayoutPlaceholder| instance for each placeholder shape on a slide layout."""
@@ -722,10 +744,12 @@ class LayoutPlaceholders(BasePlaceholders):
 
     def get(self, idx: int, default: LayoutPlaceholder | None = None) -> LayoutPlaceholder | None:
         """The first placeholder shape with matching `idx` value, or `default` if not found."""
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        return cast("LayoutPlaceholder | None", self._lookup(idx, default))
+
+    @staticmethod
+    def _index_key(placeholder: BaseShape) -> object:
+        """Layout placeholders are looked up by their `idx` value."""
+        return placeholder.element.ph_idx
 
     def _shape_factory(self, shape_elm: ShapeElement) -> BaseShape:
         """Return an instance of the appropriate shape proxy class for `shape_elm`."""
@@ -744,10 +768,12 @@ class MasterPlaceholders(BasePlaceholders):
 
         Returns `default` if no such placeholder shape is present in the collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        return cast("MasterPlaceholder | None", self._lookup(ph_type, default))
+
+    @staticmethod
+    def _index_key(placeholder: BaseShape) -> object:
+        """Master placeholders are looked up by their type, e.g. `PP_PLACEHOLDER.BODY`."""
+        return cast(MasterPlaceholder, placeholder).ph_type
 
     def _shape_factory(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, placeholder_elm: CT_Shape
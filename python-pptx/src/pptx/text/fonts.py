@@ -47,6 +47,8 @@ class FontFiles(object):
             return cls._os_x_font_directories()
         if sys.platform.startswith("win32"):
             return cls._windows_font_directories()
+        if sys.platform.startswith("linux"):
+            return cls._linux_font_directories()
         raise OSError("unsupported operating system")
 
     @classmethod
@@ -66,6 +68,20 @@ class FontFiles(object):
                 with _Font.open(path) as f:
                     yield ((f.family_name, f.is_bold, f.is_italic), path)
 
+    @classmethod
+    def _linux_font_directories(cls):
+        """
+        Return a sequence of directory paths on Linux in which fonts are
+        likely to be located, following the fontconfig defaults.
+        """
+        linux_font_dirs = ["/usr/share/fonts", "/usr/local/share/fonts"]
+        home = os.environ.get("HOME")
+        if home is not None:
+            linux_font_dirs.extend(
+                [os.path.join(home, ".local", "share", "fonts"), os.path.join(home, ".fonts")]
+            )
+        return linux_font_dirs
+
     @classmethod
     def _os_x_font_directories(cls):
         """
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 
 from PIL import ImageFont
 
+from pptx.util import lazyproperty
+
 if TYPE_CHECKING:
     from pptx.util import Length
 
@@ -40,33 +42,6 @@ class TextFitter(tuple):
         sizes = _BinarySearchTree.from_ordered_sequence(range(1, int(max_size) + 1))
         return sizes.find_max(predicate)
 
-    def _break_line(self, line_source, point_size):
-        """
-        Return a (line, remainder) pair where *line* is the longest line in
-        *line_source* that will fit in this fitter's width and *remainder* is
-        a |_LineSource| object containing the text following the break point.
-        """
-        lines = _BinarySearchTree.from_ordered_sequence(line_source)
-        predicate = self._fits_in_width_predicate(point_size)
-        return lines.find_max(predicate)
-
-    def _fits_in_width_predicate(self, point_size):
-        """
-        Return a function taking a text string value and returns |True| if
-        that text fits in this fitter when rendered at *point_size*. Used as
-        predicate for _break_line()
-        """
-
-        def predicate(line):
-            """
-            Return |True| if *line* fits in this fitter when rendered at
-            *point_size*.
-            """
-            cx = _rendered_size(line.text, point_size, self._font_file)[0]
-            return cx <= self._width
-
-        return predicate
-
     @property
     def _fits_inside_predicate(self):
         """Return  function taking an integer point size argument.
@@ -82,7 +57,9 @@ class TextFitter(tuple):
             when rendered at `point_size` using the font defined in `font_file`.
             """
             text_lines = self._wrap_lines(self._line_source, point_size)
-            cy = _rendered_size("Ty", point_size, self._font_file)[1]
+            if text_lines is None:
+                return False
+            cy = _TextMeasurer.measurer(self._font_file, point_size).line_height
             return (cy * len(text_lines)) <= self._height
 
         return predicate
@@ -107,12 +84,24 @@ class TextFitter(tuple):
         """
         Return a sequence of str values representing the text in
         *line_source* wrapped within this fitter when rendered at
-        *point_size*.
+        *point_size*, or |None| when a word is too wide to fit on a line
+        of its own.
+
+        Lines are filled greedily in a single pass over the words. Each line
+        break is first estimated from cached per-word widths and then settled
+        by measuring the actual line, so the result matches measuring every
+        candidate line while rendering only two or three strings per line.
         """
-        text, remainder = self._break_line(line_source, point_size)
-        lines = [text]
-        if remainder:
-            lines.extend(self._wrap_lines(remainder, point_size))
+        measurer = _TextMeasurer.measurer(self._font_file, point_size)
+        words = line_source.words
+        lines = []
+        start = 0
+        while start < len(words):
+            end = measurer.break_index(words, start, self._width)
+            if end == start:
+                return None
+            lines.append(" ".join(words[start:end]))
+            start = end
         return lines
 
 
@@ -257,6 +246,13 @@ class _LineSource(object):
     def __repr__(self):
         return "<_LineSource('%s')>" % self._text
 
+    @property
+    def words(self):
+        """
+        The whitespace-separated words of this line source, as a list of str.
+        """
+        return self._text.split()
+
 
 class _Line(tuple):
     """
@@ -303,6 +299,94 @@ class _Fonts(object):
         return cls.fonts[(font_path, point_size)]
 
 
+class _TextMeasurer(object):
+    """
+    Measures text rendered in one font at one point size, caching the width
+    of each word it has measured.
+
+    Word widths are font advances, so a line width estimated by summing them
+    can be a little off from its rendered extents; :meth:`break_index` only
+    uses the estimate to find where to start measuring.
+    """
+
+    measurers = {}
+
+    # ---bounds the word cache of a long-running process fitting lots of text---
+    max_cached_words = 10000
+
+    def __init__(self, font_file, point_size):
+        self._font_file = font_file
+        self._point_size = point_size
+        self._word_widths = {}
+
+    @classmethod
+    def measurer(cls, font_file, point_size):
+        """
+        Return the memoized |_TextMeasurer| for *font_file* at *point_size*.
+        """
+        key = (font_file, point_size)
+        if key not in cls.measurers:
+            cls.measurers[key] = cls(font_file, point_size)
+        return cls.measurers[key]
+
+    def break_index(self, words, start, width):
+        """
+        Return the index just past the last word of the longest line that
+        starts at ``words[start]`` and fits in *width* EMU when rendered.
+        Returns *start* when not even that first word fits.
+        """
+        end = start
+        line_width = -self._space_width
+        for word in words[start:]:
+            line_width += self._space_width + self._word_width(word)
+            if line_width > width:
+                break
+            end += 1
+
+        if end > start and not self._fits(words, start, end, width):
+            end -= 1
+            while end > start and not self._fits(words, start, end, width):
+                end -= 1
+        else:
+            while end < len(words) and self._fits(words, start, end + 1, width):
+                end += 1
+        return end
+
+    @lazyproperty
+    def line_height(self):
+        """
+        Height in EMU of a line of text, as the rendered height of "Ty".
+        """
+        return _rendered_size("Ty", self._point_size, self._font_file)[1]
+
+    def _fits(self, words, start, end, width):
+        text = " ".join(words[start:end])
+        return _rendered_size(text, self._point_size, self._font_file)[0] <= width
+
+    @lazyproperty
+    def _space_width(self):
+        return self._advance_width(" ")
+
+    def _word_width(self, word):
+        if word not in self._word_widths:
+            if len(self._word_widths) >= self.max_cached_words:
+                self._word_widths.clear()
+            self._word_widths[word] = self._advance_width(word)
+        return self._word_widths[word]
+
+    def _advance_width(self, text):
+        """
+        Advance width in EMU of *text*, the distance the pen moves rendering it.
+        """
+        font = _Fonts.font(self._font_file, self._point_size)
+        try:
+            px_width = font.getlength(text)
+        except AttributeError:
+            # ---Pillow < 8---
+            px_width = font.getsize(text)[0]
+        return int(px_width / 72.0 * 914400)
+
+
 def _rendered_size(text, point_size, font_file):
     """
     Return a (width, height) pair representing the size of *text* in English
@@ -214,6 +214,15 @@ class DescribeCategoryLevel(object):
         Category_.assert_called_once_with(pt)
         assert category is category_
 
+    def it_can_iterate_over_the_categories_it_contains(self):
+        lvl = element('c:lvl/(c:pt{idx=0}/c:v"a",c:pt{idx=2}/c:v"c")')
+        category_level = CategoryLevel(lvl)
+
+        categories = list(category_level)
+
+        assert categories == ["a", "c"]
+        assert [c.idx for c in categories] == [0, 2]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[0, 1, 2])
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import math
+
 import pytest
 
 from pptx.chart.datalabel import DataLabels
@@ -107,6 +109,14 @@ class Describe_BaseCategorySeries(object):
         series, expected_value = values_get_fixture
         assert series.values == expected_value
 
+    def it_provides_its_values_as_an_array(self, values_get_fixture):
+        series, expected_value = values_get_fixture
+
+        values_array = series.values_array
+
+        assert values_array.typecode == "d"
+        assert [None if math.isnan(v) else v for v in values_array] == list(expected_value)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(
@@ -162,6 +172,11 @@ class Describe_BaseCategorySeries(object):
                 '3.3",c:pt{idx=0}/c:v"1.1")',
                 (1.1, None, 3.3),
             ),
+            (
+                'c:ser/c:val/c:numRef/c:numCache/(c:ptCount{val=2},c:pt{idx=0}/c:v"'
+                '1.1",c:pt{idx=0}/c:v"9.9",c:pt{idx=2}/c:v"3.3")',
+                (1.1, None),
+            ),
         ]
     )
     def values_get_fixture(self, request):
@@ -402,6 +417,14 @@ class Describe_XySeries(object):
         series, expected_values = values_get_fixture
         assert series.values == expected_values
 
+    def it_provides_its_values_as_an_array(self, values_get_fixture):
+        series, expected_values = values_get_fixture
+
+        values_array = series.values_array
+
+        assert values_array.typecode == "d"
+        assert [None if math.isnan(v) else v for v in values_array] == list(expected_values)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
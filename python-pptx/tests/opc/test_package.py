@@ -27,6 +27,7 @@ from pptx.opc.package import (
     _Relationships,
 )
 from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import PackageReader, _RawMember
 from pptx.oxml import parse_xml
 from pptx.parts.presentation import PresentationPart
 
@@ -140,10 +141,38 @@ class DescribeOpcPackage:
 
         package = OpcPackage.open("package.pptx")
 
-        _init_.assert_called_once_with(ANY, "package.pptx")
+        _init_.assert_called_once_with(ANY, "package.pptx", False, False)
         _load_.assert_called_once_with(ANY)
         assert package is package_
 
+    def and_it_can_open_a_pkg_file_lazily(self, request):
+        _init_ = initializer_mock(request, OpcPackage)
+        method_mock(request, OpcPackage, "_load")
+
+        OpcPackage.open("package.pptx", lazy=True)
+
+        _init_.assert_called_once_with(ANY, "package.pptx", True, False)
+
+    def and_it_can_open_a_pkg_file_read_only(self, request):
+        _init_ = initializer_mock(request, OpcPackage)
+        method_mock(request, OpcPackage, "_load")
+
+        OpcPackage.open("package.pptx", read_only=True)
+
+        _init_.assert_called_once_with(ANY, "package.pptx", False, True)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_value"),
+        [
+            ({}, (False, False)),
+            ({"lazy": True}, (True, False)),
+            ({"read_only": True}, (True, True)),
+        ],
+    )
+    def it_knows_whether_it_is_lazy_and_read_only(self, kwargs: dict[str, Any], expected_value):
+        package = OpcPackage(None, **kwargs)
+        assert (package._lazy, package.read_only) == expected_value
+
     def it_can_drop_a_relationship(self, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
 
@@ -254,7 +283,29 @@ class DescribeOpcPackage:
 
         package.save("prs.pptx")
 
-        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_)
+        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_, None, 1)
+
+    def and_it_can_save_with_a_compression_level_and_workers(
+        self, request, _rels_prop_, relationships_
+    ):
+        _rels_prop_.return_value = relationships_
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(()))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+
+        OpcPackage(None).save("prs.pptx", compresslevel=1, workers=4)
+
+        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, (), 1, 4)
+
+    def it_can_generate_its_pkg_file_as_it_is_written(self, request, _rels_prop_, relationships_):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(3))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+
+        chunks = OpcPackage(None).iter_bytes(compresslevel=1)
+
+        PackageWriter_.iter_write.assert_called_once_with(relationships_, parts_, 1, 1)
+        assert chunks is PackageWriter_.iter_write.return_value
 
     def it_loads_the_pkg_file_to_help(self, request, _rels_prop_, relationships_):
         _PackageLoader_ = class_mock(request, "pptx.opc.package._PackageLoader")
@@ -264,7 +315,7 @@ class DescribeOpcPackage:
 
         return_value = package._load()
 
-        _PackageLoader_.load.assert_called_once_with("prs.pptx", package)
+        _PackageLoader_.load.assert_called_once_with("prs.pptx", package, False, False)
         relationships_.load_from_xml.assert_called_once_with(
             PACKAGE_URI, "pkg-rels-xml", {"partname": "part"}
         )
@@ -307,33 +358,153 @@ class Describe_PackageLoader:
 
         pkg_xml_rels, parts = _PackageLoader.load("prs.pptx", package_)
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", package_)
+        _init_.assert_called_once_with(ANY, "prs.pptx", package_, False, False)
         _load_.assert_called_once_with(ANY)
         assert pkg_xml_rels is pkg_xml_rels_
         assert parts == {"partname": "part"}
 
     def it_loads_the_package_to_help(self, request, _xml_rels_prop_):
         parts_ = {
-            "partname_%d" % n: instance_mock(request, Part, partname="partname_%d" % n)
+            PackURI("/partname_%d" % n): instance_mock(
+                request, Part, partname=PackURI("/partname_%d" % n)
+            )
             for n in range(1, 4)
         }
         property_mock(request, _PackageLoader, "_parts", return_value=parts_)
         rels_ = dict(
             itertools.chain(
                 (("/", instance_mock(request, _Relationships)),),
-                (("partname_%d" % n, instance_mock(request, _Relationships)) for n in range(1, 4)),
+                (
+                    (PackURI("/partname_%d" % n), instance_mock(request, _Relationships))
+                    for n in range(1, 4)
+                ),
             )
         )
         _xml_rels_prop_.return_value = rels_
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.raw_member_for.side_effect = lambda partname: "raw %s" % partname
+        property_mock(request, _PackageLoader, "_package_reader", return_value=package_reader_)
         package_loader = _PackageLoader(None, None)
 
         pkg_xml_rels, parts = package_loader._load()
 
         for part_ in parts_.values():
-            part_.load_rels_from_xml.assert_called_once_with(rels_[part_.partname], parts_)
+            part_.load_rels_from_xml.assert_called_once_with(
+                rels_[part_.partname], parts_, "raw %s" % part_.partname.rels_uri
+            )
         assert pkg_xml_rels is rels_["/"]
         assert parts is parts_
 
+    def but_it_defers_parsing_part_rels_when_loading_read_only(self, request):
+        parts_ = {PackURI("/partname_%d" % n): instance_mock(request, Part) for n in range(1, 3)}
+        property_mock(request, _PackageLoader, "_parts", return_value=parts_)
+        _xml_rels_prop_ = property_mock(request, _PackageLoader, "_xml_rels")
+        _xml_rels_for_ = method_mock(
+            request,
+            _PackageLoader,
+            "_xml_rels_for",
+            side_effect=lambda self, partname: "rels of %s" % partname,
+        )
+        package_loader = _PackageLoader(None, None, read_only=True)
+
+        pkg_xml_rels, parts = package_loader._load()
+
+        _xml_rels_prop_.assert_not_called()
+        _xml_rels_for_.assert_called_once_with(package_loader, "/")
+        for partname, part_ in parts_.items():
+            xml_rels_loader, parts_arg = part_.load_rels_lazily.call_args.args
+            assert parts_arg is parts_
+            assert xml_rels_loader() == "rels of %s" % partname
+        assert pkg_xml_rels == "rels of /"
+        assert parts is parts_
+
+    def it_defers_reading_part_blobs_when_loading_lazily(self, request, package_):
+        blobs = {
+            PackURI("/ppt/media/image1.png"): b"png-bytes",
+            PackURI("/docProps/thumbnail.jpeg"): b"jpeg-bytes",
+        }
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__contains__.side_effect = blobs.__contains__
+        package_reader_.__getitem__.side_effect = blobs.__getitem__
+        property_mock(request, _PackageLoader, "_package_reader", return_value=package_reader_)
+        property_mock(
+            request,
+            _PackageLoader,
+            "_content_types",
+            return_value=dict.fromkeys(blobs, CT.PNG),
+        )
+        _xml_rels_prop_ = property_mock(request, _PackageLoader, "_xml_rels")
+        _xml_rels_prop_.return_value = {"/": None, **dict.fromkeys(blobs)}
+        PartFactory_ = class_mock(request, "pptx.opc.package.PartFactory")
+        package_loader = _PackageLoader(None, package_, lazy=True)
+
+        parts = package_loader._parts
+
+        assert PartFactory_.call_count == 0
+        assert PartFactory_.load_lazily.call_count == 2
+        for partname, call_ in zip(blobs, PartFactory_.load_lazily.call_args_list):
+            assert call_.args == (partname, CT.PNG, package_)
+            assert call_.kwargs["blob_loader"]() == blobs[partname]
+        assert list(parts) == list(blobs)
+
+    def and_it_keeps_the_zip_member_each_part_was_loaded_from(self, request, package_):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__contains__.return_value = True
+        package_reader_.raw_member_for.side_effect = lambda partname: "raw %s" % partname
+        property_mock(request, _PackageLoader, "_package_reader", return_value=package_reader_)
+        property_mock(
+            request, _PackageLoader, "_content_types", return_value=collections.defaultdict(str)
+        )
+        _xml_rels_prop_ = property_mock(request, _PackageLoader, "_xml_rels")
+        _xml_rels_prop_.return_value = dict.fromkeys(("/", "/ppt/slides/slide1.xml", "/a.png"))
+        PartFactory_ = class_mock(request, "pptx.opc.package.PartFactory")
+        PartFactory_.side_effect = lambda partname, *args, **kwargs: Part(partname, "", package_)
+        package_loader = _PackageLoader(None, package_)
+
+        parts = package_loader._parts
+
+        assert {p: part._raw_member for p, part in parts.items()} == {
+            "/ppt/slides/slide1.xml": "raw /ppt/slides/slide1.xml",
+            "/a.png": "raw /a.png",
+        }
+
+    def it_takes_each_package_member_with_a_content_type_as_a_part_when_read_only(
+        self, request, package_
+    ):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__iter__.return_value = iter(
+            PackURI(uri)
+            for uri in (
+                "/[Content_Types].xml",
+                "/_rels/.rels",
+                "/ppt/presentation.xml",
+                "/ppt/_rels/presentation.xml.rels",
+                "/ppt/",
+                "/ppt/media/image1.png",
+            )
+        )
+        property_mock(request, _PackageLoader, "_package_reader", return_value=package_reader_)
+        content_types = {
+            PackURI("/_rels/.rels"): CT.OPC_RELATIONSHIPS,
+            PackURI("/ppt/presentation.xml"): CT.PML_PRESENTATION_MAIN,
+            PackURI("/ppt/_rels/presentation.xml.rels"): CT.OPC_RELATIONSHIPS,
+            PackURI("/ppt/media/image1.png"): CT.PNG,
+        }
+        property_mock(request, _PackageLoader, "_content_types", return_value=content_types)
+        _xml_rels_prop_ = property_mock(request, _PackageLoader, "_xml_rels")
+        PartFactory_ = class_mock(request, "pptx.opc.package.PartFactory")
+        package_loader = _PackageLoader(None, package_, read_only=True)
+
+        parts = package_loader._parts
+
+        _xml_rels_prop_.assert_not_called()
+        assert [c.args[:3] for c in PartFactory_.load_lazily.call_args_list] == [
+            ("/ppt/presentation.xml", CT.PML_PRESENTATION_MAIN, package_),
+            ("/ppt/media/image1.png", CT.PNG, package_),
+        ]
+        assert list(parts) == ["/ppt/presentation.xml", "/ppt/media/image1.png"]
+        package_reader_.raw_member_for.assert_not_called()
+
     def it_loads_the_xml_relationships_from_the_package_to_help(self, request):
         pkg_xml_rels = parse_xml(snippet_bytes("package-rels-xml"))
         prs_xml_rels = parse_xml(snippet_bytes("presentation-rels-xml"))
@@ -397,6 +568,16 @@ class DescribePart:
         _init_.assert_called_once_with(part, partname_, CT.PML_SLIDE, package_, b"blob")
         assert isinstance(part, Part)
 
+    def it_can_be_constructed_to_load_its_blob_lazily(self, request, package_):
+        blob_loader_ = Mock(name="blob_loader_", return_value=b"blob")
+
+        part = Part.load_lazily(PackURI("/ppt/media/image1.png"), CT.PNG, package_, blob_loader_)
+
+        assert blob_loader_.call_count == 0
+        assert part.blob == b"blob"
+        assert part.blob == b"blob"
+        blob_loader_.assert_called_once_with()
+
     def it_uses_the_load_blob_as_its_blob(self):
         assert Part(None, None, None, b"blob").blob == b"blob"
 
@@ -405,6 +586,14 @@ class DescribePart:
         part.blob = b"new-blob"
         assert part.blob == b"new-blob"
 
+    def and_it_is_no_longer_saved_as_a_copy_of_its_zip_member_when_it_does(self):
+        part = Part(None, None, None, b"old-blob")
+        part._raw_member = "raw-member"
+
+        part.blob = b"new-blob"
+
+        assert part._raw_member is None
+
     def it_knows_its_content_type(self):
         assert Part(None, CT.PML_SLIDE, None).content_type == CT.PML_SLIDE
 
@@ -423,6 +612,16 @@ class DescribePart:
         property_mock(request, Part, "_rels", return_value=relationships_)
         assert Part(None, None, None).rels is relationships_
 
+    def it_can_load_its_relationships_lazily(self, request, relationships_):
+        property_mock(request, Part, "_rels", return_value=relationships_)
+        xml_rels_loader_ = Mock(name="xml_rels_loader_")
+        parts = {"/ppt/slides/slide1.xml": "part"}
+        part = Part(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None)
+
+        part.load_rels_lazily(xml_rels_loader_, parts)
+
+        relationships_.load_lazily.assert_called_once_with("/ppt/slides", xml_rels_loader_, parts)
+
     def it_can_load_a_blob_from_a_file_path_to_help(self):
         path = absjoin(test_file_dir, "minimal.pptx")
         with open(path, "rb") as f:
@@ -462,16 +661,72 @@ class DescribeXmlPart:
 
     def it_can_be_constructed_by_PartFactory(self, request):
         partname = PackURI("/ppt/slides/slide1.xml")
-        element_ = element("p:sld")
         package_ = instance_mock(request, OpcPackage)
-        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
         _init_ = initializer_mock(request, XmlPart)
 
         part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
 
-        parse_xml_.assert_called_once_with(b"blob")
-        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element_)
+        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element=None)
         assert isinstance(part, XmlPart)
+        assert part._blob == b"blob"
+
+    def and_it_parses_its_xml_only_when_its_element_is_first_accessed(self, request):
+        element_ = element("p:sld")
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, b"<p:sld/>")
+
+        parse_xml_.assert_not_called()
+        assert part._element is element_
+        assert part._element is element_
+        parse_xml_.assert_called_once_with(b"<p:sld/>")
+        assert part._blob is None
+
+    def and_it_reads_its_xml_only_then_when_loaded_lazily(self, request):
+        blob_loader_ = Mock(name="blob_loader_", return_value=b"<p:sld/>")
+        element_ = element("p:sld")
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+
+        part = XmlPart.load_lazily(
+            PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, blob_loader_
+        )
+
+        blob_loader_.assert_not_called()
+        assert part._element is element_
+        blob_loader_.assert_called_once_with()
+        parse_xml_.assert_called_once_with(b"<p:sld/>")
+
+    def it_gives_back_the_xml_it_was_loaded_with_while_that_is_not_parsed(self, request):
+        serialize_part_xml_ = function_mock(request, "pptx.opc.package.serialize_part_xml")
+        part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, b"<p:sld/>")
+
+        blob = part.blob
+
+        serialize_part_xml_.assert_not_called()
+        assert blob == b"<p:sld/>"
+
+    def it_can_parse_its_xml_into_plain_elements_for_reading(self, request):
+        parse_plain_xml_ = function_mock(
+            request, "pptx.opc.package.parse_plain_xml", side_effect=lambda xml: element("p:sld")
+        )
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
+        part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, b"<p:sld/>")
+        part._raw_member = "raw"
+
+        sld = part.scan_element()
+
+        assert sld is not part.scan_element()
+        assert parse_plain_xml_.call_args_list == [call(b"<p:sld/>"), call(b"<p:sld/>")]
+        parse_xml_.assert_not_called()
+        assert part._blob == b"<p:sld/>"
+        assert part._raw_member == "raw"
+
+    def but_it_gives_its_element_once_that_is_parsed(self, request):
+        parse_plain_xml_ = function_mock(request, "pptx.opc.package.parse_plain_xml")
+        sld = element("p:sld")
+        part = XmlPart(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, sld)
+
+        assert part.scan_element() is sld
+        parse_plain_xml_.assert_not_called()
 
     def it_can_serialize_to_xml(self, request):
         element_ = element("p:sld")
@@ -500,6 +755,16 @@ class DescribeXmlPart:
         xml_part = XmlPart(None, None, None, None)
         assert xml_part.part is xml_part
 
+    def it_is_no_longer_saved_as_a_copy_of_its_zip_member_once_its_xml_is_accessed(self):
+        sld = element("p:sld")
+        xml_part = XmlPart(None, None, None, sld)
+        xml_part._raw_member = "raw-member"
+
+        assert xml_part.partname is None
+        assert xml_part._raw_member == "raw-member"
+        assert xml_part._element is sld
+        assert xml_part._raw_member is None
+
     # -- fixtures ----------------------------------------------------
 
     @pytest.fixture
@@ -533,6 +798,21 @@ class DescribePartFactory:
         Part_.load.assert_called_once_with(partname, CT.OFC_VML_DRAWING, package_, b"blob")
         assert part is part_
 
+    def it_can_construct_a_part_that_loads_its_blob_lazily(self, request, package_, part_):
+        Part_ = class_mock(request, "pptx.opc.package.Part")
+        Part_.load_lazily.return_value = part_
+        partname = PackURI("/ppt/drawings/vmlDrawing1.vml")
+
+        def blob_loader():
+            return b"blob"
+
+        part = PartFactory.load_lazily(partname, CT.OFC_VML_DRAWING, package_, blob_loader)
+
+        Part_.load_lazily.assert_called_once_with(
+            partname, CT.OFC_VML_DRAWING, package_, blob_loader
+        )
+        assert part is part_
+
     # fixtures components ----------------------------------
 
     @pytest.fixture
@@ -711,6 +991,69 @@ class Describe_Relationships:
         ]
         assert relationships._rels == {"rId1": rels_[0], "rId2": rels_[1]}
 
+    def it_keeps_the_rels_item_it_was_loaded_from_while_it_describes_it(self, request):
+        parts = {
+            PackURI("/ppt/slideLayouts/slideLayout1.xml"): Part(
+                PackURI("/ppt/slideLayouts/slideLayout1.xml"), CT.PML_SLIDE_LAYOUT, None
+            ),
+            PackURI("/ppt/media/image1.png"): Part(PackURI("/ppt/media/image1.png"), CT.PNG, None),
+        }
+        xml_rels = CT_Relationships.new()
+        xml_rels.add_rel("rId1", RT.SLIDE_LAYOUT, "../slideLayouts/slideLayout1.xml", False)
+        xml_rels.add_rel("rId2", RT.IMAGE, "../media/image1.png", False)
+        xml_rels.add_rel("rId3", RT.HYPERLINK, "http://url", True)
+        raw_member_ = instance_mock(request, _RawMember)
+
+        def loaded_relationships() -> _Relationships:
+            relationships = _Relationships("/ppt/slides")
+            relationships.load_from_xml("/ppt/slides", xml_rels, parts, raw_member_)
+            return relationships
+
+        assert loaded_relationships().raw_member is raw_member_
+
+        relationships = loaded_relationships()
+        relationships.get_or_add(RT.NOTES_SLIDE, parts[PackURI("/ppt/media/image1.png")])
+        assert relationships.raw_member is None
+
+        relationships = loaded_relationships()
+        relationships.pop("rId2")
+        assert relationships.raw_member is None
+
+        relationships = loaded_relationships()
+        parts[PackURI("/ppt/media/image1.png")].partname = PackURI("/ppt/media/image2.png")
+        assert relationships.raw_member is None
+
+    def but_not_when_a_broken_relationship_was_dropped_on_load(self, request, part_):
+        parts = {"/ppt/slideLayouts/slideLayout1.xml": part_}
+        xml_rels = parse_xml(snippet_bytes("rels-load-from-xml"))
+        relationships = _Relationships("/ppt/slides")
+
+        relationships.load_from_xml(
+            "/ppt/slides", xml_rels, parts, instance_mock(request, _RawMember)
+        )
+
+        assert relationships.raw_member is None
+
+    def it_can_load_lazily_from_the_xml_in_a_rels_part(self, request):
+        parts = {
+            PackURI("/ppt/slideLayouts/slideLayout1.xml"): Part(
+                PackURI("/ppt/slideLayouts/slideLayout1.xml"), CT.PML_SLIDE_LAYOUT, None
+            ),
+        }
+        xml_rels = CT_Relationships.new()
+        xml_rels.add_rel("rId1", RT.SLIDE_LAYOUT, "../slideLayouts/slideLayout1.xml", False)
+        xml_rels.add_rel("rId2", RT.IMAGE, "../media/NULL", False)
+        xml_rels_loader_ = Mock(name="xml_rels_loader_", return_value=xml_rels)
+        relationships = _Relationships("/ppt/slides")
+
+        relationships.load_lazily("/ppt/slides", xml_rels_loader_, parts)
+
+        xml_rels_loader_.assert_not_called()
+        assert list(relationships) == ["rId1"]
+        assert relationships["rId1"].target_part is parts["/ppt/slideLayouts/slideLayout1.xml"]
+        xml_rels_loader_.assert_called_once_with()
+        assert relationships.raw_member is None
+
     def it_can_find_a_part_with_reltype(self, _rels_by_reltype_prop_, relationship_, part_):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
@@ -7,6 +7,7 @@ from __future__ import annotations
 import hashlib
 import io
 import zipfile
+import zlib
 
 import pytest
 
@@ -17,10 +18,14 @@ from pptx.opc.packuri import CONTENT_TYPES_URI, PackURI
 from pptx.opc.serialized import (
     PackageReader,
     PackageWriter,
+    _ChunkSink,
     _ContentTypesItem,
     _DirPkgReader,
+    _LazyZipPkgReader,
     _PhysPkgReader,
     _PhysPkgWriter,
+    _raw_members_supported,
+    _RawMember,
     _ZipPkgReader,
     _ZipPkgWriter,
 )
@@ -60,6 +65,12 @@ class DescribePackageReader:
 
         assert package_reader[PackURI("/ppt/slides/slide1.xml")] == b"blob"
 
+    def it_can_iterate_the_pack_uris_of_its_items(self, _blob_reader_prop_: Mock):
+        _blob_reader_prop_.return_value = ["/[Content_Types].xml", "/ppt/presentation.xml"]
+        package_reader = PackageReader("")
+
+        assert list(package_reader) == ["/[Content_Types].xml", "/ppt/presentation.xml"]
+
     def it_can_get_the_rels_xml_for_a_partname(self, _blob_reader_prop_: Mock):
         _blob_reader_prop_.return_value = {"/ppt/_rels/presentation.xml.rels": b"blob"}
         package_reader = PackageReader("")
@@ -72,6 +83,17 @@ class DescribePackageReader:
 
         assert package_reader.rels_xml_for(PackURI("/ppt/slides.slide1.xml")) is None
 
+    def it_can_get_the_zip_member_a_part_is_stored_in(
+        self, request: FixtureRequest, _blob_reader_prop_: Mock
+    ):
+        _blob_reader_prop_.return_value = phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        package_reader = PackageReader("")
+
+        raw_member = package_reader.raw_member_for(PackURI("/ppt/presentation.xml"))
+
+        phys_pkg_reader_.raw_member.assert_called_once_with("/ppt/presentation.xml")
+        assert raw_member is phys_pkg_reader_.raw_member.return_value
+
     def it_constructs_its_blob_reader_to_help(self, request: FixtureRequest):
         phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
         _PhysPkgReader_ = class_mock(request, "pptx.opc.serialized._PhysPkgReader")
@@ -80,7 +102,7 @@ class DescribePackageReader:
 
         blob_reader = package_reader._blob_reader
 
-        _PhysPkgReader_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgReader_.factory.assert_called_once_with("prs.pptx", False)
         assert blob_reader is phys_pkg_reader_
 
     # fixture components -----------------------------------
@@ -101,9 +123,30 @@ class DescribePackageWriter:
 
         PackageWriter.write("prs.pptx", relationships_, (part_, part_))
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_, part_))
+        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_, part_), None, 1)
         _write_.assert_called_once_with(ANY)
 
+    def it_can_generate_a_package_as_it_writes_it(self):
+        parts = [
+            Part(PackURI("/ppt/media/image%d.png" % n), CT.PNG, None, b"png-%d" % n)  # type: ignore
+            for n in range(1, 4)
+        ]
+
+        chunks = PackageWriter.iter_write(_Relationships("/"), parts)
+
+        head = next(chunks)
+        assert head.startswith(b"PK\x03\x04")
+        with zipfile.ZipFile(io.BytesIO(head + b"".join(chunks))) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == [
+                "[Content_Types].xml",
+                "_rels/.rels",
+                "ppt/media/image1.png",
+                "ppt/media/image2.png",
+                "ppt/media/image3.png",
+            ]
+            assert zipf.read("ppt/media/image2.png") == b"png-2"
+
     def it_can_write_a_package(
         self, request: FixtureRequest, phys_writer_: Mock, relationships_: Mock
     ):
@@ -115,11 +158,11 @@ class DescribePackageWriter:
         )
         _write_pkg_rels_ = method_mock(request, PackageWriter, "_write_pkg_rels")
         _write_parts_ = method_mock(request, PackageWriter, "_write_parts")
-        package_writer = PackageWriter("prs.pptx", relationships_, [])
+        package_writer = PackageWriter("prs.pptx", relationships_, [], 3, 2)
 
         package_writer._write()
 
-        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx", 3, 2)
         _write_content_types_stream_.assert_called_once_with(package_writer, phys_writer_)
         _write_pkg_rels_.assert_called_once_with(package_writer, phys_writer_)
         _write_parts_.assert_called_once_with(package_writer, phys_writer_)
@@ -149,7 +192,9 @@ class DescribePackageWriter:
                 Part,
                 partname=PackURI("/ppt/%s.xml" % x),
                 blob="blob_%s" % x,
-                rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x),
+                content_type="type_%s" % x,
+                rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x, raw_member=None),
+                _raw_member=None,
             )
             for x in ("a", "b", "c")
         ]
@@ -158,14 +203,42 @@ class DescribePackageWriter:
         package_writer._write_parts(phys_writer_)
 
         assert phys_writer_.write.call_args_list == [
-            call("/ppt/a.xml", "blob_a"),
+            call("/ppt/a.xml", "blob_a", "type_a"),
             call("/ppt/_rels/a.xml.rels", "rels_xml_a"),
-            call("/ppt/b.xml", "blob_b"),
+            call("/ppt/b.xml", "blob_b", "type_b"),
             call("/ppt/_rels/b.xml.rels", "rels_xml_b"),
-            call("/ppt/c.xml", "blob_c"),
+            call("/ppt/c.xml", "blob_c", "type_c"),
             call("/ppt/_rels/c.xml.rels", "rels_xml_c"),
         ]
 
+    @pytest.mark.parametrize("rels_unchanged", [True, False])
+    def but_it_copies_the_zip_member_of_a_part_unchanged_since_it_was_loaded(
+        self, request: FixtureRequest, relationships_: Mock, phys_writer_: Mock, rels_unchanged
+    ):
+        raw_member_ = instance_mock(request, _RawMember)
+        raw_rels_member_ = instance_mock(request, _RawMember) if rels_unchanged else None
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/slides/slide1.xml"),
+            rels=instance_mock(
+                request, _Relationships, xml="rels_xml", raw_member=raw_rels_member_
+            ),
+            _raw_member=raw_member_,
+        )
+        package_writer = PackageWriter("", relationships_, [part_])
+
+        package_writer._write_parts(phys_writer_)
+
+        expected_copies = [call("/ppt/slides/slide1.xml", raw_member_)]
+        if rels_unchanged:
+            expected_copies.append(call("/ppt/slides/_rels/slide1.xml.rels", raw_rels_member_))
+        else:
+            phys_writer_.write.assert_called_once_with(
+                "/ppt/slides/_rels/slide1.xml.rels", "rels_xml"
+            )
+        assert phys_writer_.copy.call_args_list == expected_copies
+
     def it_can_write_a_pkg_rels_item(self, phys_writer_: Mock, relationships_: Mock):
         relationships_.xml = b"pkg-rels-xml"
         package_writer = PackageWriter("", relationships_, [])
@@ -203,6 +276,20 @@ class Describe_PhysPkgReader:
         _ZipPkgReader_.assert_called_once_with(file_like_pkg)
         assert phys_reader is zip_pkg_reader_
 
+    def and_it_constructs_LazyZipPkgReader_when_lazy_reading_is_requested(
+        self, request: FixtureRequest
+    ):
+        lazy_zip_pkg_reader_ = instance_mock(request, _LazyZipPkgReader)
+        _LazyZipPkgReader_ = class_mock(
+            request, "pptx.opc.serialized._LazyZipPkgReader", return_value=lazy_zip_pkg_reader_
+        )
+        file_like_pkg = io.BytesIO(b"pkg-bytes")
+
+        phys_reader = _PhysPkgReader.factory(file_like_pkg, lazy=True)
+
+        _LazyZipPkgReader_.assert_called_once_with(file_like_pkg)
+        assert phys_reader is lazy_zip_pkg_reader_
+
     def and_it_constructs_DirPkgReader_when_pkg_is_a_dir(self, request: FixtureRequest):
         dir_pkg_reader_ = instance_mock(request, _DirPkgReader)
         _DirPkgReader_ = class_mock(
@@ -252,6 +339,14 @@ class Describe_DirPkgReader:
         blob = dir_pkg_reader[PackURI("/ppt/presentation.xml")]
         assert hashlib.sha1(blob).hexdigest() == "51b78f4dabc0af2419d4e044ab73028c4bef53aa"
 
+    def it_can_iterate_the_pack_uris_of_its_files(self, dir_pkg_reader: _DirPkgReader):
+        pack_uris = list(dir_pkg_reader)
+
+        assert all(isinstance(pack_uri, PackURI) for pack_uri in pack_uris)
+        assert PackURI("/[Content_Types].xml") in pack_uris
+        assert PackURI("/ppt/presentation.xml") in pack_uris
+        assert PackURI("/ppt/_rels/presentation.xml.rels") in pack_uris
+
     def but_it_raises_KeyError_when_requested_member_is_not_present(
         self, dir_pkg_reader: _DirPkgReader
     ):
@@ -277,6 +372,17 @@ class Describe_ZipPkgReader:
         blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
         assert hashlib.sha1(blob).hexdigest() == ("efa7bee0ac72464903a67a6744c1169035d52a54")
 
+    def it_can_iterate_the_pack_uris_of_its_members(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as z:
+            z.writestr("ppt/presentation.xml", b"<p:presentation/>")
+            z.writestr("ppt/media/image1.png", b"png-bytes")
+
+        pack_uris = list(_ZipPkgReader(stream))
+
+        assert pack_uris == ["/ppt/presentation.xml", "/ppt/media/image1.png"]
+        assert all(isinstance(pack_uri, PackURI) for pack_uri in pack_uris)
+
     def but_it_raises_KeyError_when_requested_member_is_not_present(
         self, zip_pkg_reader: _ZipPkgReader
     ):
@@ -290,6 +396,52 @@ class Describe_ZipPkgReader:
         assert "/ppt/presentation.xml" in blobs
         assert "/ppt/_rels/presentation.xml.rels" in blobs
 
+    def it_keeps_each_member_as_it_is_stored_in_the_archive(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as z:
+            z.writestr("ppt/slides/slide1.xml", b"<p:sld/>" * 50, zipfile.ZIP_DEFLATED)
+            z.writestr("ppt/media/image1.png", b"png-bytes", zipfile.ZIP_STORED)
+        zip_pkg_reader = _ZipPkgReader(stream)
+
+        slide = zip_pkg_reader.raw_member(PackURI("/ppt/slides/slide1.xml"))
+        image = zip_pkg_reader.raw_member(PackURI("/ppt/media/image1.png"))
+
+        assert zip_pkg_reader[PackURI("/ppt/slides/slide1.xml")] == b"<p:sld/>" * 50
+        assert slide is not None
+        assert slide.zinfo.compress_type == zipfile.ZIP_DEFLATED
+        assert zlib.decompress(slide.data, -zlib.MAX_WBITS) == b"<p:sld/>" * 50
+        assert image is not None
+        assert image.data is zip_pkg_reader[PackURI("/ppt/media/image1.png")]
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/foobar.xml")) is None
+
+    def but_not_the_content_types_item_which_is_always_written_afresh(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as z:
+            z.writestr("[Content_Types].xml", b"<Types/>", zipfile.ZIP_DEFLATED)
+        zip_pkg_reader = _ZipPkgReader(stream)
+
+        assert zip_pkg_reader[CONTENT_TYPES_URI] == b"<Types/>"
+        assert zip_pkg_reader.raw_member(CONTENT_TYPES_URI) is None
+
+    def and_no_member_at_all_when_members_cannot_be_copied(self, request: FixtureRequest):
+        function_mock(request, "pptx.opc.serialized._raw_members_supported", return_value=False)
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as z:
+            z.writestr("ppt/slides/slide1.xml", b"<p:sld/>" * 50, zipfile.ZIP_DEFLATED)
+        zip_pkg_reader = _ZipPkgReader(stream)
+
+        assert zip_pkg_reader[PackURI("/ppt/slides/slide1.xml")] == b"<p:sld/>" * 50
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/slides/slide1.xml")) is None
+
+    def but_it_raises_on_a_member_that_is_corrupt(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as z:
+            z.writestr("ppt/media/image1.png", b"png-bytes", zipfile.ZIP_STORED)
+        stream = io.BytesIO(stream.getvalue().replace(b"png-bytes", b"png-bites"))
+
+        with pytest.raises(zipfile.BadZipFile):
+            _ZipPkgReader(stream)[PackURI("/ppt/media/image1.png")]
+
     # --- fixture components -------------------------------
 
     @pytest.fixture(scope="class")
@@ -297,6 +449,79 @@ class Describe_ZipPkgReader:
         return _ZipPkgReader(zip_pkg_path)
 
 
+class Describe_LazyZipPkgReader:
+    """Unit-test suite for `pptx.opc.serialized._LazyZipPkgReader` objects."""
+
+    def it_knows_whether_it_contains_a_partname(self, zip_stream: io.BytesIO):
+        zip_pkg_reader = _LazyZipPkgReader(zip_stream)
+
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        assert PackURI("/ppt/foobar.xml") not in zip_pkg_reader
+
+    def it_can_get_a_blob_by_partname(self, zip_stream: io.BytesIO):
+        zip_pkg_reader = _LazyZipPkgReader(zip_stream)
+        assert zip_pkg_reader[PackURI("/ppt/media/image1.png")] == b"png-bytes"
+
+    def it_can_iterate_the_pack_uris_of_its_members(self, zip_stream: io.BytesIO):
+        pack_uris = list(_LazyZipPkgReader(zip_stream))
+
+        assert pack_uris == ["/ppt/presentation.xml", "/ppt/media/image1.png"]
+        assert all(isinstance(pack_uri, PackURI) for pack_uri in pack_uris)
+
+    def but_it_raises_KeyError_when_requested_member_is_not_present(self, zip_stream: io.BytesIO):
+        zip_pkg_reader = _LazyZipPkgReader(zip_stream)
+        with pytest.raises(KeyError) as e:
+            zip_pkg_reader[PackURI("/ppt/foobar.xml")]
+        assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
+
+    def it_reads_only_the_members_that_are_requested(
+        self, request: FixtureRequest, zip_stream: io.BytesIO
+    ):
+        zip_pkg_reader = _LazyZipPkgReader(zip_stream)
+        read_ = method_mock(request, zipfile.ZipFile, "read", return_value=b"xml-bytes")
+
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+        read_.assert_called_once_with(ANY, "ppt/presentation.xml")
+        assert blob == b"xml-bytes"
+
+    def it_reads_a_member_as_it_is_stored_only_when_its_data_is_needed(
+        self, request: FixtureRequest, zip_stream: io.BytesIO
+    ):
+        zip_pkg_reader = _LazyZipPkgReader(zip_stream)
+        _read_raw_member_ = function_mock(
+            request, "pptx.opc.serialized._read_raw_member", return_value=b"raw-bytes"
+        )
+
+        raw_member = zip_pkg_reader.raw_member(PackURI("/ppt/media/image1.png"))
+
+        assert raw_member is not None
+        assert raw_member.zinfo.filename == "ppt/media/image1.png"
+        _read_raw_member_.assert_not_called()
+        assert raw_member.data == b"raw-bytes"
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/foobar.xml")) is None
+
+    def but_not_when_members_cannot_be_copied(
+        self, request: FixtureRequest, zip_stream: io.BytesIO
+    ):
+        function_mock(request, "pptx.opc.serialized._raw_members_supported", return_value=False)
+        zip_pkg_reader = _LazyZipPkgReader(zip_stream)
+
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/media/image1.png")) is None
+        assert zip_pkg_reader[PackURI("/ppt/media/image1.png")] == b"png-bytes"
+
+    # --- fixture components -------------------------------
+
+    @pytest.fixture
+    def zip_stream(self) -> io.BytesIO:
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as z:
+            z.writestr("ppt/presentation.xml", b"<p:presentation/>")
+            z.writestr("ppt/media/image1.png", b"png-bytes")
+        stream.seek(0)
+        return stream
+
+
 class Describe_PhysPkgWriter:
     """Unit-test suite for `pptx.opc.serialized._PhysPkgWriter` objects."""
 
@@ -308,7 +533,7 @@ class Describe_PhysPkgWriter:
 
         phys_writer = _PhysPkgWriter.factory("prs.pptx")
 
-        _ZipPkgWriter_.assert_called_once_with("prs.pptx")
+        _ZipPkgWriter_.assert_called_once_with("prs.pptx", None, 1)
         assert phys_writer is zip_pkg_writer_
 
 
@@ -342,10 +567,131 @@ class Describe_ZipPkgWriter:
         zipf = pkg_writer._zipf
 
         ZipFile_.assert_called_once_with(
-            "prs.pptx", "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
+            "prs.pptx",
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=None,
+            strict_timestamps=False,
         )
         assert zipf is ZipFile_.return_value
 
+    @pytest.mark.parametrize(
+        ("content_type", "compress_type"),
+        [
+            (CT.PML_SLIDE, zipfile.ZIP_DEFLATED),
+            (CT.XML, zipfile.ZIP_DEFLATED),
+            (CT.BMP, zipfile.ZIP_DEFLATED),
+            (CT.JPEG, zipfile.ZIP_STORED),
+            (CT.PNG, zipfile.ZIP_STORED),
+            (CT.MP4, zipfile.ZIP_STORED),
+            (CT.SML_SHEET, zipfile.ZIP_STORED),
+        ],
+    )
+    @pytest.mark.parametrize("workers", [1, 3])
+    def it_stores_blobs_already_compressed_and_deflates_the_rest(
+        self, content_type: str, compress_type: int, workers: int
+    ):
+        stream = io.BytesIO()
+
+        with _ZipPkgWriter(stream, workers=workers) as pkg_writer:
+            pkg_writer.write(PackURI("/ppt/media/part.bin"), b"blob " * 100, content_type)
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.getinfo("ppt/media/part.bin").compress_type == compress_type
+            assert zipf.read("ppt/media/part.bin") == b"blob " * 100
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def it_deflates_at_the_compression_level_it_was_given(self, workers: int):
+        blob = b"".join(b"<a:t>%d</a:t>" % (n * 7919 % 10007) for n in range(20000))
+
+        def deflated_size(compresslevel: int) -> int:
+            stream = io.BytesIO()
+            with _ZipPkgWriter(stream, compresslevel, workers) as pkg_writer:
+                pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), blob, CT.PML_SLIDE)
+            with zipfile.ZipFile(stream) as zipf:
+                assert zipf.read("ppt/slides/slide1.xml") == blob
+                return zipf.getinfo("ppt/slides/slide1.xml").compress_size
+
+        assert deflated_size(0) > len(blob) > deflated_size(1) > deflated_size(9)
+
+    def it_writes_members_in_order_when_compressing_in_threads(self):
+        stream = io.BytesIO()
+        blobs = [("/ppt/slides/slide%d.xml" % n, b"<p:sld>%d</p:sld>" % n * n) for n in range(40)]
+
+        with _ZipPkgWriter(stream, workers=4) as pkg_writer:
+            for n, (partname, blob) in enumerate(blobs):
+                pkg_writer.write(PackURI(partname), blob, CT.PNG if n % 5 == 0 else CT.PML_SLIDE)
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == [partname[1:] for partname, _ in blobs]
+            assert [zipf.read(partname[1:]) for partname, _ in blobs] == [b for _, b in blobs]
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def it_can_copy_a_member_from_another_archive_as_it_is_stored(self, workers: int):
+        source = io.BytesIO()
+        with zipfile.ZipFile(source, "w") as z:
+            z.writestr("ppt/slides/slide1.xml", b"<p:sld/>" * 50, zipfile.ZIP_DEFLATED)
+            z.writestr("ppt/media/image1.png", b"png-bytes", zipfile.ZIP_STORED)
+        zip_pkg_reader = _ZipPkgReader(source)
+        stream = io.BytesIO()
+
+        with _ZipPkgWriter(stream, workers=workers) as pkg_writer:
+            for partname in ("/ppt/slides/slide1.xml", "/ppt/media/image1.png"):
+                raw_member = zip_pkg_reader.raw_member(PackURI(partname))
+                assert raw_member is not None
+                pkg_writer.copy(PackURI(partname.replace("1", "9")), raw_member)
+            pkg_writer.write(PackURI("/ppt/slides/slide2.xml"), b"<p:sld/>", CT.PML_SLIDE)
+
+        with zipfile.ZipFile(stream) as zipf, zipfile.ZipFile(source) as source_zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == [
+                "ppt/slides/slide9.xml",
+                "ppt/media/image9.png",
+                "ppt/slides/slide2.xml",
+            ]
+            for name, source_name in (
+                ("ppt/slides/slide9.xml", "ppt/slides/slide1.xml"),
+                ("ppt/media/image9.png", "ppt/media/image1.png"),
+            ):
+                zinfo, source_zinfo = zipf.getinfo(name), source_zipf.getinfo(source_name)
+                assert zinfo.compress_type == source_zinfo.compress_type
+                assert zinfo.compress_size == source_zinfo.compress_size
+                assert zipf.read(name) == source_zipf.read(source_name)
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def it_can_write_to_a_stream_that_cannot_seek(self, workers: int):
+        source = io.BytesIO()
+        with zipfile.ZipFile(source, "w") as z:
+            z.writestr("ppt/slides/slide1.xml", b"<p:sld/>" * 50, zipfile.ZIP_DEFLATED)
+        raw_member = _ZipPkgReader(source).raw_member(PackURI("/ppt/slides/slide1.xml"))
+        assert raw_member is not None
+        sink = _ChunkSink()
+
+        with _ZipPkgWriter(sink, workers=workers) as pkg_writer:
+            pkg_writer.write(PackURI("/ppt/media/image1.png"), b"png-bytes", CT.PNG)
+            pkg_writer.copy(PackURI("/ppt/slides/slide1.xml"), raw_member)
+            pkg_writer.write(PackURI("/ppt/slides/slide2.xml"), b"<p:sld/>" * 50, CT.PML_SLIDE)
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(sink.drain()))) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("ppt/media/image1.png") == b"png-bytes"
+            assert zipf.read("ppt/slides/slide1.xml") == b"<p:sld/>" * 50
+            assert zipf.read("ppt/slides/slide2.xml") == b"<p:sld/>" * 50
+
+    def but_it_deflates_members_in_turn_when_they_cannot_be_written_raw(
+        self, request: FixtureRequest
+    ):
+        function_mock(request, "pptx.opc.serialized._raw_members_supported", return_value=False)
+        stream = io.BytesIO()
+
+        with _ZipPkgWriter(stream, workers=3) as pkg_writer:
+            assert pkg_writer._executor is None
+            pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>" * 50, CT.PML_SLIDE)
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.read("ppt/slides/slide1.xml") == b"<p:sld/>" * 50
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -353,6 +699,55 @@ class Describe_ZipPkgWriter:
         return property_mock(request, _ZipPkgWriter, "_zipf")
 
 
+class Describe_raw_members_supported:
+    """Unit-test suite for `pptx.opc.serialized._raw_members_supported()`.
+
+    It relies on `zipfile` internals, so these run on each Python version in the tox envlist.
+    """
+
+    def it_can_copy_a_member_as_it_is_stored_with_the_zipfile_of_this_Python(self):
+        assert _raw_members_supported() is True
+
+    # -- an internal gone raises, one that changed meaning leaves a member unwritten --
+    @pytest.mark.parametrize("side_effect", [AttributeError("_writecheck"), None])
+    def but_not_when_the_zipfile_internals_it_relies_on_have_changed(
+        self, request: FixtureRequest, side_effect: Exception | None
+    ):
+        function_mock(request, "pptx.opc.serialized._write_raw_member", side_effect=side_effect)
+        assert _raw_members_supported() is False
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        _raw_members_supported.cache_clear()
+        yield
+        _raw_members_supported.cache_clear()
+
+
+class Describe_ChunkSink:
+    """Unit-test suite for `pptx.opc.serialized._ChunkSink` objects."""
+
+    def it_holds_what_is_written_to_it_until_it_is_drained(self):
+        sink = _ChunkSink()
+
+        assert sink.write(b"PK\x03\x04") == 4
+        assert sink.write(memoryview(b"data")) == 4
+
+        assert list(sink.drain()) == [b"PK\x03\x04", b"data"]
+        assert list(sink.drain()) == []
+
+    def it_cannot_seek_so_a_zip_file_is_written_to_it_front_to_back(self):
+        sink = _ChunkSink()
+
+        with zipfile.ZipFile(sink, "w") as zipf:  # pyright: ignore[reportArgumentType]
+            zipf.writestr("ppt/slides/slide1.xml", b"<p:sld/>")
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(sink.drain()))) as zipf:
+            # -- sizes are in a data descriptor after the data --
+            assert zipf.getinfo("ppt/slides/slide1.xml").flag_bits & 0x08
+
+
 class Describe_ContentTypesItem:
     """Unit-test suite for `pptx.opc.serialized._ContentTypesItem` objects."""
 
@@ -30,7 +30,7 @@ class DescribeCT_GroupShape(object):
     def it_can_add_a_grpSp_element(self, add_grpSp_fixture):
         spTree, expected_grpSp_xml, expected_xml = add_grpSp_fixture
 
-        grpSp = spTree.add_grpSp()
+        grpSp = spTree.add_grpSp(1, "Group 0")
 
         assert grpSp.xml == expected_grpSp_xml
         assert spTree.xml == expected_xml
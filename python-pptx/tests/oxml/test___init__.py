@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
+from pptx.oxml import oxml_parser, parse_plain_xml, parse_xml, register_element_cls
 from pptx.oxml.ns import qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
@@ -44,6 +44,16 @@ class DescribeParseXml(object):
             parse_xml(xml_text)
 
 
+class DescribeParsePlainXml(object):
+    def it_parses_xml_into_plain_lxml_elements(self, xml_bytes, stripped_xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+
+        foo = parse_plain_xml(xml_bytes)
+
+        assert type(foo) is etree._Element
+        assert etree.tostring(foo) == stripped_xml_bytes
+
+
 class DescribeRegisterCustomElementClass(object):
     def it_determines_cust_elm_class_constructed_for_specified_tag(self, xml_bytes):
         register_element_cls("a:foo", CustElmCls)
@@ -22,9 +22,11 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    compiled_xpath,
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element
 
 
 class DescribeCustomElementClass(object):
@@ -32,6 +34,22 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class DescribeBaseOxmlElement(object):
+    def it_evaluates_xpath_in_the_Open_XML_namespaces(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2},p:sp/p:nvSpPr/p:cNvPr{id=3})")
+        assert spTree.xpath("//p:cNvPr/@id") == ["2", "3"]
+
+    def it_binds_xpath_variables(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2},p:sp/p:nvSpPr/p:cNvPr{id=3})")
+        cNvPrs = spTree.xpath("//p:cNvPr[@id=$id]", id="3")
+        assert [cNvPr.get("id") for cNvPr in cNvPrs] == ["3"]
+
+    def it_compiles_each_xpath_expression_once(self):
+        xpath_str = "./p:nvSpPr/p:cNvPr/@name"
+        assert compiled_xpath(xpath_str) is compiled_xpath(xpath_str)
+        assert compiled_xpath(xpath_str)(element("p:sp/p:nvSpPr/p:cNvPr{name=Foo}")) == ["Foo"]
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import io
+import zipfile
 
 import pytest
+from PIL import Image as PIL_Image
 
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import _RawMember
 from pptx.package import Package
 from pptx.parts.image import Image, ImagePart
 from pptx.util import Emu
 
 from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
+    Mock,
     class_mock,
     initializer_mock,
     instance_mock,
@@ -21,6 +27,8 @@ from ..unitutil.mock import (
 
 images_pptx_path = absjoin(test_file_dir, "with_images.pptx")
 
+test_bmp_path = absjoin(test_file_dir, "python.bmp")
+
 test_image_path = absjoin(test_file_dir, "python-icon.jpeg")
 test_eps_path = absjoin(test_file_dir, "cdw-logo.eps")
 new_image_path = absjoin(test_file_dir, "monty-truth.png")
@@ -58,6 +66,21 @@ class DescribeImagePart(object):
         Image_.assert_called_once_with(b"blob", "foobar.png")
         assert image is image_
 
+    def it_knows_the_size_of_its_image_binary(self):
+        image_part = ImagePart(None, None, None, b"png-bytes", None)
+        assert image_part.blob_size == 9
+
+    def and_it_knows_it_without_reading_the_binary_when_loaded_lazily(self, request):
+        blob_loader_ = Mock(name="blob_loader_", return_value=b"png-bytes")
+        image_part = ImagePart.load_lazily(
+            PackURI("/ppt/media/image1.png"), CT.PNG, None, blob_loader_
+        )
+        image_part._raw_member = _RawMember(zipfile.ZipInfo("ppt/media/image1.png"), b"")
+        image_part._raw_member.zinfo.file_size = 9
+
+        assert image_part.blob_size == 9
+        blob_loader_.assert_not_called()
+
     @pytest.mark.parametrize(
         "width, height, expected_width, expected_height",
         (
@@ -70,17 +93,30 @@ class DescribeImagePart(object):
     def it_can_scale_its_dimensions(self, width, height, expected_width, expected_height):
         with open(test_image_path, "rb") as f:
             blob = f.read()
-        image_part = ImagePart(None, None, None, blob)
+        image_part = ImagePart(PackURI("/ppt/media/image1.jpeg"), None, None, blob)
 
         assert image_part.scale(width, height) == (expected_width, expected_height)
 
     def it_knows_its_pixel_dimensions_to_help(self):
         with open(test_image_path, "rb") as f:
             blob = f.read()
-        image_part = ImagePart(None, None, None, blob)
+        image_part = ImagePart(PackURI("/ppt/media/image1.jpeg"), None, None, blob)
 
         assert image_part._px_size == (204, 204)
 
+    def it_reads_its_image_header_only_once(self, request, image_):
+        Image_ = class_mock(request, "pptx.parts.image.Image")
+        Image_.return_value = image_
+        image_.size = (640, 480)
+        image_.dpi = (96, 96)
+        image_part = ImagePart(None, None, None, b"blob", "foobar.png")
+
+        image_part.scale(None, None)
+        image_part.scale(1000, None)
+
+        assert image_part.image is image_
+        Image_.assert_called_once_with(b"blob", "foobar.png")
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -144,6 +180,44 @@ class DescribeImage(object):
         assert image.dpi == dpi
         assert image._pil_props == (format, size, None)
 
+    @pytest.mark.parametrize(
+        ("format", "save_kwargs", "expected_dpi"),
+        [
+            ("PNG", {}, (72, 72)),
+            ("PNG", {"dpi": (150, 300)}, (150, 300)),
+            ("JPEG", {}, (72, 72)),
+            ("JPEG", {"dpi": (150, 300)}, (150, 300)),
+            ("JPEG", {"dpi": (96, 96), "progressive": True}, (96, 96)),
+        ],
+    )
+    def it_reads_PNG_and_JPEG_properties_from_the_image_header(
+        self, request, format, save_kwargs, expected_dpi
+    ):
+        stream = io.BytesIO()
+        PIL_Image.new("RGB", (37, 23)).save(stream, format, **save_kwargs)
+        image = Image(stream.getvalue(), None)
+        PIL_Image_ = class_mock(request, "pptx.parts.image.PIL_Image")
+
+        assert image._format == format
+        assert image.size == (37, 23)
+        assert image.dpi == expected_dpi
+        PIL_Image_.open.assert_not_called()
+
+    @pytest.mark.parametrize("path", [test_bmp_path, new_image_path])
+    def and_it_leaves_other_images_to_Pillow(self, path):
+        with open(path, "rb") as f:
+            blob = f.read()
+        pil_image = PIL_Image.open(io.BytesIO(blob))
+        if pil_image.format == "PNG":
+            # -- an EXIF segment in a JPEG is one case the header parser leaves to Pillow --
+            stream = io.BytesIO()
+            pil_image.convert("RGB").save(stream, "JPEG", exif=b"Exif\x00\x00MM\x00*")
+            blob = stream.getvalue()
+            pil_image = PIL_Image.open(io.BytesIO(blob))
+        image = Image(blob, None)
+
+        assert image._pil_props == (pil_image.format, pil_image.size, pil_image.info.get("dpi"))
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
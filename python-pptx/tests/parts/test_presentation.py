@@ -120,8 +120,14 @@ class DescribePresentationPart(object):
         ]
 
     def it_can_save_the_package_to_a_file(self, package_):
-        PresentationPart(None, None, package_, None).save("prs.pptx")
-        package_.save.assert_called_once_with("prs.pptx")
+        PresentationPart(None, None, package_, None).save("prs.pptx", 9, 2)
+        package_.save.assert_called_once_with("prs.pptx", 9, 2)
+
+    def it_can_generate_the_package_a_chunk_at_a_time(self, package_):
+        chunks = PresentationPart(None, None, package_, None).iter_bytes(1, 4)
+
+        package_.iter_bytes.assert_called_once_with(1, 4)
+        assert chunks is package_.iter_bytes.return_value
 
     def it_can_add_a_new_slide(self, request, package_, slide_part_, slide_, relate_to_):
         slide_layout_ = instance_mock(request, SlideLayout)
@@ -12,6 +12,7 @@ from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
+from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from pptx.oxml.theme import CT_OfficeStyleSheet
 from pptx.package import Package
@@ -27,6 +28,8 @@ from pptx.parts.slide import (
     SlideLayoutPart,
     SlideMasterPart,
     SlidePart,
+    _PlaceholderIndex,
+    _ShapeAllocator,
 )
 from pptx.slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 
@@ -38,6 +41,7 @@ from ..unitutil.mock import (
     initializer_mock,
     instance_mock,
     method_mock,
+    property_mock,
 )
 
 
@@ -74,6 +78,25 @@ class DescribeBaseSlidePart(object):
         assert image_part is image_part_
         assert rId == "rId6"
 
+    def it_provides_the_shape_allocator_for_its_shapes(self):
+        slide_part = BaseSlidePart(
+            None, None, None, element("p:sld/p:cSld/p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}")
+        )
+
+        shape_allocator = slide_part.shape_allocator
+
+        assert isinstance(shape_allocator, _ShapeAllocator)
+        assert slide_part.shape_allocator is shape_allocator
+        assert shape_allocator.next_id() == 2
+
+    def it_provides_the_placeholder_index_shared_by_its_placeholder_collections(self):
+        slide_part = BaseSlidePart(None, None, None, element("p:sld/p:cSld/p:spTree"))
+
+        placeholder_index = slide_part.placeholder_index
+
+        assert isinstance(placeholder_index, _PlaceholderIndex)
+        assert slide_part.placeholder_index is placeholder_index
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -585,3 +608,121 @@ class DescribeSlideMasterPart(object):
 
         related_part_.assert_called_once_with(slide_master_part, "rId42")
         assert slide_layout is slide_layout_
+
+
+class Describe_ShapeAllocator(object):
+    """Unit-test suite for `pptx.parts.slide._ShapeAllocator` objects."""
+
+    @pytest.mark.parametrize(
+        ("spTree_cxml", "expected_value"),
+        [
+            ("p:spTree/p:nvSpPr", 1),
+            ("p:spTree/p:nvSpPr/p:cNvPr{id=0}", 1),
+            ("p:spTree/p:nvSpPr/p:cNvPr{id=1}", 2),
+            ("p:spTree/p:nvSpPr/p:cNvPr{id=2}", 3),
+            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})", 4),
+            ("p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})", 3),
+            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})", 3),
+            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:cNvPr{id=1},p:cNvPr{id=4})", 5),
+        ],
+    )
+    def it_allocates_an_id_above_any_id_in_use(self, spTree_cxml: str, expected_value: int):
+        shape_allocator = _ShapeAllocator(element(spTree_cxml))
+        assert shape_allocator.next_id() == expected_value
+
+    def it_scans_the_shape_tree_only_once(self, request):
+        max_shape_id_ = property_mock(request, CT_GroupShape, "max_shape_id", return_value=3)
+        spTree = element("p:spTree")
+        shape_allocator = _ShapeAllocator(spTree)
+
+        ids = []
+        for _ in range(3):
+            ids.append(shape_allocator.next_id())
+            spTree.append(element("p:sp/p:nvSpPr/p:cNvPr{id=%d}" % ids[-1]))
+
+        assert ids == [4, 5, 6]
+        assert max_shape_id_.call_count == 1
+
+    def it_tracks_the_ids_it_hands_out_without_looking_at_the_part_again(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2})")
+        shape_allocator = _ShapeAllocator(spTree)
+        ids = []
+        # -- a group, then a shape inside it, each added through the allocator --
+        ids.append(shape_allocator.next_id())
+        grpSp = element("p:grpSp/p:nvGrpSpPr/p:cNvPr{id=%d}" % ids[-1])
+        spTree.append(grpSp)
+        ids.append(shape_allocator.next_id())
+        grpSp.append(element("p:sp/p:nvSpPr/p:cNvPr{id=%d}" % ids[-1]))
+
+        ids.append(shape_allocator.next_id())
+
+        assert ids == [3, 4, 5]
+
+    def but_it_scans_again_when_reset_after_shapes_were_added_without_it(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2},p:sp/p:nvSpPr/p:cNvPr{id=3})")
+        shape_allocator = _ShapeAllocator(spTree)
+        assert shape_allocator.next_id() == 4
+        spTree.remove(spTree[1])
+        spTree.append(element("p:sp/p:nvSpPr/p:cNvPr{id=9,name=Title 1}"))
+
+        shape_allocator.reset()
+
+        assert shape_allocator.next_id() == 10
+        assert shape_allocator.next_name("Title", 1) == "Title 2"
+
+    def it_accounts_for_ids_assigned_without_it(self):
+        shape_allocator = _ShapeAllocator(element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2}"))
+
+        shape_allocator.reserve(6)
+
+        assert shape_allocator.next_id() == 7
+
+    def it_can_be_reset_to_scan_the_shape_tree_again(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2}")
+        shape_allocator = _ShapeAllocator(spTree)
+        assert shape_allocator.next_id() == 3
+        spTree.xpath("//p:cNvPr")[0].set("id", "42")
+
+        shape_allocator.reset()
+
+        assert shape_allocator.next_id() == 43
+
+    def it_allocates_names_not_already_in_use(self):
+        shape_allocator = _ShapeAllocator(
+            element("p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeholder 3})")
+        )
+
+        assert shape_allocator.next_name("Title", 1) == "Title 2"
+        assert shape_allocator.next_name("Table Placeholder", 3) == "Table Placeholder 4"
+        assert shape_allocator.next_name("Table Placeholder", 3) == "Table Placeholder 5"
+        assert shape_allocator.next_name("Content Placeholder", 2) == "Content Placeholder 2"
+
+    def and_it_does_not_hand_out_a_name_it_was_told_a_shape_was_given(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:cNvPr{name=Title 1},p:sp/p:nvSpPr/p:cNvPr)")
+        shape_allocator = _ShapeAllocator(spTree)
+        assert shape_allocator.next_name("Title", 1) == "Title 2"
+        spTree.xpath("//p:cNvPr")[1].set("name", "Title 3")
+
+        shape_allocator.note_name("Title 3")
+
+        assert shape_allocator.next_name("Title", 1) == "Title 4"
+
+
+class Describe_PlaceholderIndex(object):
+    """Unit-test suite for `pptx.parts.slide._PlaceholderIndex` objects."""
+
+    def it_indexes_the_placeholders_on_first_lookup(self):
+        placeholder_index = _PlaceholderIndex()
+        placeholders = [(1, "ph-1"), (2, "ph-2"), (1, "ph-3")]
+
+        assert placeholder_index.lookup(1, None, iter(placeholders)) == "ph-1"
+        assert placeholder_index.lookup(2, None, iter([])) == "ph-2"
+        assert placeholder_index.lookup(42, "default", iter(placeholders)) == "default"
+
+    def it_is_built_again_after_a_reset(self):
+        placeholder_index = _PlaceholderIndex()
+        assert placeholder_index.lookup(1, None, iter([(1, "ph-1")])) == "ph-1"
+
+        placeholder_index.reset()
+
+        assert placeholder_index.lookup(1, None, iter([(1, "ph-2")])) == "ph-2"
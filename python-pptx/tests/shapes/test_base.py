@@ -13,6 +13,7 @@ from pptx.dml.effect import ShadowFormat
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.text import CT_TextBody
+from pptx.parts.slide import BaseSlidePart, _ShapeAllocator
 from pptx.shapes import Subshape
 from pptx.shapes.autoshape import Shape
 from pptx.shapes.base import BaseShape, _PlaceholderFormat
@@ -62,9 +63,10 @@ class DescribeBaseShape(object):
         assert shape.name == name
 
     def it_can_change_its_name(self, name_set_fixture):
-        shape, new_value, expected_xml = name_set_fixture
+        shape, new_value, expected_xml, shape_allocator_ = name_set_fixture
         shape.name = new_value
         assert shape._element.xml == expected_xml
+        shape_allocator_.note_name.assert_called_once_with(new_value)
 
     @pytest.mark.parametrize(
         ("shape_cxml", "expected_x", "expected_y"),
@@ -295,11 +297,13 @@ class DescribeBaseShape(object):
             ),
         ]
     )
-    def name_set_fixture(self, request):
+    def name_set_fixture(self, request, shapes_):
         xSp_cxml, ShapeCls, new_value, expected_xSp_cxml = request.param
-        shape = ShapeCls(element(xSp_cxml), None)
+        shape_allocator_ = instance_mock(request, _ShapeAllocator)
+        shapes_.part = instance_mock(request, BaseSlidePart, shape_allocator=shape_allocator_)
+        shape = ShapeCls(element(xSp_cxml), shapes_)
         expected_xml = xml(expected_xSp_cxml)
-        return shape, new_value, expected_xml
+        return shape, new_value, expected_xml, shape_allocator_
 
     @pytest.fixture
     def part_fixture(self, shapes_):
@@ -133,11 +133,17 @@ class DescribeFreeformBuilder(object):
         assert builder.shape_offset_y == expected_value
 
     def it_adds_a_freeform_sp_to_help(
-        self, _left_prop_: Mock, _top_prop_: Mock, _width_prop_: Mock, _height_prop_: Mock
+        self,
+        request: FixtureRequest,
+        _left_prop_: Mock,
+        _top_prop_: Mock,
+        _width_prop_: Mock,
+        _height_prop_: Mock,
     ):
         origin_x, origin_y = Emu(42), Emu(24)
         spTree = element("p:spTree")
         shapes = SlideShapes(spTree, None)  # type: ignore
+        property_mock(request, SlideShapes, "_next_shape_id", return_value=1)
         _left_prop_.return_value, _top_prop_.return_value = Emu(12), Emu(34)
         _width_prop_.return_value, _height_prop_.return_value = 56, 78
         builder = FreeformBuilder(shapes, None, None, None, None)  # type: ignore
@@ -17,7 +17,7 @@ from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement, ST_Direction
 from pptx.parts.image import ImagePart
-from pptx.parts.slide import SlidePart
+from pptx.parts.slide import BaseSlidePart, SlidePart, _PlaceholderIndex, _ShapeAllocator
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -140,6 +140,7 @@ class Describe_BaseShapes(object):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
         assert shapes._element.xml == expected_xml
+        shapes._placeholder_index.reset.assert_called_once_with()
 
     def it_knows_if_turbo_add_is_enabled(self, turbo_fixture):
         shapes, expected_value = turbo_fixture
@@ -151,9 +152,21 @@ class Describe_BaseShapes(object):
         shapes.turbo_add_enabled = value
         assert shapes.turbo_add_enabled == expected_value
 
-    def it_finds_the_next_shape_id_to_help(self, next_id_fixture):
-        shapes, expected_value = next_id_fixture
-        assert shapes._next_shape_id == expected_value
+    def it_gets_the_next_shape_id_from_its_part_to_help(
+        self, _shape_allocator_prop_, shape_allocator_
+    ):
+        _shape_allocator_prop_.return_value = shape_allocator_
+        shape_allocator_.next_id.return_value = 42
+        shapes = _BaseShapes(None, None)
+
+        assert shapes._next_shape_id == 42
+
+    def it_shares_the_shape_allocator_of_its_part(self, request, shape_allocator_):
+        slide_part_ = instance_mock(request, BaseSlidePart, shape_allocator=shape_allocator_)
+        property_mock(request, _BaseShapes, "part", return_value=slide_part_)
+        shapes = _BaseShapes(None, None)
+
+        assert shapes._shape_allocator is shape_allocator_
 
     def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
@@ -162,8 +175,10 @@ class Describe_BaseShapes(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def clone_ph_fixture(self, placeholder_):
+    def clone_ph_fixture(self, request, placeholder_, _shape_allocator_prop_):
         shapes = SlideShapes(element("p:spTree{a:b=c}"), None)
+        _shape_allocator_prop_.return_value = _ShapeAllocator(shapes._spTree)
+        property_mock(request, _BaseShapes, "_placeholder_index")
         expected_xml = xml(
             "p:spTree{a:b=c}/p:sp/(p:nvSpPr/(p:cNvPr{id=1,name=Vertical Char"
             "t Placeholder 0},p:cNvSpPr/a:spLocks{noGrp=1},p:nvPr/p:ph{type="
@@ -211,26 +226,6 @@ class Describe_BaseShapes(object):
         expected_count = 2
         return shapes, expected_count
 
-    @pytest.fixture(
-        params=[
-            ("p:spTree/p:nvSpPr", 1),
-            ("p:spTree/p:nvSpPr/p:cNvPr{id=0}", 1),
-            ("p:spTree/p:nvSpPr/p:cNvPr{id=1}", 2),
-            ("p:spTree/p:nvSpPr/p:cNvPr{id=2}", 3),
-            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})", 4),
-            ("p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})", 3),
-            ("p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})", 3),
-            (
-                "p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:" "cNvPr{id=1},p:cNvPr{id=4})",
-                5,
-            ),
-        ]
-    )
-    def next_id_fixture(self, request):
-        spTree_cxml, expected_value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        return shapes, expected_value
-
     @pytest.fixture(
         params=[
             (PP_PLACEHOLDER.OBJECT, 3, ST_Direction.HORZ, "Content Placeholder 2"),
@@ -244,18 +239,18 @@ class Describe_BaseShapes(object):
             (PP_PLACEHOLDER.TITLE, 2, ST_Direction.HORZ, "Title 2"),
         ]
     )
-    def ph_name_fixture(self, request):
+    def ph_name_fixture(self, request, _shape_allocator_prop_):
         ph_type, sp_id, orient, expected_name = request.param
         spTree = element("p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeholder " "3})")
         shapes = SlideShapes(spTree, None)
+        _shape_allocator_prop_.return_value = _ShapeAllocator(spTree)
         return shapes, ph_type, sp_id, orient, expected_name
 
-    @pytest.fixture(params=[(None, False), (42, True)])
+    @pytest.fixture(params=[False, True])
     def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
+        expected_value = request.param
         shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
+        shapes._turbo_add_enabled = expected_value
         return shapes, expected_value
 
     @pytest.fixture(
@@ -294,6 +289,14 @@ class Describe_BaseShapes(object):
     def shape_(self, request):
         return instance_mock(request, BaseShape)
 
+    @pytest.fixture
+    def shape_allocator_(self, request):
+        return instance_mock(request, _ShapeAllocator)
+
+    @pytest.fixture
+    def _shape_allocator_prop_(self, request):
+        return property_mock(request, _BaseShapes, "_shape_allocator")
+
 
 class Describe_BaseGroupShapes(object):
     """Unit-test suite for `pptx.shapes.shapetree._BaseGroupShapes`."""
@@ -352,10 +355,39 @@ class Describe_BaseGroupShapes(object):
 
         group_shape = shapes.add_group_shape()
 
-        spTree.add_grpSp.assert_called_once_with(spTree)
+        spTree.add_grpSp.assert_called_once_with(spTree, 42, "Group 41")
         shapes._shape_factory.assert_called_once_with(shapes, grpSp)
         assert group_shape is group_shape_
 
+    @pytest.mark.parametrize(("from_other_part", "expected_call_count"), [(False, 0), (True, 1)])
+    def and_it_resets_what_the_parts_know_of_the_shapes_moved_into_it(
+        self,
+        request,
+        from_other_part,
+        expected_call_count,
+        part_prop_,
+        _next_shape_id_prop_,
+        _shape_allocator_prop_,
+    ):
+        method_mock(request, CT_GroupShape, "recalculate_extents")
+        _next_shape_id_prop_.return_value = 42
+        shape_allocator_ = _shape_allocator_prop_.return_value
+        shapes = _BaseGroupShapes(element("p:spTree"), None)
+        shape = Shape(element("p:sp/p:nvSpPr/p:cNvPr{id=9}"), None)
+        property_mock(
+            request,
+            Shape,
+            "part",
+            return_value=(
+                instance_mock(request, SlidePart) if from_other_part else part_prop_.return_value
+            ),
+        )
+
+        shapes.add_group_shape([shape])
+
+        assert shape_allocator_.reset.call_count == expected_call_count
+        shape.part.placeholder_index.reset.assert_called_once_with()
+
     def it_can_add_an_ole_object(
         self, request, _next_shape_id_prop_, _recalculate_extents_, _shape_factory_
     ):
@@ -491,8 +523,9 @@ class Describe_BaseGroupShapes(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def add_cht_gr_frm_fixture(self):
+    def add_cht_gr_frm_fixture(self, _shape_allocator_prop_):
         shapes = _BaseGroupShapes(element("p:spTree"), None)
+        _shape_allocator_prop_.return_value = _ShapeAllocator(shapes._spTree)
         rId, x, y, cx, cy = "rId42", 1, 2, 3, 4
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -525,9 +558,10 @@ class Describe_BaseGroupShapes(object):
             ),
         ]
     )
-    def add_cxnSp_fixture(self, request):
+    def add_cxnSp_fixture(self, request, _shape_allocator_prop_):
         begin_x, begin_y, end_x, end_y, spPr_cxml = request.param
         shapes = _BaseGroupShapes(element("p:spTree"), None)
+        _shape_allocator_prop_.return_value = _ShapeAllocator(shapes._spTree)
         connector_type = MSO_CONNECTOR.STRAIGHT
         tmpl_cxml = (
             "p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=1,name=Connector 0},p:cNvCxnSp"
@@ -660,10 +694,13 @@ class Describe_BaseGroupShapes(object):
         )
 
     @pytest.fixture
-    def group_fixture(self, CT_GroupShape_add_grpSp_, _shape_factory_, group_shape_):
+    def group_fixture(
+        self, CT_GroupShape_add_grpSp_, _shape_factory_, group_shape_, _next_shape_id_prop_
+    ):
         spTree = element("p:spTree{id=2e838acdc755e83113ed03904d2fe081f}")
         grpSp = element("p:grpSp{id=052874e154b48f9bec4266f80913cae38f}")
         shapes = _BaseGroupShapes(spTree, None)
+        _next_shape_id_prop_.return_value = 42
 
         CT_GroupShape_add_grpSp_.return_value = grpSp
         _shape_factory_.return_value = group_shape_
@@ -705,6 +742,10 @@ class Describe_BaseGroupShapes(object):
     def _next_shape_id_prop_(self, request):
         return property_mock(request, _BaseGroupShapes, "_next_shape_id")
 
+    @pytest.fixture
+    def _shape_allocator_prop_(self, request):
+        return property_mock(request, _BaseShapes, "_shape_allocator")
+
     @pytest.fixture
     def picture_fixture(
         self,
@@ -1243,7 +1284,7 @@ class DescribeSlideShapes(object):
         shapes, movie_file, x, y, cx, cy = movie_fixture[:6]
         poster_frame_image, mime_type, shape_id_ = movie_fixture[6:9]
         _MoviePicElementCreator_, movie_pic = movie_fixture[9:11]
-        _add_video_timing_, _shape_factory_, movie_ = movie_fixture[11:]
+        _add_video_timing_, _shape_factory_, movie_, shape_allocator_ = movie_fixture[11:]
 
         movie = shapes.add_movie(movie_file, x, y, cx, cy, poster_frame_image, mime_type)
 
@@ -1252,6 +1293,7 @@ class DescribeSlideShapes(object):
         )
         assert shapes._spTree[-1] is movie_pic
         _add_video_timing_.assert_called_once_with(shapes, movie_pic)
+        shape_allocator_.reset.assert_called_once_with()
         _shape_factory_.assert_called_once_with(shapes, movie_pic)
         assert movie is movie_
 
@@ -1315,8 +1357,11 @@ class DescribeSlideShapes(object):
         _shape_factory_,
         movie_,
         _next_shape_id_prop_,
+        _shape_allocator_prop_,
+        shape_allocator_,
     ):
         shapes = SlideShapes(element("p:spTree"), None)
+        _shape_allocator_prop_.return_value = shape_allocator_
         movie_file, x, y, cx, cy = "foobar.mp4", 1, 2, 3, 4
         poster_frame_image, mime_type = "foobar.png", "video/mp4"
         movie_pic = element("p:pic")
@@ -1338,11 +1383,13 @@ class DescribeSlideShapes(object):
             _add_video_timing_,
             _shape_factory_,
             movie_,
+            shape_allocator_,
         )
 
     @pytest.fixture
-    def table_fixture(self, table_, _shape_factory_):
+    def table_fixture(self, table_, _shape_factory_, _shape_allocator_prop_):
         shapes = SlideShapes(element("p:spTree"), None)
+        _shape_allocator_prop_.return_value = _ShapeAllocator(shapes._spTree)
         rows, cols, x, y, cx, cy = 1, 2, 10, 11, 12, 13
         _shape_factory_.return_value = table_
         expected_xml = (
@@ -1408,6 +1455,14 @@ class DescribeSlideShapes(object):
     def _next_shape_id_prop_(self, request, shape_id_):
         return property_mock(request, SlideShapes, "_next_shape_id", return_value=shape_id_)
 
+    @pytest.fixture
+    def shape_allocator_(self, request):
+        return instance_mock(request, _ShapeAllocator)
+
+    @pytest.fixture
+    def _shape_allocator_prop_(self, request):
+        return property_mock(request, _BaseShapes, "_shape_allocator")
+
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, Shape)
@@ -1551,24 +1606,80 @@ class DescribeLayoutPlaceholders(object):
         placeholders, default = default_fixture
         assert placeholders.get(42, default) is default
 
+    def it_indexes_its_placeholders_on_first_lookup(
+        self, spTree, _iter_, placeholder_, placeholder_2_, _placeholder_index_prop_
+    ):
+        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
+        placeholders = LayoutPlaceholders(spTree, None)
+
+        assert placeholders.get(1) is placeholder_2_
+        assert placeholders.get(0) is placeholder_
+        assert placeholders.get(1) is placeholder_2_
+        _iter_.assert_called_once_with(placeholders)
+
+    def it_reindexes_when_its_part_index_is_reset(self, _placeholder_index_prop_):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{idx=2})"
+        )
+        placeholder_index = _placeholder_index_prop_.return_value
+        placeholders = LayoutPlaceholders(spTree, None)
+        sp = placeholders.get(1).element
+
+        spTree.remove(sp)
+        spTree.append(sp)
+        placeholder_index.reset()
+        assert placeholders.get(1).element is sp
+
+        sp.ph.idx = 3
+        placeholder_index.reset()
+        assert placeholders.get(1) is None
+        assert placeholders.get(3).element is sp
+
+    def and_by_itself_when_a_placeholder_it_found_has_left_the_tree(self, _placeholder_index_prop_):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}")
+        placeholders = LayoutPlaceholders(spTree, None)
+        sp = placeholders.get(1).element
+
+        element("p:spTree").append(sp)
+
+        assert placeholders.get(1) is None
+
+    def and_it_answers_a_miss_from_its_index_until_it_is_reset(
+        self, request, _placeholder_index_prop_
+    ):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}")
+        placeholders = LayoutPlaceholders(spTree, None)
+        _iter_ = method_mock(
+            request, LayoutPlaceholders, "__iter__", side_effect=lambda self: iter([])
+        )
+
+        assert placeholders.get(42) is None
+        assert placeholders.get(42) is None
+        _placeholder_index_prop_.return_value.reset()
+        assert placeholders.get(42) is None
+
+        assert _iter_.call_count == 2
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
+    def default_fixture(self, spTree, _iter_, _placeholder_index_prop_):
+        placeholders = LayoutPlaceholders(spTree, None)
         default = "barfoo"
         return placeholders, default
 
     @pytest.fixture
     def factory_fixture(self, _LayoutShapeFactory_, placeholder_):
-        placeholders = LayoutPlaceholders(None, None)
+        placeholders = LayoutPlaceholders(element("p:spTree"), None)
         sp = element("p:sp")
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
     @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
+    def get_fixture(
+        self, request, spTree, _iter_, placeholder_, placeholder_2_, _placeholder_index_prop_
+    ):
         idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
+        layout_placeholders = LayoutPlaceholders(spTree, None)
         _placeholder_ = (placeholder_, placeholder_2_)[idx]
         placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
         return layout_placeholders, idx, _placeholder_
@@ -1594,12 +1705,26 @@ class DescribeLayoutPlaceholders(object):
         )
 
     @pytest.fixture
-    def placeholder_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
+    def _placeholder_index_prop_(self, request):
+        return property_mock(
+            request, _BaseShapes, "_placeholder_index", return_value=_PlaceholderIndex()
+        )
 
     @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
+    def placeholder_(self, request, spTree):
+        placeholder_ = instance_mock(request, LayoutPlaceholder)
+        placeholder_.element.getparent.return_value = spTree
+        return placeholder_
+
+    @pytest.fixture
+    def placeholder_2_(self, request, spTree):
+        placeholder_2_ = instance_mock(request, LayoutPlaceholder)
+        placeholder_2_.element.getparent.return_value = spTree
+        return placeholder_2_
+
+    @pytest.fixture
+    def spTree(self):
+        return element("p:spTree")
 
 
 class Describe_MasterShapeFactory(object):
@@ -1709,24 +1834,36 @@ class DescribeMasterPlaceholders(object):
         placeholders, default = default_fixture
         assert placeholders.get(42, default) is default
 
+    def it_indexes_its_placeholders_on_first_lookup(
+        self, spTree, _iter_, placeholder_, placeholder_2_, _placeholder_index_prop_
+    ):
+        placeholders = MasterPlaceholders(spTree, None)
+
+        assert placeholders.get("body") is placeholder_2_
+        assert placeholders.get("title") is placeholder_
+        assert placeholders.get("body") is placeholder_2_
+        _iter_.assert_called_once_with(placeholders)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = MasterPlaceholders(None, None)
+    def default_fixture(self, spTree, _iter_, _placeholder_index_prop_):
+        placeholders = MasterPlaceholders(spTree, None)
         default = "barfoo"
         return placeholders, default
 
     @pytest.fixture
     def factory_fixture(self, _MasterShapeFactory_, placeholder_):
-        placeholders = MasterPlaceholders(None, None)
+        placeholders = MasterPlaceholders(element("p:spTree"), None)
         sp = element("p:sp")
         return placeholders, sp, _MasterShapeFactory_, placeholder_
 
     @pytest.fixture(params=["title", "body"])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
+    def get_fixture(
+        self, request, spTree, _iter_, placeholder_, placeholder_2_, _placeholder_index_prop_
+    ):
         ph_type = request.param
-        placeholders = MasterPlaceholders(None, None)
+        placeholders = MasterPlaceholders(spTree, None)
         _placeholder_ = {"title": placeholder_, "body": placeholder_2_}[ph_type]
         return placeholders, ph_type, _placeholder_
 
@@ -1751,12 +1888,26 @@ class DescribeMasterPlaceholders(object):
         )
 
     @pytest.fixture
-    def placeholder_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type="title")
+    def _placeholder_index_prop_(self, request):
+        return property_mock(
+            request, _BaseShapes, "_placeholder_index", return_value=_PlaceholderIndex()
+        )
+
+    @pytest.fixture
+    def placeholder_(self, request, spTree):
+        placeholder_ = instance_mock(request, MasterPlaceholder, ph_type="title")
+        placeholder_.element.getparent.return_value = spTree
+        return placeholder_
+
+    @pytest.fixture
+    def placeholder_2_(self, request, spTree):
+        placeholder_2_ = instance_mock(request, MasterPlaceholder, ph_type="body")
+        placeholder_2_.element.getparent.return_value = spTree
+        return placeholder_2_
 
     @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type="body")
+    def spTree(self):
+        return element("p:spTree")
 
 
 class Describe_MoviePicElementCreator(object):
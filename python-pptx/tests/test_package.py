@@ -18,7 +18,14 @@ from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
 
-from .unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
+from .unitutil.mock import (
+    PropertyMock,
+    call,
+    class_mock,
+    instance_mock,
+    method_mock,
+    property_mock,
+)
 
 
 class DescribePackage(object):
@@ -53,6 +60,20 @@ class DescribePackage(object):
         partname = package.next_media_partname(ext)
         assert partname == expected_value
 
+    def it_reserves_each_partname_sequence_number_it_hands_out(self, request, iter_parts_):
+        package = Package(None)
+        package.iter_parts.return_value = self.i_image_parts(request, (2, 5))
+
+        partnames = [package.next_image_partname("png") for _ in range(4)]
+
+        assert partnames == [
+            "/ppt/media/image1.png",
+            "/ppt/media/image3.png",
+            "/ppt/media/image4.png",
+            "/ppt/media/image6.png",
+        ]
+        package.iter_parts.assert_called_once_with()
+
     def it_provides_access_to_its_MediaParts_object(self, m_parts_fixture):
         package, _MediaParts_, media_parts_ = m_parts_fixture
         media_parts = package._media_parts
@@ -168,7 +189,7 @@ class Describe_ImageParts(object):
         image_part = image_parts.get_or_add_image_part("image.png")
 
         Image_.from_file.assert_called_once_with("image.png")
-        _find_by_sha1_.assert_called_once_with(image_parts, image_.sha1)
+        _find_by_sha1_.assert_called_once_with(image_parts, image_.sha1, 9)
         assert image_part is image_part_
 
     def it_can_add_an_image_part(
@@ -182,27 +203,75 @@ class Describe_ImageParts(object):
         image_part = image_parts.get_or_add_image_part("image.png")
 
         Image_.from_file.assert_called_once_with("image.png")
-        _find_by_sha1_.assert_called_once_with(image_parts, image_.sha1)
+        _find_by_sha1_.assert_called_once_with(image_parts, image_.sha1, 9)
         ImagePart_.new.assert_called_once_with(package_, image_)
         assert image_part is image_part_
 
     def it_can_find_an_image_part_by_sha1_hash(self, find_fixture):
         image_parts, sha1, expected_value = find_fixture
-        image_part = image_parts._find_by_sha1(sha1)
+        image_part = image_parts._find_by_sha1(sha1, 42)
         assert image_part is expected_value
 
     def but_it_skips_unsupported_image_types(self, request, _iter_):
         sha1 = "f00beed"
         svg_part_ = instance_mock(request, Part, name="svg_part_")
-        png_part_ = instance_mock(request, ImagePart, name="png_part_", sha1=sha1)
+        png_part_ = instance_mock(request, ImagePart, name="png_part_", sha1=sha1, blob_size=42)
         # ---order iteration to encounter svg part before target part---
         _iter_.return_value = iter((svg_part_, png_part_))
         image_parts = _ImageParts(None)
 
-        result = image_parts._find_by_sha1(sha1)
+        result = image_parts._find_by_sha1(sha1, 42)
 
         assert result == png_part_
 
+    def it_indexes_the_image_parts_by_size_on_first_lookup(self, request, _iter_):
+        image_parts_ = [
+            instance_mock(
+                request, ImagePart, name="image_part_%d_" % i, sha1=sha1, blob_size=blob_size
+            )
+            for i, (sha1, blob_size) in enumerate((("f00", 3), ("ba2", 3), ("bad", 7)))
+        ]
+        _iter_.return_value = iter(image_parts_)
+        image_parts = _ImageParts(None)
+
+        assert image_parts._find_by_sha1("ba2", 3) is image_parts_[1]
+        assert image_parts._find_by_sha1("f00", 3) is image_parts_[0]
+        assert image_parts._find_by_sha1("bad", 3) is None
+        _iter_.assert_called_once_with(image_parts)
+
+    def and_it_hashes_only_the_image_parts_of_the_same_size(self, request, _iter_):
+        sha1_props_ = []
+        image_parts_ = []
+        for blob_size in (3, 7):
+            image_part_ = instance_mock(request, ImagePart, blob_size=blob_size)
+            sha1_prop_ = PropertyMock(return_value="f00")
+            type(image_part_).sha1 = sha1_prop_
+            sha1_props_.append(sha1_prop_)
+            image_parts_.append(image_part_)
+        _iter_.return_value = iter(image_parts_)
+        image_parts = _ImageParts(None)
+
+        assert image_parts._find_by_sha1("f00", 7) is image_parts_[1]
+        sha1_props_[0].assert_not_called()
+
+    def and_it_adds_the_image_parts_it_creates_to_the_index(
+        self, package_, Image_, image_, _iter_, ImagePart_, image_part_
+    ):
+        Image_.from_file.return_value = image_
+        image_.sha1 = "f00"
+        image_part_.sha1 = "f00"
+        _iter_.return_value = iter(())
+        ImagePart_.new.return_value = image_part_
+        image_parts = _ImageParts(package_)
+
+        image_part = image_parts.get_or_add_image_part("image.png")
+        image_part_2 = image_parts.get_or_add_image_part("image.png")
+
+        ImagePart_.new.assert_called_once_with(package_, image_)
+        assert image_part is image_part_
+        assert image_part_2 is image_part_
+        _iter_.assert_called_once_with(image_parts)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -211,6 +280,7 @@ class Describe_ImageParts(object):
         image_parts = _ImageParts(None)
         _iter_.return_value = iter((image_part_,))
         sha1 = "foobar"
+        image_part_.blob_size = 42
         if image_part_is_present:
             image_part_.sha1 = "foobar"
             expected_value = image_part_
@@ -250,7 +320,7 @@ class Describe_ImageParts(object):
 
     @pytest.fixture
     def image_(self, request):
-        return instance_mock(request, Image)
+        return instance_mock(request, Image, blob=b"png-bytes")
 
     @pytest.fixture
     def ImagePart_(self, request):
@@ -291,6 +361,22 @@ class Describe_MediaParts(object):
         media_part = media_parts._find_by_sha1(sha1)
         assert media_part is expected_value
 
+    def it_adds_the_media_parts_it_creates_to_its_index(
+        self, package_, media_, _iter_, MediaPart_, media_part_
+    ):
+        media_.sha1 = "2468"
+        _iter_.return_value = iter(())
+        MediaPart_.new.return_value = media_part_
+        media_parts = _MediaParts(package_)
+
+        media_part = media_parts.get_or_add_media_part(media_)
+        media_part_2 = media_parts.get_or_add_media_part(media_)
+
+        MediaPart_.new.assert_called_once_with(package_, media_)
+        assert media_part is media_part_
+        assert media_part_2 is media_part_
+        _iter_.assert_called_once_with(media_parts)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from pptx.opc.package import XmlPart
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
@@ -54,6 +55,34 @@ class DescribePresentation(object):
         assert prs._element.xml == expected_xml
         assert slides is slides_
 
+    def but_it_leaves_slide_partnames_alone_when_read_only(self, part_prop_, Slides_, slides_):
+        prs = Presentation(element("p:presentation/p:sldIdLst/p:sldId{r:id=a}"), None)
+        part_prop_.return_value.package.read_only = True
+
+        slides = prs.slides
+
+        part_prop_.return_value.rename_slide_parts.assert_not_called()
+        assert slides is slides_
+
+    def it_can_iterate_the_elements_of_its_slides(self, request, part_prop_):
+        slide_parts_ = [instance_mock(request, XmlPart, rels={"rId%d" % n: n}) for n in (1, 2)]
+        for n, slide_part_ in enumerate(slide_parts_):
+            slide_part_.scan_element.return_value = "sld-%d" % n
+        related_part_ = part_prop_.return_value.related_part
+        related_part_.side_effect = slide_parts_
+        prs = Presentation(
+            element("p:presentation/p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})"), None
+        )
+
+        items = list(prs.iter_slide_elements())
+
+        assert [c.args for c in related_part_.call_args_list] == [("a",), ("b",)]
+        assert items == [(0, "sld-0", {"rId1": 1}), (1, "sld-1", {"rId2": 2})]
+
+    def and_it_generates_nothing_when_it_has_no_slides(self):
+        prs = Presentation(element("p:presentation"), None)
+        assert list(prs.iter_slide_elements()) == []
+
     def it_provides_access_to_its_slide_layouts(self, layouts_fixture):
         prs, slide_layouts_ = layouts_fixture
         assert prs.slide_layouts is slide_layouts_
@@ -74,7 +103,16 @@ class DescribePresentation(object):
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(file_, None, 1)
+
+    def it_can_generate_its_pptx_file_a_chunk_at_a_time(self, prs_part_):
+        prs_part_.iter_bytes.return_value = iter((b"PK", b"..."))
+        prs = Presentation(None, prs_part_)
+
+        chunks = prs.iter_bytes(workers=2)
+
+        prs_part_.iter_bytes.assert_called_once_with(None, 2)
+        assert list(chunks) == [b"PK", b"..."]
 
     # fixtures -------------------------------------------------------
 
@@ -180,6 +218,7 @@ class DescribePresentation(object):
     def slides_fixture(self, request, part_prop_, Slides_, slides_):
         prs_cxml, rIds, expected_cxml = request.param
         prs = Presentation(element(prs_cxml), None)
+        part_prop_.return_value.package.read_only = False
         rename_slide_parts_ = part_prop_.return_value.rename_slide_parts
         expected_xml = xml(expected_cxml)
         return prs, rename_slide_parts_, rIds, Slides_, slides_, expected_xml
@@ -52,6 +52,11 @@ class DescribeFontFiles(object):
         font_dirs = FontFiles._font_directories()
         assert font_dirs == expected_values
 
+    def it_knows_linux_font_dirs_to_help_find(self, linux_dirs_fixture):
+        expected_dirs = linux_dirs_fixture
+        font_dirs = FontFiles._linux_font_directories()
+        assert font_dirs == expected_dirs
+
     def it_knows_os_x_font_dirs_to_help_find(self, osx_dirs_fixture):
         expected_dirs = osx_dirs_fixture
         font_dirs = FontFiles._os_x_font_directories()
@@ -83,12 +88,19 @@ class DescribeFontFiles(object):
         family_name, is_bold, is_italic, expected_path = request.param
         return family_name, is_bold, is_italic, expected_path
 
-    @pytest.fixture(params=[("darwin", ["a", "b"]), ("win32", ["c", "d"])])
-    def font_dirs_fixture(self, request, _os_x_font_directories_, _windows_font_directories_):
+    @pytest.fixture(params=[("darwin", ["a", "b"]), ("win32", ["c", "d"]), ("linux", ["e", "f"])])
+    def font_dirs_fixture(
+        self,
+        request,
+        _os_x_font_directories_,
+        _windows_font_directories_,
+        _linux_font_directories_,
+    ):
         platform, expected_dirs = request.param
         dirs_meth_mock = {
             "darwin": _os_x_font_directories_,
             "win32": _windows_font_directories_,
+            "linux": _linux_font_directories_,
         }[platform]
         sys_ = var_mock(request, "pptx.text.fonts.sys")
         sys_.platform = platform
@@ -116,6 +128,20 @@ class DescribeFontFiles(object):
         expected_paths = [(("Arial", True, True), font_file_path)]
         return directory, _Font_, expected_calls, expected_paths
 
+    @pytest.fixture
+    def linux_dirs_fixture(self, request):
+        import os
+
+        os_ = var_mock(request, "pptx.text.fonts.os")
+        os_.path = os.path
+        os_.environ = {"HOME": "/home/fbar"}
+        return [
+            "/usr/share/fonts",
+            "/usr/local/share/fonts",
+            "/home/fbar/.local/share/fonts",
+            "/home/fbar/.fonts",
+        ]
+
     @pytest.fixture
     def osx_dirs_fixture(self, request):
         import os
@@ -163,6 +189,10 @@ class DescribeFontFiles(object):
     def _iter_font_files_in_(self, request):
         return method_mock(request, FontFiles, "_iter_font_files_in", autospec=False)
 
+    @pytest.fixture
+    def _linux_font_directories_(self, request):
+        return method_mock(request, FontFiles, "_linux_font_directories", autospec=False)
+
     @pytest.fixture
     def _os_x_font_directories_(self, request):
         return method_mock(request, FontFiles, "_os_x_font_directories", autospec=False)
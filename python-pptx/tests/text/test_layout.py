@@ -6,8 +6,16 @@ from __future__ import annotations
 
 import pytest
 
-from pptx.text.layout import TextFitter, _BinarySearchTree, _Line, _LineSource
+from pptx.text.layout import (
+    TextFitter,
+    _BinarySearchTree,
+    _LineSource,
+    _rendered_size,
+    _TextMeasurer,
+)
+from pptx.util import Inches
 
+from ..unitutil.file import testfile
 from ..unitutil.mock import (
     ANY,
     call,
@@ -62,64 +70,54 @@ class DescribeTextFitter(object):
         self,
         request,
         line_source_,
-        _rendered_size_,
+        measurer_,
+        _TextMeasurer_measurer_,
         extents,
         point_size,
         text_lines,
         expected_value,
     ):
         _wrap_lines_ = method_mock(request, TextFitter, "_wrap_lines", return_value=text_lines)
-        _rendered_size_.return_value = (None, 50)
+        measurer_.line_height = 50
         text_fitter = TextFitter(line_source_, extents, "foobar.ttf")
 
         predicate = text_fitter._fits_inside_predicate
         result = predicate(point_size)
 
         _wrap_lines_.assert_called_once_with(text_fitter, line_source_, point_size)
-        _rendered_size_.assert_called_once_with("Ty", point_size, text_fitter._font_file)
+        _TextMeasurer_measurer_.assert_called_once_with("foobar.ttf", point_size)
         assert result is expected_value
 
-    def it_provides_a_fits_in_width_predicate_fn(self, fits_cx_pred_fixture):
-        text_fitter, point_size, line = fits_cx_pred_fixture[:3]
-        _rendered_size_, expected_value = fits_cx_pred_fixture[3:]
+    def but_its_fits_inside_predicate_fails_when_the_text_cannot_be_wrapped(
+        self, request, line_source_, _TextMeasurer_measurer_
+    ):
+        method_mock(request, TextFitter, "_wrap_lines", return_value=None)
+        text_fitter = TextFitter(line_source_, (66, 100), "foobar.ttf")
 
-        predicate = text_fitter._fits_in_width_predicate(point_size)
-        result = predicate(line)
+        predicate = text_fitter._fits_inside_predicate
 
-        _rendered_size_.assert_called_once_with(line.text, point_size, text_fitter._font_file)
-        assert result is expected_value
+        assert predicate(6) is False
+        _TextMeasurer_measurer_.assert_not_called()
 
-    def it_wraps_lines_to_help_best_fit(self, request):
-        line_source, remainder = _LineSource("foo bar"), _LineSource("bar")
-        _break_line_ = method_mock(
-            request,
-            TextFitter,
-            "_break_line",
-            side_effect=[("foo", remainder), ("bar", _LineSource(""))],
-        )
-        text_fitter = TextFitter(None, (None, None), None)
+    def it_wraps_lines_to_help_best_fit(self, measurer_, _TextMeasurer_measurer_):
+        measurer_.break_index.side_effect = [2, 3, 4]
+        text_fitter = TextFitter(None, (42, None), "foobar.ttf")
 
-        text_fitter._wrap_lines(line_source, 21)
+        lines = text_fitter._wrap_lines(_LineSource("foo bar baz  qux"), 21)
 
-        assert _break_line_.call_args_list == [
-            call(text_fitter, line_source, 21),
-            call(text_fitter, remainder, 21),
+        _TextMeasurer_measurer_.assert_called_once_with("foobar.ttf", 21)
+        assert measurer_.break_index.call_args_list == [
+            call(["foo", "bar", "baz", "qux"], 0, 42),
+            call(["foo", "bar", "baz", "qux"], 2, 42),
+            call(["foo", "bar", "baz", "qux"], 3, 42),
         ]
+        assert lines == ["foo bar", "baz", "qux"]
 
-    def it_breaks_off_a_line_to_help_wrap(self, request, line_source_, _BinarySearchTree_):
-        bst_ = instance_mock(request, _BinarySearchTree)
-        _fits_in_width_predicate_ = method_mock(request, TextFitter, "_fits_in_width_predicate")
-        _BinarySearchTree_.from_ordered_sequence.return_value = bst_
-        predicate_ = _fits_in_width_predicate_.return_value
-        max_value_ = bst_.find_max.return_value
-        text_fitter = TextFitter(None, (None, None), None)
-
-        value = text_fitter._break_line(line_source_, 21)
+    def but_it_cannot_wrap_lines_when_a_word_is_too_wide(self, measurer_, _TextMeasurer_measurer_):
+        measurer_.break_index.side_effect = [1, 1]
+        text_fitter = TextFitter(None, (42, None), "foobar.ttf")
 
-        _BinarySearchTree_.from_ordered_sequence.assert_called_once_with(line_source_)
-        text_fitter._fits_in_width_predicate.assert_called_once_with(text_fitter, 21)
-        bst_.find_max.assert_called_once_with(predicate_)
-        assert value is max_value_
+        assert text_fitter._wrap_lines(_LineSource("foo barbazfoo"), 21) is None
 
     # fixtures ---------------------------------------------
 
@@ -139,14 +137,6 @@ class DescribeTextFitter(object):
             font_size_,
         )
 
-    @pytest.fixture(params=[(49, True), (50, True), (51, False)])
-    def fits_cx_pred_fixture(self, request, _rendered_size_):
-        rendered_width, expected_value = request.param
-        text_fitter = TextFitter(None, (50, None), "foobar.ttf")
-        point_size, line = 12, _Line("foobar", None)
-        _rendered_size_.return_value = (rendered_width, None)
-        return (text_fitter, point_size, line, _rendered_size_, expected_value)
-
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -162,8 +152,14 @@ class DescribeTextFitter(object):
         return instance_mock(request, _LineSource)
 
     @pytest.fixture
-    def _rendered_size_(self, request):
-        return function_mock(request, "pptx.text.layout._rendered_size")
+    def measurer_(self, request):
+        return instance_mock(request, _TextMeasurer)
+
+    @pytest.fixture
+    def _TextMeasurer_measurer_(self, request, measurer_):
+        return method_mock(
+            request, _TextMeasurer, "measurer", autospec=False, return_value=measurer_
+        )
 
 
 class Describe_BinarySearchTree(object):
@@ -209,6 +205,147 @@ class Describe_BinarySearchTree(object):
         return bst, predicate, expected_value
 
 
+class Describe_TextMeasurer(object):
+    """Unit-test suite for `pptx.text.layout._TextMeasurer` object."""
+
+    def it_is_memoized_per_font_file_and_point_size(self, request):
+        property_mock(request, _TextMeasurer, "measurers", return_value={})
+
+        measurer = _TextMeasurer.measurer("foobar.ttf", 12)
+
+        assert _TextMeasurer.measurer("foobar.ttf", 12) is measurer
+        assert _TextMeasurer.measurer("foobar.ttf", 14) is not measurer
+        assert _TextMeasurer.measurer("barfoo.ttf", 12) is not measurer
+
+    @pytest.mark.parametrize(
+        ("start", "width", "rendered_widths", "expected_value"),
+        [
+            # ---estimate (10 + 1 + 20 = 31) is right, confirmed by one measurement each way---
+            (0, 31, {"foo bar": 31, "foo bar baz": 63}, 2),
+            # ---estimate too long, rendered line is a bit wider than its words---
+            (0, 31, {"foo bar": 32, "foo": 10}, 1),
+            # ---estimate too short, rendered line is a bit narrower than its words---
+            (0, 62, {"foo bar": 30, "foo bar baz": 62}, 3),
+            # ---starts mid-sequence---
+            (1, 52, {"bar baz": 52}, 3),
+            # ---first word does not fit at all---
+            (0, 9, {"foo": 10}, 0),
+            (0, 10, {"foo": 11}, 0),
+        ],
+    )
+    def it_finds_where_to_break_a_line(
+        self, request, start, width, rendered_widths, expected_value
+    ):
+        word_widths = {"foo": 10, "bar": 20, "baz": 30}
+        method_mock(
+            request, _TextMeasurer, "_word_width", side_effect=lambda self, w: word_widths[w]
+        )
+        property_mock(request, _TextMeasurer, "_space_width", return_value=1)
+        _rendered_size_ = function_mock(
+            request,
+            "pptx.text.layout._rendered_size",
+            side_effect=lambda text, size, font: (rendered_widths[text], None),
+        )
+        measurer = _TextMeasurer("foobar.ttf", 12)
+
+        end = measurer.break_index(["foo", "bar", "baz"], start, width)
+
+        assert end == expected_value
+        assert all(c.args[1:] == (12, "foobar.ttf") for c in _rendered_size_.call_args_list)
+
+    def it_caches_the_width_of_each_word(self, request):
+        _advance_width_ = method_mock(request, _TextMeasurer, "_advance_width", return_value=7)
+        measurer = _TextMeasurer("foobar.ttf", 12)
+
+        widths = [measurer._word_width(w) for w in ("foo", "bar", "foo", "foo")]
+
+        assert widths == [7, 7, 7, 7]
+        assert _advance_width_.call_args_list == [call(measurer, "foo"), call(measurer, "bar")]
+
+
+class DescribeTextFitterWithFontFile(object):
+    """Integration-test suite for `TextFitter` measuring text with a real font file."""
+
+    def it_fits_the_same_size_as_measuring_every_candidate_line(self, text, extents):
+        font_size = TextFitter.best_fit_font_size(text, extents, 72, self.font_file)
+
+        assert self._fits(text, extents, font_size)
+        assert font_size == 72 or not self._fits(text, extents, font_size + 1)
+
+    def it_measures_at_most_a_line_and_a_word_at_a_time(self, request, text, extents):
+        """Micro-benchmark: fitting renders no more than three line-sized strings per line.
+
+        Searching for each line break among every prefix of the remaining text renders
+        strings as long as the whole text, one per probe.
+        """
+        measured, wrapped_lines = [], []
+        wrap_lines = TextFitter._wrap_lines
+
+        def rendered_size(text, point_size, font_file):
+            measured.append((text, point_size))
+            return _rendered_size(text, point_size, font_file)
+
+        def wrap_and_count_lines(text_fitter, line_source, point_size):
+            lines = wrap_lines(text_fitter, line_source, point_size)
+            wrapped_lines.extend(lines or [None])
+            return lines
+
+        _TextMeasurer.measurers.clear()
+        function_mock(request, "pptx.text.layout._rendered_size", side_effect=rendered_size)
+        method_mock(request, TextFitter, "_wrap_lines", side_effect=wrap_and_count_lines)
+
+        TextFitter.best_fit_font_size(text, extents, 72, self.font_file)
+
+        line_measurements = [(t, size) for t, size in measured if t != "Ty"]
+        assert len(line_measurements) <= 3 * len(wrapped_lines)
+        for t, size in line_measurements:
+            shorter = t.rsplit(" ", 1)[0]
+            assert " " not in t or self._width(shorter, size) <= extents[0]
+
+    # fixtures ---------------------------------------------
+
+    font_file = testfile("calibriz.ttf")
+
+    @pytest.fixture(
+        params=[
+            (60, 4.0, 2.0),
+            (150, 9.0, 5.0),
+            (300, 6.0, 6.0),
+        ]
+    )
+    def text_and_extents(self, request):
+        word_count, cx, cy = request.param
+        words = ["lorem", "ipsum", "dolor", "Supercalifragilistic", "WWWW", "iiii", "et", "labore"]
+        text = " ".join(words[(i * 7) % len(words)] for i in range(word_count))
+        return text, (Inches(cx), Inches(cy))
+
+    @pytest.fixture
+    def text(self, text_and_extents):
+        return text_and_extents[0]
+
+    @pytest.fixture
+    def extents(self, text_and_extents):
+        return text_and_extents[1]
+
+    # helpers ----------------------------------------------
+
+    def _fits(self, text, extents, size):
+        """Reference check, measuring candidate lines one word longer at a time."""
+        width, height = extents
+        words, line_count = text.split(), 0
+        while words:
+            n = 0
+            while n < len(words) and self._width(" ".join(words[: n + 1]), size) <= width:
+                n += 1
+            if n == 0:
+                return False
+            words, line_count = words[n:], line_count + 1
+        return _rendered_size("Ty", size, self.font_file)[1] * line_count <= height
+
+    def _width(self, text, size):
+        return _rendered_size(text, size, self.font_file)[0]
+
+
 class Describe_LineSource(object):
     """Unit-test suite for `pptx.text.layout._LineSource` object."""
 